@@ -0,0 +1,349 @@
+"""Endpoint benchmarks for cookidoo-api.
+
+Every public method of the ``Cookidoo`` client is called against a local fake
+Cookidoo server, serving the recorded payloads of ``tests/responses.py``
+scaled by the given factors. For each method, factor and concurrency level
+the requests per second, the p50/p99 latencies and the peak of the memory
+allocated while the calls are in flight are reported as JSON.
+
+Run with ``python -m benchmarks.endpoints --output results.json``.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import date, timedelta
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from aiohttp import ClientSession, CookieJar, TCPConnector
+
+from benchmarks.server import FakeCookidooServer
+from cookidoo_api import __version__
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.types import (
+    CookidooCalendarPlanDay,
+    CookidooConfig,
+    CookidooShoppingListPlan,
+)
+
+DEFAULT_CONCURRENCY = (1, 8, 32)
+DEFAULT_FACTORS = (1, 10)
+DEFAULT_CALLS = 200
+
+_DAY = date(2025, 3, 4)
+
+Workload = Callable[[], Awaitable[object]]
+
+
+async def _collect(items: AsyncIterator[object]) -> list[object]:
+    """Collect the items of an async iterator."""
+    return [item async for item in items]
+
+
+async def workloads(cookidoo: Cookidoo) -> dict[str, Workload]:
+    """Build a call of every public method of the client.
+
+    Parameters
+    ----------
+    cookidoo
+        The client connected to the fake server
+
+    Returns
+    -------
+    dict[str, Workload]
+        The calls by method name
+
+    """
+    ingredient_items = await cookidoo.get_ingredient_items()
+    additional_items = await cookidoo.get_additional_items()
+    return {
+        "get_user_info": cookidoo.get_user_info,
+        "get_active_subscription": cookidoo.get_active_subscription,
+        "get_recipe_details": lambda: cookidoo.get_recipe_details("r907015"),
+        "get_recipe_details_many": lambda: cookidoo.get_recipe_details_many(
+            ["r907015", "r59322"]
+        ),
+        "search_recipes": lambda: cookidoo.search_recipes("Brötchen"),
+        "search_recipes_iter": lambda: _collect(
+            cookidoo.search_recipes_iter("Brötchen")
+        ),
+        "get_custom_recipe": lambda: cookidoo.get_custom_recipe(
+            "01K2CTJ9Y1BABRG5MXK44CFZS4"
+        ),
+        "list_custom_recipes": cookidoo.list_custom_recipes,
+        "add_custom_recipe_from": lambda: cookidoo.add_custom_recipe_from("r907015", 4),
+        "remove_custom_recipe": lambda: cookidoo.remove_custom_recipe(
+            "01K2CTJ9Y1BABRG5MXK44CFZS4"
+        ),
+        "get_shopping_list": cookidoo.get_shopping_list,
+        "get_shopping_list_recipes": cookidoo.get_shopping_list_recipes,
+        "get_ingredient_items": cookidoo.get_ingredient_items,
+        "add_ingredient_items_for_recipes": (
+            lambda: cookidoo.add_ingredient_items_for_recipes(["r907015", "r59322"])
+        ),
+        "remove_ingredient_items_for_recipes": (
+            lambda: cookidoo.remove_ingredient_items_for_recipes(["r907015", "r59322"])
+        ),
+        "edit_ingredient_items_ownership": (
+            lambda: cookidoo.edit_ingredient_items_ownership(ingredient_items)
+        ),
+        "add_ingredient_items_for_custom_recipes": (
+            lambda: cookidoo.add_ingredient_items_for_custom_recipes(
+                ["01K2CTJ9Y1BABRG5MXK44CFZS4"]
+            )
+        ),
+        "remove_ingredient_items_for_custom_recipes": (
+            lambda: cookidoo.remove_ingredient_items_for_custom_recipes(
+                ["01K2CTJ9Y1BABRG5MXK44CFZS4"]
+            )
+        ),
+        "get_additional_items": cookidoo.get_additional_items,
+        "add_additional_items": lambda: cookidoo.add_additional_items(
+            ["Fleisch", "Fisch"]
+        ),
+        "edit_additional_items": lambda: cookidoo.edit_additional_items(
+            additional_items
+        ),
+        "edit_additional_items_ownership": (
+            lambda: cookidoo.edit_additional_items_ownership(additional_items)
+        ),
+        "remove_additional_items": lambda: cookidoo.remove_additional_items(
+            [item.id for item in additional_items]
+        ),
+        "clear_shopping_list": cookidoo.clear_shopping_list,
+        "sync_shopping_list": lambda: cookidoo.sync_shopping_list(
+            CookidooShoppingListPlan(
+                recipe_ids=["r907015", "r59322"],
+                additional_items={"Fleisch": True, "Fisch": False},
+            )
+        ),
+        "count_managed_collections": cookidoo.count_managed_collections,
+        "get_managed_collections": cookidoo.get_managed_collections,
+        "iter_managed_collections": lambda: _collect(
+            cookidoo.iter_managed_collections()
+        ),
+        "add_managed_collection": lambda: cookidoo.add_managed_collection("col500561"),
+        "remove_managed_collection": lambda: cookidoo.remove_managed_collection(
+            "col500561"
+        ),
+        "count_custom_collections": cookidoo.count_custom_collections,
+        "get_custom_collections": cookidoo.get_custom_collections,
+        "iter_custom_collections": lambda: _collect(cookidoo.iter_custom_collections()),
+        "add_custom_collection": lambda: cookidoo.add_custom_collection("Testliste"),
+        "remove_custom_collection": lambda: cookidoo.remove_custom_collection(
+            "01JC1SRPRSW0SHE0AK8GCASABX"
+        ),
+        "add_recipes_to_custom_collection": (
+            lambda: cookidoo.add_recipes_to_custom_collection(
+                "01JC1SRPRSW0SHE0AK8GCASABX", ["r907015"]
+            )
+        ),
+        "remove_recipe_from_custom_collection": (
+            lambda: cookidoo.remove_recipe_from_custom_collection(
+                "01JC1SRPRSW0SHE0AK8GCASABX", "r907015"
+            )
+        ),
+        "get_recipes_in_calendar_week": (
+            lambda: cookidoo.get_recipes_in_calendar_week(_DAY)
+        ),
+        "get_calendar_range": lambda: cookidoo.get_calendar_range(
+            _DAY, _DAY + timedelta(weeks=4)
+        ),
+        "apply_calendar_plan": lambda: cookidoo.apply_calendar_plan(
+            {
+                _DAY + timedelta(days=day): CookidooCalendarPlanDay(
+                    recipe_ids=["r907015"]
+                )
+                for day in range(7)
+            }
+        ),
+        "add_recipes_to_calendar": lambda: cookidoo.add_recipes_to_calendar(
+            _DAY, ["r907015"]
+        ),
+        "remove_recipe_from_calendar": lambda: cookidoo.remove_recipe_from_calendar(
+            _DAY, "r907015"
+        ),
+        "add_custom_recipes_to_calendar": (
+            lambda: cookidoo.add_custom_recipes_to_calendar(
+                _DAY, ["01K2CTJ9Y1BABRG5MXK44CFZS4"]
+            )
+        ),
+        "remove_custom_recipe_from_calendar": (
+            lambda: cookidoo.remove_custom_recipe_from_calendar(
+                _DAY, "01K2CTJ9Y1BABRG5MXK44CFZS4"
+            )
+        ),
+    }
+
+
+def _percentile(latencies: list[float], q: float) -> float:
+    """Get a percentile of sorted latencies by the nearest rank."""
+    return latencies[max(0, min(len(latencies) - 1, round(q * len(latencies)) - 1))]
+
+
+async def _run(workload: Workload, calls: int, concurrency: int) -> list[float]:
+    """Run the calls with at most ``concurrency`` in flight, return latencies."""
+    remaining = iter(range(calls))
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            await workload()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def measure(
+    workload: Workload, calls: int, concurrency: int
+) -> dict[str, float | int]:
+    """Measure a workload at a concurrency level.
+
+    The calls are run twice: timed without tracing, then traced for the peak
+    of the memory allocated while they are in flight, including the
+    allocations of the fake server.
+
+    Parameters
+    ----------
+    workload
+        The call to measure
+    calls
+        The number of calls
+    concurrency
+        The maximum number of calls in flight
+
+    Returns
+    -------
+    dict[str, float | int]
+        The requests per second, the p50/p99 latencies [in ms] and the peak
+        memory [in bytes]
+
+    """
+    start = time.perf_counter()
+    latencies = sorted(await _run(workload, calls, concurrency))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        await _run(workload, calls, concurrency)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "calls": calls,
+        "rps": calls / elapsed,
+        "p50_ms": _percentile(latencies, 0.5) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "peak_memory_bytes": peak,
+    }
+
+
+async def benchmark(
+    factors: tuple[int, ...],
+    concurrency: tuple[int, ...],
+    calls: int,
+    methods: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Benchmark the public methods of the client against the fake server.
+
+    Parameters
+    ----------
+    factors
+        The factors the recorded payloads are scaled by
+    concurrency
+        The concurrency levels
+    calls
+        The number of calls per method, factor and concurrency level
+    methods
+        The names of the methods to benchmark, ``None`` benchmarks all
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One result per method, factor and concurrency level
+
+    """
+    results: list[dict[str, Any]] = []
+    for factor in factors:
+        with FakeCookidooServer(factor) as server:
+            async with ClientSession(
+                cookie_jar=CookieJar(unsafe=True),
+                connector=TCPConnector(limit=max(concurrency)),
+            ) as session:
+                # Every call sends its own request and converts its response
+                cookidoo = Cookidoo(
+                    session,
+                    CookidooConfig(localization=server.localization),
+                    retry_policy=None,
+                    coalesce_requests=False,
+                    conditional_requests=False,
+                )
+                for method, workload in (await workloads(cookidoo)).items():
+                    if methods is not None and method not in methods:
+                        continue
+                    for level in concurrency:
+                        result = await measure(workload, calls, level)
+                        results.append(
+                            {
+                                "method": method,
+                                "factor": factor,
+                                "concurrency": level,
+                                **result,
+                            }
+                        )
+                        print(
+                            f"{method:<45} x{factor:<4} c{level:<4} "
+                            f"{result['rps']:>9.1f} rps "
+                            f"p50 {result['p50_ms']:>7.2f} ms "
+                            f"p99 {result['p99_ms']:>7.2f} ms "
+                            f"{result['peak_memory_bytes'] / 1024:>9.1f} KiB",
+                            file=sys.stderr,
+                        )
+    return results
+
+
+def main() -> None:
+    """Run the endpoint benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY
+    )
+    parser.add_argument("--factor", type=int, nargs="+", default=DEFAULT_FACTORS)
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--method", nargs="+", help="only benchmark these methods")
+    parser.add_argument("--output", help="write the JSON results to a file")
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        benchmark(
+            tuple(args.factor),
+            tuple(args.concurrency),
+            args.calls,
+            set(args.method) if args.method else None,
+        )
+    )
+    report = json.dumps(
+        {
+            "version": __version__,
+            "python": platform.python_version(),
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Parser microbenchmarks for cookidoo-api.
+
+The converters of ``helpers.py`` are run on synthetic payloads generated in
+``payloads.py``, e.g. shopping lists with 10k ingredient items, collections
+with 500 chapters and 1k custom recipes. For each converter the time per
+item, the memory blocks allocated per item and the peak of the memory
+allocated per item are reported as JSON.
+
+CPython does not count the allocations of temporary objects, the allocated
+blocks are those still held after the conversion, i.e. the converted objects.
+
+Run with ``python -m benchmarks.parsers --output results.json``.
+"""
+
+import argparse
+from collections.abc import Callable
+from dataclasses import dataclass
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from benchmarks import payloads
+from cookidoo_api import __version__
+from cookidoo_api.helpers import (
+    cookidoo_calendar_day_from_json,
+    cookidoo_collection_from_json,
+    cookidoo_custom_recipe_from_json,
+    cookidoo_recipe_details_from_json,
+    cookidoo_search_result_from_json,
+    cookidoo_shopping_list_additional_items_from_json,
+    cookidoo_shopping_list_from_json,
+    cookidoo_shopping_list_ingredient_items_from_json,
+    cookidoo_shopping_list_recipes_from_json,
+)
+from cookidoo_api.types import CookidooLocalizationConfig
+
+DEFAULT_ROUNDS = 5
+# Minimum duration of a timed round [in seconds]
+DEFAULT_ROUND_TIME = 0.2
+
+_LOCALIZATION = CookidooLocalizationConfig()
+
+
+@dataclass(frozen=True)
+class Case:
+    """A converter and the payload it is benchmarked with."""
+
+    name: str
+    items: int
+    convert: Callable[[], object]
+
+
+def cases(scale: float = 1.0) -> list[Case]:
+    """Build the benchmark cases.
+
+    Parameters
+    ----------
+    scale
+        The factor the default payload sizes are scaled by
+
+    Returns
+    -------
+    list[Case]
+        The cases, the payloads are generated up front
+
+    """
+
+    def size(count: int) -> int:
+        return max(1, round(count * scale))
+
+    shopping_list = payloads.shopping_list(size(100), 100, size(10_000))
+    ingredients = sum(
+        len(recipe["recipeIngredientGroups"])
+        for recipe in [*shopping_list["recipes"], *shopping_list["customerRecipes"]]
+    )
+    recipe_details = payloads.recipe_details(size(10_000))
+    collection = payloads.managed_collection(size(500), 20)
+    custom_recipes = payloads.custom_recipes(size(1_000))
+    calendar_day = payloads.calendar_day(size(1_000))
+    search_result = payloads.search_result(size(1_000))
+    return [
+        Case(
+            "cookidoo_shopping_list_ingredient_items_from_json",
+            ingredients,
+            lambda: cookidoo_shopping_list_ingredient_items_from_json(shopping_list),
+        ),
+        Case(
+            "cookidoo_shopping_list_recipes_from_json",
+            ingredients,
+            lambda: cookidoo_shopping_list_recipes_from_json(
+                shopping_list, _LOCALIZATION
+            ),
+        ),
+        Case(
+            "cookidoo_shopping_list_additional_items_from_json",
+            len(shopping_list["additionalItems"]),
+            lambda: cookidoo_shopping_list_additional_items_from_json(shopping_list),
+        ),
+        Case(
+            "cookidoo_shopping_list_from_json",
+            2 * ingredients + len(shopping_list["additionalItems"]),
+            lambda: cookidoo_shopping_list_from_json(shopping_list, _LOCALIZATION),
+        ),
+        Case(
+            "cookidoo_recipe_details_from_json",
+            size(10_000),
+            lambda: cookidoo_recipe_details_from_json(recipe_details, _LOCALIZATION),
+        ),
+        Case(
+            "cookidoo_collection_from_json",
+            size(500) * 20,
+            lambda: cookidoo_collection_from_json(collection),
+        ),
+        Case(
+            "cookidoo_custom_recipe_from_json",
+            len(custom_recipes["items"]),
+            lambda: [
+                cookidoo_custom_recipe_from_json(recipe, _LOCALIZATION)
+                for recipe in custom_recipes["items"]
+            ],
+        ),
+        Case(
+            "cookidoo_calendar_day_from_json",
+            size(1_000),
+            lambda: cookidoo_calendar_day_from_json(calendar_day, _LOCALIZATION),
+        ),
+        Case(
+            "cookidoo_search_result_from_json",
+            size(1_000),
+            lambda: cookidoo_search_result_from_json(search_result, _LOCALIZATION),
+        ),
+    ]
+
+
+def measure(case: Case, rounds: int, round_time: float) -> dict[str, float | int]:
+    """Measure a case.
+
+    Parameters
+    ----------
+    case
+        The case to measure
+    rounds
+        The number of timed rounds, the fastest round is reported
+    round_time
+        The minimum duration of a timed round [in seconds]
+
+    Returns
+    -------
+    dict[str, float | int]
+        The time [in ns], the allocated blocks and the peak memory [in bytes]
+        per item
+
+    """
+    # Calibrate the number of conversions per round
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            case.convert()
+        if time.perf_counter_ns() - start >= round_time * 1e9:
+            break
+        number *= 2
+
+    gc.disable()
+    try:
+        best = min(_time(case, number) for _ in range(rounds))
+
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        result = case.convert()
+        blocks = sys.getallocatedblocks() - blocks
+        del result
+
+        tracemalloc.start()
+        try:
+            case.convert()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    return {
+        "items": case.items,
+        "ns_per_item": best / number / case.items,
+        "blocks_per_item": blocks / case.items,
+        "peak_bytes_per_item": peak / case.items,
+    }
+
+
+def _time(case: Case, number: int) -> int:
+    """Time a round of conversions [in ns]."""
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        case.convert()
+    return time.perf_counter_ns() - start
+
+
+def benchmark(
+    scale: float = 1.0,
+    rounds: int = DEFAULT_ROUNDS,
+    round_time: float = DEFAULT_ROUND_TIME,
+    names: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Benchmark the converters.
+
+    Parameters
+    ----------
+    scale
+        The factor the default payload sizes are scaled by
+    rounds
+        The number of timed rounds per converter
+    round_time
+        The minimum duration of a timed round [in seconds]
+    names
+        The names of the converters to benchmark, ``None`` benchmarks all
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One result per converter
+
+    """
+    results: list[dict[str, Any]] = []
+    for case in cases(scale):
+        if names is not None and case.name not in names:
+            continue
+        result = measure(case, rounds, round_time)
+        results.append({"converter": case.name, **result})
+        print(
+            f"{case.name:<52} {result['items']:>7} items "
+            f"{result['ns_per_item']:>9.1f} ns "
+            f"{result['blocks_per_item']:>6.1f} blocks "
+            f"{result['peak_bytes_per_item']:>8.1f} B per item",
+            file=sys.stderr,
+        )
+    return results
+
+
+def main() -> None:
+    """Run the parser microbenchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--round-time", type=float, default=DEFAULT_ROUND_TIME)
+    parser.add_argument("--converter", nargs="+", help="only benchmark these")
+    parser.add_argument("--output", help="write the JSON results to a file")
+    args = parser.parse_args()
+
+    results = benchmark(
+        args.scale,
+        args.rounds,
+        args.round_time,
+        set(args.converter) if args.converter else None,
+    )
+    report = json.dumps(
+        {
+            "version": __version__,
+            "python": platform.python_version(),
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
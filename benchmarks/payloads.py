@@ -0,0 +1,332 @@
+"""Payloads for the benchmarks of cookidoo-api.
+
+Recorded payloads are scaled by ``scale``, synthetic payloads of any size are
+generated by the other functions, following the shapes of ``raw_types``.
+"""
+
+from typing import Any
+
+from cookidoo_api.raw_types import (
+    CalendarDayJSON,
+    CalenderDayRecipeJSON,
+    CustomRecipesJSON,
+    DescriptiveAssetJSON,
+    ItemJSON,
+    ManagedCollectionJSON,
+    RecipeDetailsJSON,
+    RecipeJSON,
+    SearchResultJSON,
+    ShoppingListJSON,
+)
+
+
+def scale(payload: Any, factor: int) -> Any:
+    """Scale a recorded payload by repeating its outermost lists of objects.
+
+    Objects nested in dictionaries are descended into, the first list of
+    objects found on each path is repeated ``factor`` times while the objects
+    in it are left as they are. Repeated objects get a unique ``id``.
+
+    Parameters
+    ----------
+    payload
+        The decoded JSON payload, e.g. from ``tests/responses.py``
+    factor
+        The number of times the lists are repeated
+
+    Returns
+    -------
+    Any
+        The scaled payload, the recorded payload is not modified
+
+    """
+    if isinstance(payload, dict):
+        return {key: scale(value, factor) for key, value in payload.items()}
+    if isinstance(payload, list) and any(isinstance(item, dict) for item in payload):
+        return [
+            _with_unique_id(item, copy) for copy in range(factor) for item in payload
+        ]
+    return payload
+
+
+def _with_unique_id(item: Any, copy: int) -> Any:
+    """Make the id of a repeated object unique."""
+    if copy and isinstance(item, dict) and isinstance(item.get("id"), str):
+        return {**item, "id": f"{item['id']}-{copy}"}
+    return item
+
+
+_IMAGE = (
+    "https://assets.tmecosys.com/image/upload/{transformation}/img/recipe/ras/"
+    "Assets/{id}/Derivates/{id}"
+)
+
+
+def _assets(id: str) -> DescriptiveAssetJSON:
+    """Generate the descriptive asset of a recipe."""
+    return {
+        "square": _IMAGE.replace("{id}", id),
+        "portrait": None,
+        "landscape": None,
+    }
+
+
+def ingredient_items(count: int, prefix: str = "item") -> list[ItemJSON]:
+    """Generate ingredient items, alternating the quantity notations."""
+    return [
+        {
+            "id": f"{prefix}-{i}",
+            "ingredientNotation": f"Ingredient {i}",
+            "isOwned": i % 2 == 0,
+            "quantity": {"value": i % 500 + 1, "from": None, "to": None}
+            if i % 3
+            else {"value": None, "from": i % 10 + 1, "to": i % 10 + 5},
+            "unitNotation": "g" if i % 4 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def shopping_list(
+    recipes: int, items_per_recipe: int, additional_items: int = 0
+) -> ShoppingListJSON:
+    """Generate a shopping list.
+
+    Parameters
+    ----------
+    recipes
+        The number of recipes, half of them custom recipes
+    items_per_recipe
+        The number of ingredient items per recipe
+    additional_items
+        The number of additional items
+
+    Returns
+    -------
+    ShoppingListJSON
+        The shopping list with ``recipes * items_per_recipe`` ingredient items
+
+    """
+    generated: list[RecipeJSON] = [
+        {
+            "id": f"r{i}",
+            "title": f"Recipe {i}",
+            "recipeIngredientGroups": ingredient_items(items_per_recipe, f"r{i}"),
+            "descriptiveAssets": [_assets(f"r{i}")],
+        }
+        for i in range(recipes)
+    ]
+    return {
+        "recipes": generated[: recipes - recipes // 2],
+        "customerRecipes": generated[recipes - recipes // 2 :],
+        "additionalItems": [
+            {"id": f"additional-{i}", "name": f"Item {i}", "isOwned": i % 2 == 0}
+            for i in range(additional_items)
+        ],
+    }
+
+
+def recipe_details(ingredients: int, steps: int = 10) -> RecipeDetailsJSON:
+    """Generate recipe details.
+
+    Parameters
+    ----------
+    ingredients
+        The number of ingredients, in groups of 10
+    steps
+        The number of steps
+
+    Returns
+    -------
+    RecipeDetailsJSON
+        The recipe details
+
+    """
+    items = ingredient_items(ingredients)
+    return {
+        "id": "r907015",
+        "title": "Recipe",
+        "difficulty": "easy",
+        "additionalInformation": [{"content": "Note"}],
+        "categories": [
+            {"id": f"VrkNavCategory-RPF-{i}", "title": "Category", "subtitle": ""}
+            for i in range(3)
+        ],
+        "inCollections": [
+            {"id": f"col{i}", "title": "Collection", "recipesCount": {"value": 42}}
+            for i in range(3)
+        ],
+        "recipeIngredientGroups": [
+            {
+                "recipeIngredients": [
+                    {
+                        "localId": item["id"],
+                        "ingredientNotation": item["ingredientNotation"],
+                        "quantity": item["quantity"],
+                        "unitNotation": item["unitNotation"],
+                    }
+                    for item in items[start : start + 10]
+                ]
+            }
+            for start in range(0, ingredients, 10)
+        ],
+        "recipeStepGroups": [
+            {
+                "title": "",
+                "recipeSteps": [
+                    {"formattedText": f"Step {i}", "title": ""} for i in range(steps)
+                ],
+            }
+        ],
+        "recipeUtensils": [{"utensilNotation": "Thermomix"}],
+        "servingSize": {
+            "quantity": {"value": 4, "from": None, "to": None},
+            "unitNotation": "portion",
+        },
+        "times": [
+            {
+                "quantity": {"value": 600, "from": None, "to": None},
+                "type": "activeTime",
+                "comment": "",
+            },
+            {
+                "quantity": {"value": 1800, "from": None, "to": None},
+                "type": "totalTime",
+                "comment": "",
+            },
+        ],
+        "nutritionGroups": [
+            {
+                "name": "",
+                "recipeNutritions": [
+                    {
+                        "nutritions": [
+                            {"number": 250.0, "type": "kcal", "unittype": "kcal"}
+                        ],
+                        "quantity": 1,
+                        "unitNotation": "portion",
+                    }
+                ],
+            }
+        ],
+        "descriptiveAssets": [_assets("r907015")],
+    }
+
+
+def managed_collection(
+    chapters: int, recipes_per_chapter: int
+) -> ManagedCollectionJSON:
+    """Generate a managed collection.
+
+    Parameters
+    ----------
+    chapters
+        The number of chapters
+    recipes_per_chapter
+        The number of recipes per chapter
+
+    Returns
+    -------
+    ManagedCollectionJSON
+        The collection with ``chapters * recipes_per_chapter`` recipes
+
+    """
+    return {
+        "id": "col500561",
+        "title": "Collection",
+        "description": "Description",
+        "chapters": [
+            {
+                "title": f"Chapter {c}",
+                "recipes": [
+                    {
+                        "id": f"r{c}-{r}",
+                        "title": f"Recipe {r}",
+                        "type": "VORWERK",
+                        "totalTime": 1800 + r,
+                    }
+                    for r in range(recipes_per_chapter)
+                ],
+            }
+            for c in range(chapters)
+        ],
+        "listType": "MANAGEDLIST",
+        "author": "Vorwerk",
+    }
+
+
+def custom_recipes(count: int, ingredients: int = 10) -> CustomRecipesJSON:
+    """Generate a custom recipe list.
+
+    Parameters
+    ----------
+    count
+        The number of custom recipes
+    ingredients
+        The number of ingredients and instructions per recipe
+
+    Returns
+    -------
+    CustomRecipesJSON
+        The custom recipe list
+
+    """
+    return {
+        "items": [
+            {
+                "recipeId": f"01K2CTJ9Y1BABRG5MXK44C{i:04d}",
+                "recipeContent": {
+                    "name": f"Custom recipe {i}",
+                    "image": _IMAGE.replace("{id}", str(i)),
+                    "prepTime": 600,
+                    # Every other recipe uses ISO 8601 durations
+                    "totalTime": "PT30M" if i % 2 else 1800,
+                    "recipeYield": {"value": 4, "unitText": "portion"},
+                    "tools": ["TM6"],
+                    "recipeIngredient": [
+                        f"{n} g Ingredient {n}" for n in range(ingredients)
+                    ],
+                    "recipeInstructions": [
+                        {"text": f"Step {n}"} for n in range(ingredients)
+                    ],
+                },
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def calendar_day(recipes: int) -> CalendarDayJSON:
+    """Generate a calendar day, a tenth of its recipes custom recipes."""
+    generated: list[CalenderDayRecipeJSON] = [
+        {
+            "id": f"r{i}",
+            "title": f"Recipe {i}",
+            "totalTime": 1800,
+            "assets": {"images": _assets(f"r{i}")} if i % 5 else None,
+        }
+        for i in range(recipes)
+    ]
+    return {
+        "id": "2025-03-04",
+        "title": "2025-03-04",
+        "dayKey": "2025-03-04",
+        "recipes": generated[recipes // 10 :],
+        "customerRecipes": generated[: recipes // 10],
+        "customerRecipeIds": [recipe["id"] for recipe in generated[: recipes // 10]],
+    }
+
+
+def search_result(hits: int) -> SearchResultJSON:
+    """Generate a search result."""
+    return {
+        "data": [
+            {
+                "id": f"r{i}",
+                "title": f"Recipe {i}",
+                "descriptiveAssets": [_assets(f"r{i}")],
+            }
+            for i in range(hits)
+        ],
+        "total": hits,
+    }
@@ -0,0 +1,235 @@
+"""Fake Cookidoo server for the benchmarks of cookidoo-api."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+import json
+import threading
+from typing import Any, Self
+
+from aiohttp import web
+from tests import responses
+
+from benchmarks.payloads import scale
+from cookidoo_api.const import (
+    ADD_ADDITIONAL_ITEMS_PATH,
+    ADD_CUSTOM_COLLECTION_PATH,
+    ADD_CUSTOM_RECIPE_PATH,
+    ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+    ADD_MANAGED_COLLECTION_PATH,
+    ADD_RECIPES_TO_CALENDER_PATH,
+    ADD_RECIPES_TO_CUSTOM_COLLECTION_PATH,
+    COMMUNITY_PROFILE_PATH,
+    CUSTOM_COLLECTIONS_PATH,
+    CUSTOM_RECIPE_PATH,
+    CUSTOM_RECIPES_PATH,
+    EDIT_ADDITIONAL_ITEMS_PATH,
+    EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH,
+    EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH,
+    MANAGED_COLLECTIONS_PATH,
+    RECIPE_PATH,
+    RECIPES_IN_CALENDAR_WEEK_PATH,
+    REMOVE_ADDITIONAL_ITEMS_PATH,
+    REMOVE_CUSTOM_COLLECTION_PATH,
+    REMOVE_CUSTOM_RECIPE_PATH,
+    REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+    REMOVE_MANAGED_COLLECTION_PATH,
+    REMOVE_RECIPE_FROM_CALENDER_PATH,
+    REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH,
+    SHOPPING_LIST_PATH,
+    SUBSCRIPTIONS_PATH,
+)
+from cookidoo_api.types import CookidooLocalizationConfig
+
+LANGUAGE = "de-CH"
+
+# The shopping list combining the recorded recipes, custom recipes and items
+_SHOPPING_LIST = {
+    "recipes": responses.COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS_FOR_RECIPES["recipes"],
+    "customerRecipes": responses.COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS_FOR_CUSTOM_RECIPES[
+        "customerRecipes"
+    ],
+    "additionalItems": responses.COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS[
+        "additionalItems"
+    ],
+}
+
+# Method, path and recorded payload of the API routes, ``None`` answers with
+# an empty response
+ROUTES: tuple[tuple[str, str, Any], ...] = (
+    ("GET", COMMUNITY_PROFILE_PATH, responses.COOKIDOO_TEST_RESPONSE_USER_INFO),
+    ("GET", SUBSCRIPTIONS_PATH, responses.COOKIDOO_TEST_RESPONSE_ACTIVE_SUBSCRIPTION),
+    ("GET", RECIPE_PATH, responses.COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS),
+    ("GET", "search/{locale}", responses.COOKIDOO_TEST_RESPONSE_SEARCH_RECIPES),
+    ("GET", CUSTOM_RECIPE_PATH, responses.COOKIDOO_TEST_RESPONSE_GET_CUSTOM_RECIPE),
+    ("GET", CUSTOM_RECIPES_PATH, responses.COOKIDOO_TEST_RESPONSE_LIST_CUSTOM_RECIPES),
+    (
+        "POST",
+        ADD_CUSTOM_RECIPE_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_CUSTOM_RECIPE,
+    ),
+    ("DELETE", REMOVE_CUSTOM_RECIPE_PATH, None),
+    ("GET", SHOPPING_LIST_PATH, _SHOPPING_LIST),
+    ("DELETE", SHOPPING_LIST_PATH, None),
+    (
+        "POST",
+        ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_INGREDIENTS_FOR_RECIPES,
+    ),
+    ("POST", REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH, None),
+    (
+        "POST",
+        EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_EDIT_INGREDIENTS_OWNERSHIP,
+    ),
+    (
+        "POST",
+        ADD_ADDITIONAL_ITEMS_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+    ),
+    (
+        "POST",
+        EDIT_ADDITIONAL_ITEMS_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_EDIT_ADDITIONAL_ITEMS,
+    ),
+    (
+        "POST",
+        EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_EDIT_ADDITIONAL_ITEMS_OWNERSHIP,
+    ),
+    ("POST", REMOVE_ADDITIONAL_ITEMS_PATH, None),
+    (
+        "GET",
+        MANAGED_COLLECTIONS_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_GET_MANAGED_COLLECTIONS,
+    ),
+    (
+        "POST",
+        ADD_MANAGED_COLLECTION_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_MANAGED_COLLECTION,
+    ),
+    ("DELETE", REMOVE_MANAGED_COLLECTION_PATH, None),
+    (
+        "GET",
+        CUSTOM_COLLECTIONS_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_GET_CUSTOM_COLLECTIONS,
+    ),
+    (
+        "POST",
+        ADD_CUSTOM_COLLECTION_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_CUSTOM_COLLECTION,
+    ),
+    ("DELETE", REMOVE_CUSTOM_COLLECTION_PATH, None),
+    (
+        "PUT",
+        ADD_RECIPES_TO_CUSTOM_COLLECTION_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_RECIPES_TO_CUSTOM_COLLECTION,
+    ),
+    (
+        "DELETE",
+        REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_REMOVE_RECIPE_FROM_CUSTOM_COLLECTION,
+    ),
+    (
+        "GET",
+        RECIPES_IN_CALENDAR_WEEK_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK,
+    ),
+    (
+        "PUT",
+        ADD_RECIPES_TO_CALENDER_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_ADD_RECIPES_TO_CALENDAR,
+    ),
+    (
+        "DELETE",
+        REMOVE_RECIPE_FROM_CALENDER_PATH,
+        responses.COOKIDOO_TEST_RESPONSE_REMOVE_RECIPE_FROM_CALENDAR,
+    ),
+)
+
+
+def _handler(body: bytes | None) -> Callable[[web.Request], Awaitable[web.Response]]:
+    """Create a handler answering with a pre-encoded body."""
+
+    async def handle(request: web.Request) -> web.Response:
+        await request.read()
+        if body is None:
+            return web.Response(status=HTTPStatus.NO_CONTENT)
+        return web.Response(body=body, content_type="application/json")
+
+    return handle
+
+
+def create_app(factor: int = 1) -> web.Application:
+    """Create the fake Cookidoo application.
+
+    Parameters
+    ----------
+    factor
+        The factor the recorded payloads are scaled by, see ``scale``
+
+    Returns
+    -------
+    web.Application
+        The application serving the recorded payloads of ``tests/responses.py``
+
+    """
+    app = web.Application()
+    for method, path, payload in ROUTES:
+        body = None if payload is None else json.dumps(scale(payload, factor)).encode()
+        app.router.add_route(
+            method, "/" + path.replace("{language}", LANGUAGE), _handler(body)
+        )
+    return app
+
+
+class FakeCookidooServer:
+    """Fake Cookidoo server running in a thread with its own event loop.
+
+    The server does not compete with the benchmarked client for its event
+    loop, only for the interpreter.
+    """
+
+    def __init__(self, factor: int = 1) -> None:
+        """Init function for the fake server.
+
+        Parameters
+        ----------
+        factor
+            The factor the recorded payloads are scaled by, see ``scale``
+
+        """
+        self._factor = factor
+        self._loop = asyncio.new_event_loop()
+        self._runner = web.AppRunner(create_app(factor), access_log=None)
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self.port = 0
+
+    @property
+    def localization(self) -> CookidooLocalizationConfig:
+        """Localization pointing a client to the fake server."""
+        return CookidooLocalizationConfig(
+            country_code="ch",
+            language=LANGUAGE,
+            url=f"http://127.0.0.1:{self.port}/foundation/{LANGUAGE}",
+        )
+
+    def __enter__(self) -> Self:
+        """Start the server on a free port."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the server."""
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _start(self) -> None:
+        """Start serving in the server's event loop."""
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = int(self._runner.addresses[0][1])
@@ -2,6 +2,8 @@
 
 __version__ = "0.17.2"
 
+from .cache import CookidooResultCache
+from .codec import CookidooJSONCodec, get_json_codec
 from .cookidoo import Cookidoo
 from .exceptions import (
     CookidooAuthException,
@@ -13,8 +15,20 @@ from .exceptions import (
     CookidooUnavailableException,
 )
 from .helpers import get_country_options, get_language_options, get_localization_options
+from .metrics import (
+    CookidooHistogram,
+    CookidooHistogramSink,
+    CookidooMetricsSink,
+    CookidooRequestMetrics,
+)
+from .ownership import CookidooOwnershipWriter
+from .prometheus import CookidooPrometheusExporter
+from .ratelimit import CookidooRateLimiter
+from .recipe_cache import CookidooRecipeCache
+from .retry import CookidooRetryPolicy
 from .types import (
     CookidooAdditionalItem,
+    CookidooCalendarPlanDay,
     CookidooCategory,
     CookidooChapter,
     CookidooChapterRecipe,
@@ -25,8 +39,11 @@ from .types import (
     CookidooItem,
     CookidooLocalizationConfig,
     CookidooRecipeCollection,
+    CookidooRecipeDetailsBatch,
     CookidooSearchRecipeHit,
     CookidooSearchResult,
+    CookidooShoppingList,
+    CookidooShoppingListPlan,
     CookidooShoppingRecipe,
     CookidooShoppingRecipeDetails,
     CookidooSubscription,
@@ -36,6 +53,18 @@ from .types import (
 
 __all__ = [
     "Cookidoo",
+    "CookidooHistogram",
+    "CookidooHistogramSink",
+    "CookidooJSONCodec",
+    "CookidooMetricsSink",
+    "CookidooOwnershipWriter",
+    "CookidooPrometheusExporter",
+    "CookidooRateLimiter",
+    "CookidooRecipeCache",
+    "CookidooRequestMetrics",
+    "CookidooResultCache",
+    "CookidooRetryPolicy",
+    "get_json_codec",
     "get_country_options",
     "get_language_options",
     "get_localization_options",
@@ -46,12 +75,16 @@ __all__ = [
     "CookidooItem",
     "CookidooAdditionalItem",
     "CookidooIngredientItem",
+    "CookidooShoppingList",
+    "CookidooShoppingListPlan",
     "CookidooShoppingRecipe",
     "CookidooShoppingRecipeDetails",
     "CookidooCategory",
     "CookidooChapter",
     "CookidooChapterRecipe",
     "CookidooRecipeCollection",
+    "CookidooRecipeDetailsBatch",
+    "CookidooCalendarPlanDay",
     "CookidooSearchRecipeHit",
     "CookidooSearchResult",
     "CookidooIngredient",
@@ -0,0 +1,135 @@
+"""Cookidoo API result cache."""
+
+from collections.abc import Hashable, Mapping
+import time
+
+from cookidoo_api.const import DEFAULT_RESULT_CACHE_SIZE, DEFAULT_RESULT_CACHE_TTL
+from cookidoo_api.exceptions import CookidooConfigException
+
+# Cache key of a result, the cached method and its arguments
+_ResultKey = tuple[str, Hashable]
+
+
+class CookidooResultCache:
+    """In-memory cache for the typed results of read-only endpoints.
+
+    Results expire after the time to live of their method and the least
+    recently used result is dropped once the cache is full. Cached results
+    are shared between callers and must not be modified.
+
+    The cached methods are ``get_recipe_details``, ``get_custom_recipe`` and
+    ``search_recipes``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESULT_CACHE_SIZE,
+        ttl: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_RESULT_CACHE_TTL,
+    ) -> None:
+        """Init function for the result cache.
+
+        Parameters
+        ----------
+        max_entries
+            The maximum number of cached results
+        ttl
+            The time to live of the results per method name [in seconds],
+            e.g. ``{"search_recipes": 300}``
+        default_ttl
+            The time to live of the results of all other methods [in seconds]
+
+        Raises
+        ------
+        CookidooConfigException
+            When the maximum number of results is not positive.
+
+        """
+        if max_entries < 1:
+            raise CookidooConfigException("Result cache size must be positive.")
+        self._max_entries = max_entries
+        self._ttl = dict(ttl or {})
+        self._default_ttl = default_ttl
+        self._entries: dict[_ResultKey, tuple[float, object]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups not answered from the cache."""
+        return self._misses
+
+    def get(self, method: str, key: Hashable) -> object | None:
+        """Get a cached result.
+
+        Parameters
+        ----------
+        method
+            The name of the cached method
+        key
+            The arguments of the call
+
+        Returns
+        -------
+        object | None
+            The cached result, or ``None`` if it is missing or expired
+
+        """
+        entry = self._entries.pop((method, key), None)
+        if entry is None or entry[0] <= time.monotonic():
+            self._misses += 1
+            return None
+        # Re-insert to mark the result as most recently used
+        self._entries[(method, key)] = entry
+        self._hits += 1
+        return entry[1]
+
+    def put(self, method: str, key: Hashable, result: object) -> None:
+        """Cache a result.
+
+        Parameters
+        ----------
+        method
+            The name of the cached method
+        key
+            The arguments of the call
+        result
+            The result of the call
+
+        """
+        self._entries.pop((method, key), None)
+        expires = time.monotonic() + self._ttl.get(method, self._default_ttl)
+        self._entries[(method, key)] = (expires, result)
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, method: str, key: Hashable | None = None) -> None:
+        """Drop cached results of a method.
+
+        Parameters
+        ----------
+        method
+            The name of the cached method
+        key
+            The arguments of the call to drop, ``None`` drops all results of
+            the method
+
+        """
+        if key is not None:
+            self._entries.pop((method, key), None)
+            return
+        for cached in [cached for cached in self._entries if cached[0] == method]:
+            del self._entries[cached]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
@@ -0,0 +1,130 @@
+"""Cookidoo API JSON codecs."""
+
+import json
+from typing import Any, cast
+
+from cookidoo_api.exceptions import CookidooConfigException
+
+
+class CookidooJSONCodec:
+    """JSON codec working on raw bytes, backed by the standard library.
+
+    A codec decodes response bodies and encodes request bodies. Subclasses
+    plug in faster JSON libraries, ``loads`` must raise a ``ValueError``
+    for malformed input.
+    """
+
+    name: str = "json"
+
+    def loads(self, data: bytes) -> object:
+        """Decode a JSON document from raw bytes."""
+        return cast(object, json.loads(data))
+
+    def dumps(self, obj: object) -> bytes:
+        """Encode an object to a JSON document as raw bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(CookidooJSONCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Init function for the orjson codec.
+
+        Raises
+        ------
+        CookidooConfigException
+            When ``orjson`` is not installed.
+
+        """
+        try:
+            import orjson  # noqa: PLC0415
+        except ImportError as e:
+            raise CookidooConfigException("The orjson codec requires orjson.") from e
+        self._orjson: Any = orjson
+
+    def loads(self, data: bytes) -> object:
+        """Decode a JSON document from raw bytes."""
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return cast(object, self._orjson.loads(data))
+
+    def dumps(self, obj: object) -> bytes:
+        """Encode an object to a JSON document as raw bytes."""
+        return cast(bytes, self._orjson.dumps(obj))
+
+
+class MsgspecCodec(CookidooJSONCodec):
+    """JSON codec backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Init function for the msgspec codec.
+
+        Raises
+        ------
+        CookidooConfigException
+            When ``msgspec`` is not installed.
+
+        """
+        try:
+            import msgspec  # noqa: PLC0415
+        except ImportError as e:
+            raise CookidooConfigException("The msgspec codec requires msgspec.") from e
+        self._msgspec: Any = msgspec
+        self._decoder: Any = msgspec.json.Decoder()
+        self._encoder: Any = msgspec.json.Encoder()
+
+    def loads(self, data: bytes) -> object:
+        """Decode a JSON document from raw bytes."""
+        try:
+            return cast(object, self._decoder.decode(data))
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: object) -> bytes:
+        """Encode an object to a JSON document as raw bytes."""
+        return cast(bytes, self._encoder.encode(obj))
+
+
+_CODECS: dict[str, type[CookidooJSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    CookidooJSONCodec.name: CookidooJSONCodec,
+}
+
+
+def get_json_codec(name: str | None = None) -> CookidooJSONCodec:
+    """Get a JSON codec by name, or the fastest installed one.
+
+    Parameters
+    ----------
+    name
+        One of ``"orjson"``, ``"msgspec"`` or ``"json"``. Without a name,
+        orjson and msgspec are tried in this order before falling back to
+        the standard library.
+
+    Returns
+    -------
+    CookidooJSONCodec
+        The JSON codec
+
+    Raises
+    ------
+    CookidooConfigException
+        When the codec is unknown or its library is not installed.
+
+    """
+    if name is not None:
+        if name not in _CODECS:
+            raise CookidooConfigException(f"Unknown JSON codec {name}.")
+        return _CODECS[name]()
+
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except CookidooConfigException:
+            continue
+    return CookidooJSONCodec()
@@ -0,0 +1,182 @@
+"""Cookidoo API bounded concurrency helpers."""
+
+import asyncio
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Sequence,
+)
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+
+
+async def _cancel(tasks: Iterable[asyncio.Future[Any]]) -> None:
+    """Cancel tasks and wait for them to finish."""
+    tasks = list(tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def prefetch(  # noqa: UP047
+    calls: Iterable[Callable[[], Awaitable[_T]]], window: int
+) -> AsyncGenerator[_T]:
+    """Run calls with at most ``window`` in flight, yielding results in order.
+
+    The window is refilled before a result is yielded, so the next calls run
+    while the consumer handles it. No more than ``window`` results are
+    fetched ahead of the consumer. When the consumer stops iterating or a
+    call fails, the calls in flight are cancelled.
+    """
+    remaining = iter(calls)
+    pending: deque[asyncio.Future[_T]] = deque(
+        asyncio.ensure_future(call()) for call in islice(remaining, window)
+    )
+    try:
+        while pending:
+            result = await pending.popleft()
+            if (call := next(remaining, None)) is not None:
+                pending.append(asyncio.ensure_future(call()))
+            yield result
+    finally:
+        await _cancel(pending)
+
+
+async def completed(  # noqa: UP047
+    calls: Iterable[Callable[[], Awaitable[_T]]], limit: int
+) -> AsyncGenerator[_T]:
+    """Run calls with at most ``limit`` in flight, yielding results as they complete.
+
+    When the consumer stops iterating or a call fails, the calls in flight are
+    cancelled.
+    """
+    remaining = iter(calls)
+    pending: set[asyncio.Future[_T]] = {
+        asyncio.ensure_future(call()) for call in islice(remaining, limit)
+    }
+    done: set[asyncio.Future[_T]] = set()
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for call in islice(remaining, len(done)):
+                pending.add(asyncio.ensure_future(call()))
+            while done:
+                yield done.pop().result()
+    finally:
+        # The finished calls not yielded yet are read, so their errors are not
+        # reported as never retrieved
+        await _cancel(done | pending)
+
+
+class MicroBatcher(Generic[_K, _T]):  # noqa: UP046
+    """Merge the calls arriving within a window into batched calls.
+
+    The keys of the calls arriving within ``window`` seconds of the first are
+    sent together with a single call of ``send``, at most ``max_size`` keys at
+    once unless a single call has more. ``send`` returns the results paired
+    with their keys, which are split back to the calls by key. A key submitted
+    more than once takes the next result for it, the last result is shared
+    when there are fewer results than submissions.
+
+    With ``fold``, the keys of a batch with the same ``fold`` value are folded
+    into the last submitted one before sending, so the latest change wins.
+    Results are then split back by their ``fold`` value.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[_K]], Awaitable[list[tuple[_K, _T]]]],
+        window: float,
+        max_size: int,
+        *,
+        fold: Callable[[_K], Hashable] | None = None,
+    ) -> None:
+        """Init function for the micro batcher."""
+        self._send = send
+        self._window = window
+        self._max_size = max_size
+        self._fold = fold
+        self._calls: list[tuple[Sequence[_K], asyncio.Future[list[_T]]]] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task[None]] = set()
+
+    def submit_nowait(self, keys: Sequence[_K]) -> asyncio.Future[list[_T]]:
+        """Submit the keys of a call and get the future of its results."""
+        if self._calls and self._size + len(keys) > self._max_size:
+            self._dispatch()
+        loop = asyncio.get_running_loop()
+        if self._timer is None:
+            self._timer = loop.call_later(self._window, self._dispatch)
+        future: asyncio.Future[list[_T]] = loop.create_future()
+        self._calls.append((keys, future))
+        self._size += len(keys)
+        if self._size >= self._max_size:
+            self._dispatch()
+        return future
+
+    async def submit(self, keys: Sequence[_K]) -> list[_T]:
+        """Submit the keys of a call and wait for the results of its batch."""
+        return await self.submit_nowait(keys)
+
+    async def flush(self) -> None:
+        """Send the current batch at once and wait for the batches in flight."""
+        self._dispatch()
+        if self._sending:
+            await asyncio.wait(set(self._sending))
+
+    def _dispatch(self) -> None:
+        """Send the current batch in a task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._calls:
+            return
+        task = asyncio.ensure_future(self._run(self._calls))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+        self._calls, self._size = [], 0
+
+    def _key(self, key: _K) -> Hashable:
+        """Get the key the results are split back by."""
+        return key if self._fold is None else self._fold(key)
+
+    async def _run(
+        self, calls: list[tuple[Sequence[_K], asyncio.Future[list[_T]]]]
+    ) -> None:
+        """Send a batch and split its results back to the calls."""
+        keys = [key for call_keys, _ in calls for key in call_keys]
+        if self._fold is not None:
+            keys = list({self._key(key): key for key in keys}.values())
+        try:
+            results = await self._send(keys)
+        except asyncio.CancelledError:
+            for _, future in calls:
+                future.cancel()
+            raise
+        except Exception as err:
+            for _, future in calls:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        by_key: dict[Hashable, deque[_T]] = {}
+        for key, result in results:
+            by_key.setdefault(self._key(key), deque()).append(result)
+        for call_keys, future in calls:
+            # Split for cancelled calls too, so the later calls get their turn
+            call_results = [
+                queue.popleft() if len(queue) > 1 else queue[0]
+                for key in call_keys
+                if (queue := by_key.get(self._key(key), deque()))
+            ]
+            if not future.done():
+                future.set_result(call_results)
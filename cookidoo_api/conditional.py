@@ -0,0 +1,193 @@
+"""Cookidoo API conditional request cache."""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+import hashlib
+from http import HTTPStatus
+from typing import TypeVar, cast
+
+from aiohttp import hdrs
+from yarl import URL
+
+from cookidoo_api.const import DEFAULT_CONDITIONAL_CACHE_SIZE
+
+_T = TypeVar("_T")
+
+# Url, query params and extra headers of a polled resource
+ConditionalKey = tuple[str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class ConditionalEntry:
+    """A cached response of a polled resource.
+
+    Attributes
+    ----------
+    etag
+        The ``ETag`` validator of the response, if any
+    last_modified
+        The ``Last-Modified`` validator of the response, if any
+    digest
+        The hash of the response body
+    body
+        The decoded response body
+    results
+        The parsed results of the body, keyed by operation
+
+    """
+
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    body: object | None
+    results: dict[str, object] = field(default_factory=dict)
+
+
+class ConditionalCache:
+    """Validators and parsed results of polled resources.
+
+    Requests for a known resource carry ``If-None-Match`` and
+    ``If-Modified-Since`` headers. A ``304 Not Modified`` response, or a body
+    hashing to the previous one when the server sends no validators, reuses
+    the decoded body and its parsed results.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CONDITIONAL_CACHE_SIZE) -> None:
+        """Init function for the conditional cache.
+
+        Parameters
+        ----------
+        max_entries
+            The maximum number of resources to keep, the least recently used
+            resource is dropped first
+
+        """
+        self._max_entries = max_entries
+        self._entries: dict[ConditionalKey, ConditionalEntry] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached resources."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        url: URL, params: Mapping[str, str] | None, headers: Mapping[str, str] | None
+    ) -> ConditionalKey:
+        """Get the cache key of a request."""
+        return (
+            str(url),
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+
+    def headers(self, key: ConditionalKey) -> dict[str, str]:
+        """Get the conditional request headers for a resource."""
+        if (entry := self._entries.get(key)) is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = entry.etag
+        if entry.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+        return headers
+
+    @staticmethod
+    def without_validators(headers: Mapping[str, str]) -> dict[str, str]:
+        """Get request headers without the conditional request headers."""
+        return {
+            name: value
+            for name, value in headers.items()
+            if name not in (hdrs.IF_NONE_MATCH, hdrs.IF_MODIFIED_SINCE)
+        }
+
+    def is_dropped(self, key: ConditionalKey, status: int) -> bool:
+        """Check whether a response is a 304 for a resource no longer cached.
+
+        The resource may be dropped while its request is in flight, the
+        request must then be sent again without validators.
+        """
+        return status == HTTPStatus.NOT_MODIFIED and key not in self._entries
+
+    def resolve(
+        self,
+        key: ConditionalKey,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        decode: Callable[[], object | None],
+    ) -> object | None:
+        """Get the decoded body of a response, reusing it when unchanged.
+
+        Parameters
+        ----------
+        key
+            The cache key of the request
+        status
+            The status of the response
+        headers
+            The headers of the response
+        body
+            The raw body of the response
+        decode
+            Decodes the raw body, only called when the body changed
+
+        Returns
+        -------
+        object | None
+            The decoded body, the very same object as before when unchanged
+
+        """
+        entry = self._entries.pop(key, None)
+        if status == HTTPStatus.NOT_MODIFIED and entry is not None:
+            self._entries[key] = entry
+            return entry.body
+
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if entry is None or entry.digest != digest:
+            entry = ConditionalEntry(
+                etag=None, last_modified=None, digest=digest, body=decode()
+            )
+        entry.etag = headers.get(hdrs.ETAG)
+        entry.last_modified = headers.get(hdrs.LAST_MODIFIED)
+        self._entries[key] = entry
+        if len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        return entry.body
+
+    def convert(
+        self,
+        key: ConditionalKey,
+        operation: str,
+        body: object | None,
+        parser: Callable[[object | None], _T],
+    ) -> _T:
+        """Parse a decoded body, reusing the result while the body is unchanged.
+
+        Parameters
+        ----------
+        key
+            The cache key of the request
+        operation
+            The operation identifying the parser
+        body
+            The decoded body as returned by ``resolve``
+        parser
+            Converts the decoded body into public types
+
+        Returns
+        -------
+        _T
+            The parsed result
+
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.body is not body:
+            # The resource was dropped or changed by a concurrent request
+            return parser(body)
+        if operation not in entry.results:
+            entry.results[operation] = parser(body)
+        return cast(_T, entry.results[operation])
+
+    def clear(self) -> None:
+        """Forget all cached resources."""
+        self._entries.clear()
@@ -6,6 +6,59 @@ DEFAULT_API_HEADERS: Final = {
     "ACCEPT": "application/json",
 }
 
+# Maximum number of response body bytes written to the debug log
+DEFAULT_LOG_BODY_LIMIT: Final = 4096
+
+# Maximum number of polled resources whose validators and parsed results are
+# kept for conditional requests
+DEFAULT_CONDITIONAL_CACHE_SIZE: Final = 64
+
+# Maximum number of results and their time to live [in seconds] kept by the
+# result cache
+DEFAULT_RESULT_CACHE_SIZE: Final = 1024
+DEFAULT_RESULT_CACHE_TTL: Final = 3600.0
+
+# Time to live [in seconds] and maximum total size [in bytes] of the recipe
+# details kept by the persistent recipe cache
+DEFAULT_RECIPE_CACHE_TTL: Final = 7 * 24 * 3600.0
+DEFAULT_RECIPE_CACHE_MAX_BYTES: Final = 256 * 1024 * 1024
+
+# Upper bounds [in seconds] of the buckets of the in-memory metrics histograms
+DEFAULT_HISTOGRAM_BUCKETS: Final = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Content type of the Prometheus text exposition format and the default port
+# of the local metrics server
+PROMETHEUS_CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_PROMETHEUS_PORT: Final = 9464
+
+# Maximum number of requests in flight at once for the bulk methods
+DEFAULT_BULK_CONCURRENCY: Final = 8
+
+# Number of pages loaded ahead of the consumer by the paginated iterators
+DEFAULT_PREFETCH_WINDOW: Final = 4
+
+# Time [in seconds] the ownership writer collects changes before sending them
+DEFAULT_OWNERSHIP_WRITE_DELAY: Final = 0.5
+
+# Maximum number of recipe ids or additional item names merged into a single
+# request by the micro batching
+DEFAULT_MAX_BATCH_SIZE: Final = 50
+
 # A browser-like User-Agent for the login flow requests only. The login
 # flow is served behind Cloudflare and clients without a recognizable
 # browser User-Agent (e.g. Home Assistant's default "Home Assistant/x.y
@@ -31,6 +84,7 @@ CUSTOM_RECIPES_PATH_ACCEPT: Final = "application/vnd.vorwerk.customer-recipe.ful
 CUSTOM_RECIPE_PATH: Final = "created-recipes/{language}/{id}"
 ADD_CUSTOM_RECIPE_PATH: Final = "created-recipes/{language}"
 REMOVE_CUSTOM_RECIPE_PATH: Final = "created-recipes/{language}/{id}"
+SHOPPING_LIST_PATH: Final = "shopping/{language}"
 SHOPPING_LIST_RECIPES_PATH: Final = "shopping/{language}"
 INGREDIENT_ITEMS_PATH: Final = "shopping/{language}"
 EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH: Final = (
@@ -1,22 +1,45 @@
 """Cookidoo api implementation."""
 
-from collections.abc import Callable, Mapping, Sequence
-from datetime import date
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import replace
+from datetime import date, timedelta
+from functools import partial
 from http import HTTPStatus
 from http.cookies import SimpleCookie
+from itertools import chain
 import json
-from json import JSONDecodeError
 import logging
+import math
 from pathlib import Path
 import re
 import time
 import traceback
-from typing import TypeVar, cast
-from urllib.parse import urlparse
-
-from aiohttp import ClientError, ClientSession
+from typing import Final, TypeVar, cast
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    hdrs,
+)
 from yarl import URL
 
+from cookidoo_api.cache import CookidooResultCache
+from cookidoo_api.codec import CookidooJSONCodec, get_json_codec
+from cookidoo_api.concurrency import MicroBatcher, completed, prefetch
+from cookidoo_api.conditional import ConditionalCache, ConditionalKey
 from cookidoo_api.const import (
     ADD_ADDITIONAL_ITEMS_PATH,
     ADD_CUSTOM_COLLECTION_PATH,
@@ -25,7 +48,6 @@ from cookidoo_api.const import (
     ADD_MANAGED_COLLECTION_PATH,
     ADD_RECIPES_TO_CALENDER_PATH,
     ADD_RECIPES_TO_CUSTOM_COLLECTION_PATH,
-    ADDITIONAL_ITEMS_PATH,
     CIAM_LOGIN_SRV_URL,
     COMMUNITY_PROFILE_PATH,
     CUSTOM_COLLECTIONS_PATH,
@@ -34,6 +56,10 @@ from cookidoo_api.const import (
     CUSTOM_RECIPES_PATH,
     CUSTOM_RECIPES_PATH_ACCEPT,
     DEFAULT_API_HEADERS,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_LOG_BODY_LIMIT,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_PREFETCH_WINDOW,
     EDIT_ADDITIONAL_ITEMS_PATH,
     EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH,
     EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH,
@@ -52,12 +78,13 @@ from cookidoo_api.const import (
     REMOVE_MANAGED_COLLECTION_PATH,
     REMOVE_RECIPE_FROM_CALENDER_PATH,
     REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH,
-    SHOPPING_LIST_RECIPES_PATH,
+    SHOPPING_LIST_PATH,
     SUBSCRIPTIONS_PATH,
 )
 from cookidoo_api.exceptions import (
     CookidooAuthException,
     CookidooConfigException,
+    CookidooException,
     CookidooParseException,
     CookidooRequestException,
 )
@@ -70,11 +97,17 @@ from cookidoo_api.helpers import (
     cookidoo_recipe_details_from_json,
     cookidoo_recipe_from_json,
     cookidoo_search_result_from_json,
+    cookidoo_shopping_list_additional_items_from_json,
+    cookidoo_shopping_list_from_json,
+    cookidoo_shopping_list_ingredient_items_from_json,
+    cookidoo_shopping_list_recipes_from_json,
     cookidoo_subscription_from_json,
     cookidoo_user_info_from_json,
     normalize_list_param,
     normalize_tmv_param,
 )
+from cookidoo_api.metrics import CookidooMetricsSink, CookidooRequestMetrics
+from cookidoo_api.ratelimit import CookidooRateLimiter
 from cookidoo_api.raw_types import (
     AdditionalItemJSON,
     CalendarDayJSON,
@@ -88,17 +121,26 @@ from cookidoo_api.raw_types import (
     RecipeDetailsJSON,
     RecipeJSON,
     SearchResultJSON,
+    ShoppingListJSON,
     SubscriptionJSON,
 )
+from cookidoo_api.recipe_cache import CookidooRecipeCache
+from cookidoo_api.retry import CookidooRetryPolicy
+from cookidoo_api.routes import CookidooRoutes
 from cookidoo_api.types import (
     CookidooAdditionalItem,
     CookidooCalendarDay,
+    CookidooCalendarPlanDay,
     CookidooCollection,
     CookidooConfig,
     CookidooCustomRecipe,
     CookidooIngredientItem,
     CookidooLocalizationConfig,
+    CookidooRecipeDetailsBatch,
+    CookidooSearchRecipeHit,
     CookidooSearchResult,
+    CookidooShoppingList,
+    CookidooShoppingListPlan,
     CookidooShoppingRecipe,
     CookidooShoppingRecipeDetails,
     CookidooSubscription,
@@ -108,6 +150,12 @@ from cookidoo_api.types import (
 
 _LOGGER = logging.getLogger(__name__)
 _T = TypeVar("_T")
+_NO_RETRY: Final = CookidooRetryPolicy(max_attempts=1)
+
+# Url, query params, accept header, accepted statuses and parse flag
+_RequestKey = tuple[
+    str, tuple[tuple[str, str], ...], str | None, tuple[HTTPStatus, ...], bool
+]
 
 
 class Cookidoo:
@@ -117,11 +165,46 @@ class Cookidoo:
     _cfg: CookidooConfig
     _api_headers: dict[str, str]
     _logged_in: bool
+    _log_body_limit: int | None
+    _json_codec: CookidooJSONCodec
+    _retry_policy: CookidooRetryPolicy
+    _rate_limiter: CookidooRateLimiter | None
+    _concurrency: asyncio.Semaphore | None
+    _queued_requests: int
+    _in_flight_requests: int
+    _coalesce_requests: bool
+    _in_flight_gets: dict["_RequestKey", asyncio.Task[object | None]]
+    _conditional_cache: ConditionalCache | None
+    _result_cache: CookidooResultCache | None
+    _recipe_cache: CookidooRecipeCache | None
+    _route_table: CookidooRoutes
+    _auto_login: bool
+    _login_lock: asyncio.Lock
+    _login_generation: int
+    _login_failed: bool
+    _relogin_succeeded: bool
+    _metrics: CookidooMetricsSink | None
+    _recipes_batcher: MicroBatcher[str, object] | None
+    _additional_items_batcher: MicroBatcher[str, CookidooAdditionalItem] | None
 
     def __init__(
         self,
         session: ClientSession,
         cfg: CookidooConfig = CookidooConfig(),
+        *,
+        log_body_limit: int | None = DEFAULT_LOG_BODY_LIMIT,
+        json_codec: CookidooJSONCodec | None = None,
+        retry_policy: CookidooRetryPolicy | None = CookidooRetryPolicy(),
+        rate_limiter: CookidooRateLimiter | None = None,
+        max_concurrency: int | None = None,
+        coalesce_requests: bool = True,
+        batch_window: float | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        conditional_requests: bool = False,
+        result_cache: CookidooResultCache | None = None,
+        recipe_cache: CookidooRecipeCache | None = None,
+        auto_login: bool = False,
+        metrics: CookidooMetricsSink | None = None,
     ) -> None:
         """Init function for Cookidoo API.
 
@@ -133,18 +216,124 @@ class Cookidoo:
             cookies during the OAuth2 login flow.
         cfg
             Cookidoo config
+        log_body_limit
+            Maximum number of response body bytes written to the debug log,
+            ``None`` logs the whole body. Bodies are only decoded for the log
+            when debug logging is enabled.
+        json_codec
+            The JSON codec for request and response bodies, defaults to the
+            fastest installed one (orjson, msgspec or the standard library),
+            see ``get_json_codec``.
+        retry_policy
+            The retry policy for throttled (429), failing (5xx) and timed out
+            requests. By default only ``GET`` requests are retried, ``None``
+            disables retries.
+        rate_limiter
+            A rate limiter pacing the API and login requests per host, share
+            one instance between clients to pace their combined traffic.
+        max_concurrency
+            The maximum number of API requests in flight at once, further
+            requests are queued. ``None`` does not limit the concurrency.
+        coalesce_requests
+            Whether identical ``GET`` requests in flight at the same time
+            share a single request and its parsed response.
+        batch_window
+            The time [in seconds] ``add_ingredient_items_for_recipes`` and
+            ``add_additional_items`` calls are collected after the first one,
+            to be merged into a single request. ``None`` sends every call on
+            its own. A failed request fails all calls merged into it, e.g. an
+            unknown recipe id of one call fails the other calls as well.
+        max_batch_size
+            The maximum number of recipe ids or additional item names merged
+            into a single request, larger calls are sent on their own.
+        conditional_requests
+            Whether the shopping list, calendar weeks and collection lists are
+            polled with ``If-None-Match`` and ``If-Modified-Since`` headers.
+            Unchanged responses return the previously parsed objects, shared
+            by all callers, so only enable it when the results are not
+            modified.
+        result_cache
+            A cache for the results of recipe details, custom recipes and
+            searches, see ``CookidooResultCache``. Results are cached per
+            account, do not share a cache between clients of different
+            accounts.
+        recipe_cache
+            A persistent cache for recipe details surviving restarts, see
+            ``CookidooRecipeCache``. It is consulted after the result cache.
+        auto_login
+            Whether to log in again when a request fails with 401
+            Unauthorized and replay it once. Requests failing at the same
+            time share a single login. After a login fails with invalid
+            credentials, requests are not replayed until ``login`` succeeds.
+        metrics
+            A sink receiving the timings, statuses and sizes of the responses
+            and the conversion times, see ``CookidooHistogramSink``. Nothing
+            is measured without a sink.
+
+        Raises
+        ------
+        CookidooConfigException
+            When ``max_concurrency`` or ``max_batch_size`` is not positive, or
+            ``batch_window`` is negative.
 
         """
         self._session = session
         self._cfg = cfg
         self._api_headers = DEFAULT_API_HEADERS.copy()
+        self._route_table = CookidooRoutes(cfg.localization)
         self._logged_in = False
+        self._log_body_limit = log_body_limit
+        self._json_codec = json_codec or get_json_codec()
+        self._retry_policy = retry_policy or _NO_RETRY
+        self._rate_limiter = rate_limiter
+        if max_concurrency is not None and max_concurrency < 1:
+            raise CookidooConfigException("Max concurrency must be positive.")
+        self._concurrency = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+        self._queued_requests = 0
+        self._in_flight_requests = 0
+        self._coalesce_requests = coalesce_requests
+        self._in_flight_gets = {}
+        if batch_window is not None and batch_window < 0:
+            raise CookidooConfigException("Batch window must not be negative.")
+        if max_batch_size < 1:
+            raise CookidooConfigException("Max batch size must be positive.")
+        self._recipes_batcher = (
+            MicroBatcher(self._add_recipes_batch, batch_window, max_batch_size)
+            if batch_window is not None
+            else None
+        )
+        self._additional_items_batcher = (
+            MicroBatcher(self._add_additional_items_batch, batch_window, max_batch_size)
+            if batch_window is not None
+            else None
+        )
+        self._conditional_cache = ConditionalCache() if conditional_requests else None
+        self._result_cache = result_cache
+        self._recipe_cache = recipe_cache
+        self._auto_login = auto_login
+        self._metrics = metrics
+        self._login_lock = asyncio.Lock()
+        self._login_generation = 0
+        self._login_failed = False
+        self._relogin_succeeded = False
 
     @property
     def localization(self) -> CookidooLocalizationConfig:
         """Localization."""
         return self._cfg.localization
 
+    @property
+    def queued_requests(self) -> int:
+        """Number of API requests waiting for a free concurrency slot."""
+        return self._queued_requests
+
+    @property
+    def in_flight_requests(self) -> int:
+        """Number of API requests currently in flight."""
+        return self._in_flight_requests
+
     @property
     def api_endpoint(self) -> URL:
         """Get the api endpoint.
@@ -152,8 +341,18 @@ class Cookidoo:
         Returns the cookidoo domain derived from the localization URL,
         e.g. ``https://cookidoo.ch`` or ``https://cookidoo.co.uk``.
         """
-        parsed = urlparse(self._cfg.localization.url)
-        return URL(f"{parsed.scheme}://{parsed.netloc}")
+        return self._routes.api_endpoint
+
+    @property
+    def _routes(self) -> CookidooRoutes:
+        """The route table, rebuilt when the localization changes."""
+        if self._route_table.localization != self._cfg.localization:
+            self._route_table = CookidooRoutes(self._cfg.localization)
+        return self._route_table
+
+    def _url(self, path: str, **fields: str) -> URL:
+        """Get the url of an API path from the route table."""
+        return self._routes.url(path, **fields)
 
     async def _request_json(
         self,
@@ -169,6 +368,7 @@ class Cookidoo:
             HTTPStatus.NO_CONTENT,
         ),
         parse_response: bool = True,
+        conditional: bool = False,
     ) -> object | None:
         """Execute an HTTP request and parse its JSON response.
 
@@ -191,11 +391,15 @@ class Cookidoo:
             A 204 response always returns ``None`` (no body).
         parse_response
             Whether to parse a successful non-204 response as JSON.
+        conditional
+            Whether to send a ``GET`` request with the validators of the
+            previous response, see ``ConditionalCache``.
 
         Returns
         -------
         object | None
             The parsed JSON response, or ``None`` for 204 No Content.
+            Unchanged conditional responses return the previous object.
 
         Raises
         ------
@@ -208,72 +412,339 @@ class Cookidoo:
 
         """
         merged_headers = {**self._api_headers, **(headers or {})}
-
+        data: bytes | None = None
+        if json is not None:
+            data = self._json_codec.dumps(json)
+            merged_headers["Content-Type"] = "application/json"
+        conditional_key: ConditionalKey | None = None
+        if conditional and self._conditional_cache is not None:
+            conditional_key = ConditionalCache.key(url, params, headers)
+            merged_headers.update(self._conditional_cache.headers(conditional_key))
+            accepted_statuses = (*accepted_statuses, HTTPStatus.NOT_MODIFIED)
+
+        send = partial(
+            self._send_request,
+            method,
+            url,
+            operation,
+            params=params,
+            data=data,
+            headers=merged_headers,
+            accepted_statuses=accepted_statuses,
+            parse_response=parse_response,
+            conditional_key=conditional_key,
+        )
+        if not self._coalesce_requests or method.upper() != "GET":
+            return await self._send_authenticated(send)
+
+        # Identical GET requests in flight at the same time share a single
+        # request and its parsed response.
+        key: _RequestKey = (
+            str(url),
+            tuple(sorted((params or {}).items())),
+            merged_headers.get("ACCEPT"),
+            accepted_statuses,
+            parse_response,
+        )
+        if (task := self._in_flight_gets.get(key)) is None:
+            task = asyncio.create_task(self._send_authenticated(send))
+            self._in_flight_gets[key] = task
+            task.add_done_callback(partial(self._request_done, key))
+        # Shielded so a cancelled waiter does not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, key: _RequestKey, task: asyncio.Task[object | None]
+    ) -> None:
+        """Forget a finished shared request."""
+        if self._in_flight_gets.get(key) is task:
+            del self._in_flight_gets[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case all waiters were cancelled
+            task.exception()
+
+    async def _send_authenticated(
+        self, send: Callable[[], Awaitable[object | None]]
+    ) -> object | None:
+        """Send a request, logging in again and replaying it once on a 401."""
+        if not self._auto_login:
+            return await send()
+        generation = self._login_generation
         try:
-            async with self._session.request(
-                method, url, headers=merged_headers, json=json, params=params
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
+            return await send()
+        except CookidooAuthException:
+            if not await self._relogin(generation):
+                raise
+        return await send()
+
+    async def _relogin(self, generation: int) -> bool:
+        """Log in again after a 401, once for all requests failing together.
 
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot %s: %s",
-                            operation,
-                            errmsg.get("error_description", ""),
-                        )
-                    self._raise_auth_exception(operation)
-
-                if r.status not in accepted_statuses:
-                    r.raise_for_status()
-
-                if r.status == HTTPStatus.NO_CONTENT:
-                    return None
-                if not parse_response:
-                    return None
-                try:
-                    result: object = await r.json()
-                except (JSONDecodeError, KeyError) as e:
+        Parameters
+        ----------
+        generation
+            The login generation the failed request was sent with
+
+        Returns
+        -------
+        bool
+            Whether the login succeeded and the request can be replayed
+
+        """
+        async with self._login_lock:
+            if self._login_failed:
+                # Invalid credentials are not retried until a login succeeds
+                return False
+            if self._login_generation != generation:
+                # Another request already tried to log in again
+                return self._relogin_succeeded
+            _LOGGER.debug("Logging in again after an authorization failure")
+            self._relogin_succeeded = False
+            try:
+                await self.login()
+                self._relogin_succeeded = True
+            finally:
+                # Requests sent during the login still see the old generation
+                # and wait for its outcome instead of logging in again
+                self._login_generation += 1
+            return True
+
+    async def _send_request(
+        self,
+        method: str,
+        url: URL,
+        operation: str,
+        *,
+        params: dict[str, str] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str],
+        accepted_statuses: tuple[HTTPStatus, ...],
+        parse_response: bool,
+        conditional_key: ConditionalKey | None = None,
+    ) -> object | None:
+        """Send a request, retrying it according to the retry policy."""
+        policy = self._retry_policy if self._retry_policy.allows(method) else _NO_RETRY
+        metrics = self._metrics
+        attempt = 0
+        while True:
+            attempt += 1
+            can_retry = attempt < policy.max_attempts
+            retry_delay: float | None = None
+            # Timestamps are only taken when there is a metrics sink
+            start = time.perf_counter() if metrics is not None else 0.0
+            await self._throttle(url)
+            try:
+                async with self._request_slot():
+                    sent = time.perf_counter() if metrics is not None else 0.0
+                    async with self._session.request(
+                        method, url, headers=headers, data=data, params=params
+                    ) as r:
+                        received = time.perf_counter() if metrics is not None else 0.0
+                        # The body is read once and shared by logging and parsing
+                        body = await r.read()
+                        read = time.perf_counter() if metrics is not None else 0.0
+                        try:
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug(
+                                    "Response from %s [%s]: %s",
+                                    url,
+                                    r.status,
+                                    self._format_body_for_log(body),
+                                )
+                            if can_retry and r.status in policy.retry_statuses:
+                                retry_delay = policy.delay(
+                                    attempt, r.headers.get(hdrs.RETRY_AFTER)
+                                )
+                            if (
+                                retry_delay is None
+                                and (
+                                    unconditional := self._unconditional_headers(
+                                        r.status, headers, conditional_key
+                                    )
+                                )
+                                is not None
+                            ):
+                                headers = unconditional
+                                continue
+                            if retry_delay is None:
+                                return self._handle_response(
+                                    r,
+                                    body,
+                                    operation,
+                                    accepted_statuses,
+                                    parse_response,
+                                    conditional_key=conditional_key,
+                                )
+                        finally:
+                            if metrics is not None:
+                                metrics.record_request(
+                                    CookidooRequestMetrics(
+                                        operation=operation,
+                                        method=method.upper(),
+                                        status=r.status,
+                                        bytes_received=len(body),
+                                        wait=sent - start,
+                                        connect=received - sent,
+                                        transfer=read - received,
+                                        decode=time.perf_counter() - read,
+                                    )
+                                )
+
+            except (
+                CookidooAuthException,
+                CookidooRequestException,
+                CookidooParseException,
+            ):
+                raise
+            except (TimeoutError, ClientConnectionError) as e:
+                if not (can_retry and policy.retry_on_timeout):
                     _LOGGER.debug(
-                        "Exception: Cannot parse %s response:\n%s",
-                        operation,
-                        traceback.format_exc(),
+                        "Exception: Cannot %s:\n%s", operation, traceback.format_exc()
                     )
-                    raise CookidooParseException(
-                        f"{operation.capitalize()} failed during parsing of request response."
+                    reason = (
+                        "connection timeout"
+                        if isinstance(e, TimeoutError)
+                        else "request exception"
+                    )
+                    raise CookidooRequestException(
+                        f"{operation.capitalize()} failed due to {reason}."
                     ) from e
-                else:
-                    return result
+                retry_delay = policy.backoff(attempt)
+            except ClientError as e:
+                _LOGGER.debug(
+                    "Exception: Cannot %s:\n%s", operation, traceback.format_exc()
+                )
+                raise CookidooRequestException(
+                    f"{operation.capitalize()} failed due to request exception."
+                ) from e
 
-        except (
-            CookidooAuthException,
-            CookidooRequestException,
-            CookidooParseException,
-        ):
-            raise
-        except TimeoutError as e:
             _LOGGER.debug(
-                "Exception: Cannot %s:\n%s", operation, traceback.format_exc()
+                "Retrying %s (attempt %s) in %.2fs", operation, attempt + 1, retry_delay
             )
-            raise CookidooRequestException(
-                f"{operation.capitalize()} failed due to connection timeout."
-            ) from e
-        except ClientError as e:
+            if metrics is not None:
+                metrics.record_retry(operation)
+            await asyncio.sleep(retry_delay)
+
+    def _unconditional_headers(
+        self,
+        status: int,
+        headers: dict[str, str],
+        conditional_key: ConditionalKey | None,
+    ) -> dict[str, str] | None:
+        """Get the headers to send a request again when its cached body was dropped.
+
+        A 304 response arriving after other polled resources dropped the
+        cached body cannot be resolved, the request is sent again without
+        validators to load the resource.
+        """
+        if (
+            conditional_key is None
+            or self._conditional_cache is None
+            or not self._conditional_cache.is_dropped(conditional_key, status)
+        ):
+            return None
+        unconditional = ConditionalCache.without_validators(headers)
+        # Without validators sent, a 304 is not retried over and over
+        return unconditional if unconditional != headers else None
+
+    async def _throttle(self, url: URL | str) -> None:
+        """Wait for the rate limiter to allow a request to the url's host."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(URL(url).host or "")
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold one of the concurrency slots while a request is in flight."""
+        self._queued_requests += 1
+        try:
+            if self._concurrency is not None:
+                await self._concurrency.acquire()
+        finally:
+            self._queued_requests -= 1
+        self._in_flight_requests += 1
+        try:
+            yield
+        finally:
+            self._in_flight_requests -= 1
+            if self._concurrency is not None:
+                self._concurrency.release()
+
+    def _handle_response(
+        self,
+        r: ClientResponse,
+        body: bytes,
+        operation: str,
+        accepted_statuses: tuple[HTTPStatus, ...],
+        parse_response: bool,
+        *,
+        conditional_key: ConditionalKey | None = None,
+    ) -> object | None:
+        """Check the status of a read response and decode its body."""
+        if r.status == HTTPStatus.UNAUTHORIZED:
+            try:
+                errmsg = self._decode_json(body)
+            except ValueError:
+                _LOGGER.debug(
+                    "Exception: Cannot parse request response:\n %s",
+                    traceback.format_exc(),
+                )
+            else:
+                _LOGGER.debug(
+                    "Exception: Cannot %s: %s",
+                    operation,
+                    errmsg.get("error_description", "")
+                    if isinstance(errmsg, Mapping)
+                    else "",
+                )
+            self._raise_auth_exception(operation)
+
+        if r.status not in accepted_statuses:
+            r.raise_for_status()
+
+        if conditional_key is not None and self._conditional_cache is not None:
+            return self._conditional_cache.resolve(
+                conditional_key,
+                r.status,
+                r.headers,
+                body,
+                partial(self._parse_body, body, operation),
+            )
+        if r.status == HTTPStatus.NO_CONTENT:
+            return None
+        if not parse_response:
+            return None
+        return self._parse_body(body, operation)
+
+    def _parse_body(self, body: bytes, operation: str) -> object | None:
+        """Decode a response body or raise the standard parse exception."""
+        try:
+            result: object = self._decode_json(body)
+        except ValueError as e:
             _LOGGER.debug(
-                "Exception: Cannot %s:\n%s", operation, traceback.format_exc()
+                "Exception: Cannot parse %s response:\n%s",
+                operation,
+                traceback.format_exc(),
             )
-            raise CookidooRequestException(
-                f"{operation.capitalize()} failed due to request exception."
+            raise CookidooParseException(
+                f"{operation.capitalize()} failed during parsing of request response."
             ) from e
+        else:
+            return result
+
+    def _decode_json(self, body: bytes) -> object | None:
+        """Decode a raw response body, an empty body decodes to ``None``."""
+        if not body.strip():
+            return None
+        return self._json_codec.loads(body)
+
+    def _format_body_for_log(self, body: bytes) -> str:
+        """Decode a response body for the debug log, capped at the log limit."""
+        if self._log_body_limit is None or len(body) <= self._log_body_limit:
+            return body.decode("utf-8", errors="replace")
+        return (
+            body[: self._log_body_limit].decode("utf-8", errors="replace")
+            + f"... ({len(body)} bytes)"
+        )
 
     @staticmethod
     def _raise_auth_exception(operation: str) -> None:
@@ -301,9 +772,19 @@ class Cookidoo:
             )
         return result
 
-    @staticmethod
-    def _parse_result(operation: str, parser: Callable[[], _T]) -> _T:
+    def _parse_result(self, operation: str, parser: Callable[[], _T]) -> _T:
         """Convert a validated JSON response into public types."""
+        if self._metrics is None:
+            return self._convert(operation, parser)
+        start = time.perf_counter()
+        try:
+            return self._convert(operation, parser)
+        finally:
+            self._metrics.record_conversion(operation, time.perf_counter() - start)
+
+    @staticmethod
+    def _convert(operation: str, parser: Callable[[], _T]) -> _T:
+        """Run a conversion, raising the standard parse exception on failure."""
         try:
             return parser()
         except (KeyError, TypeError, ValueError) as e:
@@ -354,15 +835,16 @@ class Cookidoo:
 
         """
         language = self._cfg.localization.language
-        login_path = LOGIN_PATH.format(language=language)
         redirect = LOGIN_REDIRECT.format(language=language)
+        succeeded = False
         login_url = URL(
-            str(self.api_endpoint / login_path) + f"?redirectAfterLogin={redirect}",
+            str(self._url(LOGIN_PATH)) + f"?redirectAfterLogin={redirect}",
             encoded=True,
         )
 
         try:
             # Step 1: Follow redirect chain to reach the CIAM login page
+            await self._throttle(login_url)
             async with self._session.get(
                 login_url, allow_redirects=True, headers=LOGIN_HEADERS
             ) as resp:
@@ -378,6 +860,7 @@ class Cookidoo:
                 "username": self._cfg.email,
                 "password": self._cfg.password,
             }
+            await self._throttle(CIAM_LOGIN_SRV_URL)
             async with self._session.post(
                 CIAM_LOGIN_SRV_URL,
                 data=login_data,
@@ -393,6 +876,8 @@ class Cookidoo:
             # Step 4: Verify authentication cookies were set
             self._verify_auth_cookies()
             self._logged_in = True
+            self._login_failed = False
+            succeeded = True
 
         except CookidooAuthException:
             raise
@@ -408,6 +893,9 @@ class Cookidoo:
             raise CookidooRequestException(
                 "Authentication failed due to request exception."
             ) from e
+        finally:
+            if self._metrics is not None:
+                self._metrics.record_login(succeeded)
 
     @staticmethod
     def _check_login_page_status(status: int) -> None:
@@ -438,6 +926,9 @@ class Cookidoo:
         cookie_names = {c.key for c in self._session.cookie_jar}
         required_cookies = {"_oauth2_proxy", "v-authenticated"}
         if not required_cookies.issubset(cookie_names):
+            # Only invalid credentials stop the automatic logins, failures to
+            # reach the login page are retried with the next request
+            self._login_failed = True
             raise CookidooAuthException(
                 "Login failed: authentication cookies were not set. "
                 "Please check your email and password."
@@ -519,9 +1010,7 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / COMMUNITY_PROFILE_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(COMMUNITY_PROFILE_PATH)
         result = self._ensure_mapping(
             await self._request_json("get", url, "loading user info"),
             "loading user info",
@@ -552,9 +1041,7 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / SUBSCRIPTIONS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(SUBSCRIPTIONS_PATH)
         subscriptions = self._ensure_sequence(
             await self._request_json("get", url, "loading active subscription"),
             "loading active subscription",
@@ -604,17 +1091,138 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / RECIPE_PATH.format(
-            **self._cfg.localization.__dict__, id=id
-        )
-        result = self._ensure_mapping(
-            await self._request_json("get", url, "loading recipe details"),
-            "loading recipe details",
+        return await self._cached(
+            "get_recipe_details", id, partial(self._load_recipe_details, id)
         )
+
+    async def _load_recipe_details(self, id: str) -> CookidooShoppingRecipeDetails:
+        """Load recipe details bypassing the result cache."""
+        language = self._cfg.localization.language
+        body: bytes | None = None
+        if self._recipe_cache is not None:
+            body = await self._recipe_cache.get(language, id)
+            if self._metrics is not None:
+                self._metrics.record_cache(
+                    "recipe", "get_recipe_details", body is not None
+                )
+        if body is not None:
+            try:
+                return self._parse_recipe_details(
+                    self._parse_body(body, "loading recipe details")
+                )
+            except CookidooParseException:
+                # Stored by an incompatible version, load it again
+                _LOGGER.debug(
+                    "Exception: Cannot parse cached recipe details:\n%s",
+                    traceback.format_exc(),
+                )
+
+        url = self._url(RECIPE_PATH, id=id)
+        result = await self._request_json("get", url, "loading recipe details")
+        details = self._parse_recipe_details(result)
+        if self._recipe_cache is not None:
+            await self._recipe_cache.put(language, id, self._json_codec.dumps(result))
+        return details
+
+    async def get_recipe_details_many(
+        self, ids: Iterable[str], *, concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> CookidooRecipeDetailsBatch:
+        """Get the details of many recipes.
+
+        Duplicate ids are loaded once, the recipes are loaded with at most
+        ``concurrency`` requests in flight. A recipe which cannot be loaded
+        does not fail the others, its exception is reported in the failures.
+
+        Parameters
+        ----------
+        ids
+            The ids of the recipes
+        concurrency
+            The maximum number of recipes loaded at once
+
+        Returns
+        -------
+        CookidooRecipeDetailsBatch
+            The recipe details and failures, in the order of the ids
+
+        Raises
+        ------
+        CookidooConfigException
+            If the concurrency is not positive.
+
+        """
+        ids = list(dict.fromkeys(ids))
+        loaded = {
+            id: result
+            async for id, result in self.iter_recipe_details(
+                ids, concurrency=concurrency
+            )
+        }
+        batch = CookidooRecipeDetailsBatch(recipes={}, failures={})
+        for id in ids:
+            result = loaded[id]
+            if isinstance(result, CookidooException):
+                batch.failures[id] = result
+            else:
+                batch.recipes[id] = result
+        return batch
+
+    async def iter_recipe_details(
+        self, ids: Iterable[str], *, concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> AsyncGenerator[tuple[str, CookidooShoppingRecipeDetails | CookidooException]]:
+        """Get the details of many recipes as they are loaded.
+
+        Duplicate ids are loaded once, the recipes are loaded with at most
+        ``concurrency`` requests in flight. When the iterator is closed
+        early, e.g. with ``contextlib.aclosing``, the requests in flight are
+        cancelled.
+
+        Parameters
+        ----------
+        ids
+            The ids of the recipes
+        concurrency
+            The maximum number of recipes loaded at once
+
+        Yields
+        ------
+        tuple[str, CookidooShoppingRecipeDetails | CookidooException]
+            The id and the recipe details, or the exception raised loading
+            them, in the order they complete
+
+        Raises
+        ------
+        CookidooConfigException
+            If the concurrency is not positive.
+
+        """
+        if concurrency < 1:
+            raise CookidooConfigException("Concurrency must be positive.")
+        calls = (
+            partial(self._recipe_details_or_exception, id) for id in dict.fromkeys(ids)
+        )
+        async with aclosing(completed(calls, concurrency)) as results:
+            async for result in results:
+                yield result
+
+    async def _recipe_details_or_exception(
+        self, id: str
+    ) -> tuple[str, CookidooShoppingRecipeDetails | CookidooException]:
+        """Get recipe details, returning the exception if they cannot be loaded."""
+        try:
+            return id, await self.get_recipe_details(id)
+        except CookidooException as e:
+            return id, e
+
+    def _parse_recipe_details(
+        self, result: object | None
+    ) -> CookidooShoppingRecipeDetails:
+        """Convert a recipe details response into public types."""
+        recipe = self._ensure_mapping(result, "loading recipe details")
         return self._parse_result(
             "loading recipe details",
             lambda: cookidoo_recipe_details_from_json(
-                cast(RecipeDetailsJSON, result),
+                cast(RecipeDetailsJSON, recipe),
                 self._cfg.localization,
             ),
         )
@@ -745,6 +1353,16 @@ class Cookidoo:
             params["pageSize"] = str(page_size)
         if tmv is not None and (normalized := normalize_tmv_param(tmv)):
             params["tmv"] = normalized
+        return await self._cached(
+            "search_recipes",
+            (str(url), tuple(sorted(params.items()))),
+            partial(self._load_search_result, url, params),
+        )
+
+    async def _load_search_result(
+        self, url: URL, params: dict[str, str]
+    ) -> CookidooSearchResult:
+        """Load a search result bypassing the result cache."""
         result = await self._request_json("get", url, "search recipes", params=params)
         if result is None:
             return CookidooSearchResult(recipes=[], total=0)
@@ -752,9 +1370,138 @@ class Cookidoo:
             raise CookidooParseException(
                 "Search recipes failed during parsing of request response."
             )
-        return cookidoo_search_result_from_json(
-            cast(SearchResultJSON, result), self._cfg.localization
+        return self._parse_result(
+            "search recipes",
+            lambda: cookidoo_search_result_from_json(
+                cast(SearchResultJSON, result), self._cfg.localization
+            ),
+        )
+
+    async def search_recipes_iter(
+        self,
+        query: str | None = None,
+        *,
+        locale: str | None = None,
+        accessories: str | list[str] | None = None,
+        languages: str | list[str] | None = None,
+        categories: str | list[str] | None = None,
+        countries: str | list[str] | None = None,
+        ingredients: str | list[str] | None = None,
+        exclude_ingredients: str | list[str] | None = None,
+        tags: str | list[str] | None = None,
+        ratings: str | list[str] | None = None,
+        difficulty: str | None = None,
+        preparation_time: int | None = None,
+        total_time: int | None = None,
+        portions: int | None = None,
+        page: int = 0,
+        page_size: int | None = None,
+        tmv: ThermomixMachineType
+        | str
+        | list[ThermomixMachineType | str]
+        | None = None,
+        limit: int | None = None,
+        window: int = DEFAULT_PREFETCH_WINDOW,
+    ) -> AsyncGenerator[CookidooSearchRecipeHit]:
+        """Search recipes in Cookidoo across all pages.
+
+        The number of pages is derived from the total and the page size of
+        the first page, the other pages are loaded concurrently, at most
+        ``window`` pages ahead of the consumer. Hits repeated on a later page
+        are skipped. When the iterator is closed early, e.g. with
+        ``contextlib.aclosing``, the requests in flight are cancelled.
+
+        Parameters
+        ----------
+        query
+            Optional search query, see ``search_recipes``.
+        locale, accessories, languages, categories, countries, ingredients
+            Optional search filters, see ``search_recipes``.
+        exclude_ingredients, tags, ratings, difficulty, preparation_time
+            Optional search filters, see ``search_recipes``.
+        total_time, portions, tmv
+            Optional search filters, see ``search_recipes``.
+        page
+            The page to start from.
+        page_size
+            Optional page size, defaults to the page size of the API.
+        limit
+            Optional maximum number of hits, defaults to the total.
+        window
+            The maximum number of pages loaded ahead of the consumer.
+
+        Yields
+        ------
+        CookidooSearchRecipeHit
+            The recipe hits, in the order of the pages.
+
+        Raises
+        ------
+        CookidooConfigException
+            If the window is not positive.
+        CookidooAuthException
+            When the access token is not valid anymore.
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        if window < 1:
+            raise CookidooConfigException("Prefetch window must be positive.")
+        search = partial(
+            self.search_recipes,
+            query,
+            locale=locale,
+            accessories=accessories,
+            languages=languages,
+            categories=categories,
+            countries=countries,
+            ingredients=ingredients,
+            exclude_ingredients=exclude_ingredients,
+            tags=tags,
+            ratings=ratings,
+            difficulty=difficulty,
+            preparation_time=preparation_time,
+            total_time=total_time,
+            portions=portions,
+            page_size=page_size,
+            tmv=tmv,
+        )
+        first = await search(page=page)
+        if not first.recipes:
+            return
+        size = page_size or len(first.recipes)
+        # The hits from the first page on, the total counts the hits of all pages
+        total = first.total - page * size
+        if limit is not None:
+            total = min(total, limit)
+        if total <= 0:
+            return
+        pages = math.ceil(total / size)
+
+        async def load_first() -> CookidooSearchResult:
+            return first
+
+        calls: Iterable[Callable[[], Awaitable[CookidooSearchResult]]] = chain(
+            (load_first,),
+            (
+                partial(search, page=next_page)
+                for next_page in range(page + 1, page + pages)
+            ),
         )
+        seen: set[str] = set()
+        async with aclosing(prefetch(calls, window)) as results:
+            async for result in results:
+                if not result.recipes:
+                    return
+                for hit in result.recipes:
+                    if hit.id in seen:
+                        continue
+                    seen.add(hit.id)
+                    yield hit
+                    if len(seen) >= total:
+                        return
 
     async def get_custom_recipe(self, id: str) -> CookidooCustomRecipe:
         """Get custom recipe.
@@ -780,9 +1527,13 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / CUSTOM_RECIPE_PATH.format(
-            **self._cfg.localization.__dict__, id=id
+        return await self._cached(
+            "get_custom_recipe", id, partial(self._load_custom_recipe, id)
         )
+
+    async def _load_custom_recipe(self, id: str) -> CookidooCustomRecipe:
+        """Load a custom recipe bypassing the result cache."""
+        url = self._url(CUSTOM_RECIPE_PATH, id=id)
         result = self._ensure_mapping(
             await self._request_json("get", url, "loading custom recipe"),
             "loading custom recipe",
@@ -797,9 +1548,7 @@ class Cookidoo:
 
     async def list_custom_recipes(self) -> list[CookidooCustomRecipe]:
         """List custom recipes."""
-        url = self.api_endpoint / CUSTOM_RECIPES_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(CUSTOM_RECIPES_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "get",
@@ -851,15 +1600,10 @@ class Cookidoo:
 
         """
         json_data = {
-            "recipeUrl": str(
-                self.api_endpoint
-                / RECIPE_PATH.format(**self._cfg.localization.__dict__, id=recipeId)
-            ),
+            "recipeUrl": str(self._url(RECIPE_PATH, id=recipeId)),
             "servingSize": servingSize,
         }
-        url = self.api_endpoint / ADD_CUSTOM_RECIPE_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(ADD_CUSTOM_RECIPE_PATH)
         result = self._ensure_mapping(
             await self._request_json("post", url, "add custom recipe", json=json_data),
             "add custom recipe",
@@ -893,18 +1637,135 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / REMOVE_CUSTOM_RECIPE_PATH.format(
-            **self._cfg.localization.__dict__, id=custom_recipe_id
-        )
+        url = self._url(REMOVE_CUSTOM_RECIPE_PATH, id=custom_recipe_id)
         await self._request_json(
             "delete", url, "remove custom recipe", parse_response=False
         )
+        await self._invalidate("get_custom_recipe", custom_recipe_id)
+
+    async def _cached(
+        self, method: str, key: Hashable, load: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Get a result from the result cache, loading it on a miss."""
+        if self._result_cache is None:
+            return await load()
+        # Results are localized, keep them apart when the localization changes
+        key = (self._cfg.localization.language, key)
+        cached = self._result_cache.get(method, key)
+        if self._metrics is not None:
+            self._metrics.record_cache("result", method, cached is not None)
+        if cached is not None:
+            return cast(_T, cached)
+        result = await load()
+        self._result_cache.put(method, key, result)
+        return result
+
+    async def _invalidate(self, method: str, key: Hashable | None = None) -> None:
+        """Drop results affected by a mutation from the result cache."""
+        if self._result_cache is not None:
+            self._result_cache.invalidate(
+                method, None if key is None else (self._cfg.localization.language, key)
+            )
+
+    async def _invalidate_recipe_details(
+        self, recipe_ids: Sequence[str] = (), *, collection_id: str | None = None
+    ) -> None:
+        """Drop the recipe details affected by a collection change from the caches.
+
+        Recipe details list the collections containing the recipe. The recipes
+        of a removed collection are not known, so the stored recipe details
+        listing it are dropped instead.
+        """
+        if collection_id is not None:
+            await self._invalidate("get_recipe_details")
+        for recipe_id in recipe_ids:
+            await self._invalidate("get_recipe_details", recipe_id)
+        language = self._cfg.localization.language
+        if self._recipe_cache is not None:
+            if collection_id is not None:
+                await self._recipe_cache.invalidate_collection(language, collection_id)
+            for recipe_id in recipe_ids:
+                await self._recipe_cache.invalidate(language, recipe_id)
+
+    async def _request_polled(
+        self,
+        url: URL,
+        operation: str,
+        parser: Callable[[object | None], _T],
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> _T:
+        """Load a polled resource, reusing its parsed result while unchanged."""
+        result = await self._request_json(
+            "get", url, operation, params=params, headers=headers, conditional=True
+        )
+        if self._conditional_cache is None:
+            return parser(result)
+        return self._conditional_cache.convert(
+            ConditionalCache.key(url, params, headers), operation, result, parser
+        )
+
+    async def _get_shopping_list(
+        self, operation: str, parser: Callable[[ShoppingListJSON], _T]
+    ) -> _T:
+        """Load and parse the shopping list, shared by all shopping list getters."""
+        url = self._url(SHOPPING_LIST_PATH)
+        return await self._request_polled(
+            url,
+            operation,
+            lambda result: self._parse_result(
+                operation,
+                lambda: parser(
+                    cast(ShoppingListJSON, self._ensure_mapping(result, operation))
+                ),
+            ),
+        )
+
+    async def get_shopping_list(
+        self,
+    ) -> CookidooShoppingList:
+        """Get the shopping list with recipes, ingredient items and additional items.
+
+        The shopping list is loaded with a single request, prefer this over
+        calling ``get_shopping_list_recipes``, ``get_ingredient_items`` and
+        ``get_additional_items`` one after another. These getters read their
+        part from the returned shopping list when it is passed to them.
+
+        Returns
+        -------
+        CookidooShoppingList
+            The shopping list
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        return await self._get_shopping_list(
+            "loading shopping list",
+            lambda result: cookidoo_shopping_list_from_json(
+                result, self._cfg.localization
+            ),
+        )
 
     async def get_shopping_list_recipes(
         self,
+        shopping_list: CookidooShoppingList | None = None,
     ) -> list[CookidooShoppingRecipe]:
         """Get recipes.
 
+        Parameters
+        ----------
+        shopping_list
+            A shopping list loaded with ``get_shopping_list`` to read the
+            recipes from instead of loading them
+
         Returns
         -------
         list[CookidooShoppingRecipe]
@@ -920,32 +1781,27 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-
-        url = self.api_endpoint / SHOPPING_LIST_RECIPES_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json("get", url, "loading recipes"),
+        if shopping_list is not None:
+            return list(shopping_list.recipes)
+        return await self._get_shopping_list(
             "loading recipes",
-        )
-        return self._parse_result(
-            "loading recipes",
-            lambda: [
-                cookidoo_recipe_from_json(
-                    cast(RecipeJSON, recipe), self._cfg.localization
-                )
-                for recipe in [
-                    *cast(Sequence[object], result["recipes"]),
-                    *cast(Sequence[object], result["customerRecipes"]),
-                ]
-            ],
+            lambda result: cookidoo_shopping_list_recipes_from_json(
+                result, self._cfg.localization
+            ),
         )
 
     async def get_ingredient_items(
         self,
+        shopping_list: CookidooShoppingList | None = None,
     ) -> list[CookidooIngredientItem]:
         """Get ingredient items.
 
+        Parameters
+        ----------
+        shopping_list
+            A shopping list loaded with ``get_shopping_list`` to read the
+            ingredient items from instead of loading them
+
         Returns
         -------
         list[CookidooIngredientItem]
@@ -961,26 +1817,11 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-
-        url = self.api_endpoint / INGREDIENT_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json("get", url, "loading ingredient items"),
-            "loading ingredient items",
-        )
-        return self._parse_result(
+        if shopping_list is not None:
+            return list(shopping_list.ingredient_items)
+        return await self._get_shopping_list(
             "loading ingredient items",
-            lambda: [
-                cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
-                for recipe in [
-                    *cast(Sequence[Mapping[str, object]], result["recipes"]),
-                    *cast(Sequence[Mapping[str, object]], result["customerRecipes"]),
-                ]
-                for ingredient in cast(
-                    Sequence[object], recipe["recipeIngredientGroups"]
-                )
-            ],
+            cookidoo_shopping_list_ingredient_items_from_json,
         )
 
     async def add_ingredient_items_for_recipes(
@@ -989,6 +1830,10 @@ class Cookidoo:
     ) -> list[CookidooIngredientItem]:
         """Add ingredient items for recipes.
 
+        With a ``batch_window``, calls arriving within the window are merged
+        into a single request and the added ingredient items are split back
+        to the calls by recipe id.
+
         Parameters
         ----------
         recipe_ids
@@ -1009,27 +1854,53 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        json_data = {"recipeIDs": recipe_ids}
-        url = self.api_endpoint / ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json(
-                "post", url, "add ingredient items for recipes", json=json_data
-            ),
-            "add ingredient items for recipes",
-        )
+        recipes: Sequence[object]
+        if self._recipes_batcher is not None:
+            recipes = await self._recipes_batcher.submit(recipe_ids)
+        else:
+            recipes = await self._add_shopping_list_recipes(
+                recipe_ids, "add ingredient items for recipes"
+            )
         return self._parse_result(
             "loading added ingredient items",
             lambda: [
                 cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
-                for recipe in cast(Sequence[Mapping[str, object]], result["data"])
+                for recipe in cast(Sequence[Mapping[str, object]], recipes)
                 for ingredient in cast(
                     Sequence[object], recipe["recipeIngredientGroups"]
                 )
             ],
         )
 
+    async def _add_recipes_batch(
+        self, recipe_ids: list[str]
+    ) -> list[tuple[str, object]]:
+        """Add the ingredient items of a batch of recipes, keyed by recipe id."""
+        recipes = await self._add_shopping_list_recipes(
+            recipe_ids, "add ingredient items for recipes"
+        )
+        return self._parse_result(
+            "loading added ingredient items",
+            lambda: [
+                (cast(Mapping[str, str], recipe)["id"], recipe) for recipe in recipes
+            ],
+        )
+
+    async def _add_shopping_list_recipes(
+        self, recipe_ids: Sequence[object], operation: str
+    ) -> Sequence[object]:
+        """Add the ingredient items of recipes, returning the added recipes."""
+        json_data = {"recipeIDs": recipe_ids}
+        url = self._url(ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH)
+        result = self._ensure_mapping(
+            await self._request_json("post", url, operation, json=json_data),
+            operation,
+        )
+        return self._parse_result(
+            "loading added ingredient items",
+            lambda: cast(Sequence[object], result["data"]),
+        )
+
     async def remove_ingredient_items_for_recipes(
         self,
         recipe_ids: list[str],
@@ -1052,9 +1923,7 @@ class Cookidoo:
 
         """
         json_data = {"recipeIDs": recipe_ids}
-        url = self.api_endpoint / REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH)
         await self._request_json(
             "post",
             url,
@@ -1099,9 +1968,7 @@ class Cookidoo:
                 for ingredient_item in ingredient_items
             ]
         }
-        url = self.api_endpoint / EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "post", url, "edit ingredient items ownership", json=json_data
@@ -1142,25 +2009,15 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        json_data = {
-            "recipeIDs": [
-                {"id": recipe_id, "source": "CUSTOMER"} for recipe_id in recipe_ids
-            ]
-        }
-        url = self.api_endpoint / ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json(
-                "post", url, "add ingredient items for custom recipes", json=json_data
-            ),
+        recipes = await self._add_shopping_list_recipes(
+            [{"id": recipe_id, "source": "CUSTOMER"} for recipe_id in recipe_ids],
             "add ingredient items for custom recipes",
         )
         return self._parse_result(
             "loading added ingredient items",
             lambda: [
                 cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
-                for recipe in cast(Sequence[Mapping[str, object]], result["data"])
+                for recipe in cast(Sequence[Mapping[str, object]], recipes)
                 for ingredient in cast(
                     Sequence[object], recipe["recipeIngredientGroups"]
                 )
@@ -1189,9 +2046,7 @@ class Cookidoo:
 
         """
         json_data = {"recipeIDs": recipe_ids}
-        url = self.api_endpoint / REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH)
         await self._request_json(
             "post",
             url,
@@ -1202,9 +2057,16 @@ class Cookidoo:
 
     async def get_additional_items(
         self,
+        shopping_list: CookidooShoppingList | None = None,
     ) -> list[CookidooAdditionalItem]:
         """Get additional items.
 
+        Parameters
+        ----------
+        shopping_list
+            A shopping list loaded with ``get_shopping_list`` to read the
+            additional items from instead of loading them
+
         Returns
         -------
         list[CookidooAdditionalItem]
@@ -1220,22 +2082,11 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-
-        url = self.api_endpoint / ADDITIONAL_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json("get", url, "loading additional items"),
+        if shopping_list is not None:
+            return list(shopping_list.additional_items)
+        return await self._get_shopping_list(
             "loading additional items",
-        )
-        return self._parse_result(
-            "loading additional items",
-            lambda: [
-                cookidoo_additional_item_from_json(
-                    cast(AdditionalItemJSON, additional_item)
-                )
-                for additional_item in cast(Sequence[object], result["additionalItems"])
-            ],
+            cookidoo_shopping_list_additional_items_from_json,
         )
 
     async def add_additional_items(
@@ -1244,6 +2095,10 @@ class Cookidoo:
     ) -> list[CookidooAdditionalItem]:
         """Create additional items.
 
+        With a ``batch_window``, calls arriving within the window are merged
+        into a single request and the added additional items are split back
+        to the calls in the order of the names.
+
         Parameters
         ----------
         additional_item_names
@@ -1264,10 +2119,28 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        json_data = {"itemsValue": additional_item_names}
-        url = self.api_endpoint / ADD_ADDITIONAL_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
+        if self._additional_items_batcher is not None:
+            return await self._additional_items_batcher.submit(additional_item_names)
+        return await self._add_additional_items(additional_item_names)
+
+    async def _add_additional_items_batch(
+        self, additional_item_names: list[str]
+    ) -> list[tuple[str, CookidooAdditionalItem]]:
+        """Create a batch of additional items, paired with their names."""
+        additional_items = await self._add_additional_items(additional_item_names)
+        # Paired by position, the server may trim or re-case the names but adds
+        # the items in the order of the names sent
+        return self._convert(
+            "loading added additional items",
+            lambda: list(zip(additional_item_names, additional_items, strict=True)),
         )
+
+    async def _add_additional_items(
+        self, additional_item_names: list[str]
+    ) -> list[CookidooAdditionalItem]:
+        """Create additional items with a single request."""
+        json_data = {"itemsValue": additional_item_names}
+        url = self._url(ADD_ADDITIONAL_ITEMS_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "post", url, "add additional items", json=json_data
@@ -1319,9 +2192,7 @@ class Cookidoo:
                 for additional_item in additional_items
             ]
         }
-        url = self.api_endpoint / EDIT_ADDITIONAL_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(EDIT_ADDITIONAL_ITEMS_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "post", url, "edit additional items", json=json_data
@@ -1374,9 +2245,7 @@ class Cookidoo:
                 for additional_item in additional_items
             ]
         }
-        url = self.api_endpoint / EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "post", url, "edit additional items ownership", json=json_data
@@ -1415,9 +2284,7 @@ class Cookidoo:
 
         """
         json_data = {"additionalItemIDs": additional_item_ids}
-        url = self.api_endpoint / REMOVE_ADDITIONAL_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(REMOVE_ADDITIONAL_ITEMS_PATH)
         await self._request_json(
             "post",
             url,
@@ -1441,13 +2308,224 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / INGREDIENT_ITEMS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(INGREDIENT_ITEMS_PATH)
         await self._request_json(
             "delete", url, "clear shopping list", parse_response=False
         )
 
+    async def sync_shopping_list(
+        self, plan: CookidooShoppingListPlan
+    ) -> CookidooShoppingList:
+        """Make the shopping list match a plan.
+
+        The shopping list is loaded once and compared with the plan. Each kind
+        of change is sent as a single request, the independent requests are
+        sent concurrently. Additional items not in the plan are renamed to the
+        missing names before any is removed or added. Added additional items
+        owned in the plan are marked as owned once added, as the API adds them
+        as not owned.
+
+        Parameters
+        ----------
+        plan
+            The recipes, ownership of ingredient items and additional items to
+            have on the shopping list
+
+        Returns
+        -------
+        CookidooShoppingList
+            The shopping list after the changes
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        recipes, custom_recipes, additional_items = await self._get_shopping_list(
+            "sync shopping list",
+            lambda result: (
+                self._shopping_list_recipes(result["recipes"]),
+                self._shopping_list_recipes(result["customerRecipes"]),
+                cookidoo_shopping_list_additional_items_from_json(result),
+            ),
+        )
+
+        planned_recipe_ids = set(plan.recipe_ids)
+        planned_custom_recipe_ids = set(plan.custom_recipe_ids)
+        kept_recipes = [
+            recipe for recipe in recipes if recipe[0].id in planned_recipe_ids
+        ]
+        kept_custom_recipes = [
+            recipe
+            for recipe in custom_recipes
+            if recipe[0].id in planned_custom_recipe_ids
+        ]
+        # Custom recipes are removed the same way as recipes
+        removed_recipe_ids = [
+            recipe.id
+            for recipe, _ in [*recipes, *custom_recipes]
+            if recipe.id not in planned_recipe_ids | planned_custom_recipe_ids
+        ]
+        added_recipe_ids = [
+            recipe_id
+            for recipe_id in dict.fromkeys(plan.recipe_ids)
+            if recipe_id not in {recipe.id for recipe, _ in recipes}
+        ]
+        added_custom_recipe_ids = [
+            recipe_id
+            for recipe_id in dict.fromkeys(plan.custom_recipe_ids)
+            if recipe_id not in {recipe.id for recipe, _ in custom_recipes}
+        ]
+        owned_ingredient_items = {
+            item.id: replace(item, is_owned=plan.ingredient_items_ownership[item.id])
+            for _, items in [*kept_recipes, *kept_custom_recipes]
+            for item in items
+            if plan.ingredient_items_ownership.get(item.id, item.is_owned)
+            != item.is_owned
+        }
+
+        kept_items: dict[str, CookidooAdditionalItem] = {}
+        unplanned_items: list[CookidooAdditionalItem] = []
+        for item in additional_items:
+            if item.name in plan.additional_items and item.name not in kept_items:
+                kept_items[item.name] = item
+            else:
+                unplanned_items.append(item)
+        missing_names = [
+            name for name in plan.additional_items if name not in kept_items
+        ]
+        renamed_items = [
+            replace(item, name=name)
+            for item, name in zip(unplanned_items, missing_names, strict=False)
+        ]
+        removed_item_ids = [item.id for item in unplanned_items[len(renamed_items) :]]
+        added_names = missing_names[len(renamed_items) :]
+        owned_items = [
+            replace(item, is_owned=plan.additional_items[item.name])
+            for item in [*kept_items.values(), *renamed_items]
+            if plan.additional_items[item.name] != item.is_owned
+        ]
+
+        async def remove_recipes() -> None:
+            if removed_recipe_ids:
+                await self.remove_ingredient_items_for_recipes(removed_recipe_ids)
+
+        async def add_recipes(
+            recipe_ids: Sequence[object], operation: str
+        ) -> list[tuple[CookidooShoppingRecipe, list[CookidooIngredientItem]]]:
+            if not recipe_ids:
+                return []
+            added = await self._add_shopping_list_recipes(recipe_ids, operation)
+            return self._parse_result(
+                "loading added ingredient items",
+                lambda: self._shopping_list_recipes(added),
+            )
+
+        async def edit_ingredient_items() -> None:
+            if owned_ingredient_items:
+                await self.edit_ingredient_items_ownership(
+                    list(owned_ingredient_items.values())
+                )
+
+        async def edit_additional_items() -> list[CookidooAdditionalItem]:
+            async def rename() -> None:
+                if renamed_items:
+                    await self.edit_additional_items(renamed_items)
+
+            async def remove() -> None:
+                if removed_item_ids:
+                    await self.remove_additional_items(removed_item_ids)
+
+            async def add() -> list[CookidooAdditionalItem]:
+                added = (
+                    await self.add_additional_items(added_names) if added_names else []
+                )
+                owned = [
+                    *owned_items,
+                    *(
+                        replace(item, is_owned=True)
+                        for item in added
+                        if plan.additional_items.get(item.name)
+                    ),
+                ]
+                if owned:
+                    await self.edit_additional_items_ownership(owned)
+                return added
+
+            _, _, added = await asyncio.gather(rename(), remove(), add())
+            return added
+
+        (
+            _,
+            added_recipes,
+            added_custom_recipes,
+            _,
+            added_items,
+        ) = await asyncio.gather(
+            remove_recipes(),
+            add_recipes(added_recipe_ids, "add ingredient items for recipes"),
+            add_recipes(
+                [
+                    {"id": recipe_id, "source": "CUSTOMER"}
+                    for recipe_id in added_custom_recipe_ids
+                ],
+                "add ingredient items for custom recipes",
+            ),
+            edit_ingredient_items(),
+            edit_additional_items(),
+        )
+
+        synced_recipes = [
+            *kept_recipes,
+            *added_recipes,
+            *kept_custom_recipes,
+            *added_custom_recipes,
+        ]
+        renamed = {item.id: item for item in renamed_items}
+        return CookidooShoppingList(
+            recipes=[recipe for recipe, _ in synced_recipes],
+            ingredient_items=[
+                owned_ingredient_items.get(item.id, item)
+                for _, items in synced_recipes
+                for item in items
+            ],
+            additional_items=[
+                replace(
+                    item, is_owned=plan.additional_items.get(item.name, item.is_owned)
+                )
+                for item in [
+                    *(
+                        renamed.get(item.id, item)
+                        for item in additional_items
+                        if item.id not in removed_item_ids
+                    ),
+                    *added_items,
+                ]
+            ],
+        )
+
+    def _shopping_list_recipes(
+        self, recipes: object
+    ) -> list[tuple[CookidooShoppingRecipe, list[CookidooIngredientItem]]]:
+        """Convert recipes on the shopping list along with their ingredient items."""
+        return [
+            (
+                cookidoo_recipe_from_json(
+                    cast(RecipeJSON, recipe), self._cfg.localization
+                ),
+                [
+                    cookidoo_ingredient_item_from_json(item)
+                    for item in cast(RecipeJSON, recipe)["recipeIngredientGroups"]
+                ],
+            )
+            for recipe in cast(Sequence[object], recipes)
+        ]
+
     async def count_managed_collections(self) -> tuple[int, int]:
         """Get managed collections.
 
@@ -1467,9 +2545,7 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / MANAGED_COLLECTIONS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(MANAGED_COLLECTIONS_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "get",
@@ -1511,27 +2587,97 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / MANAGED_COLLECTIONS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json(
-                "get",
-                url,
+        collections, _ = await self._load_managed_collections_page(page)
+        return collections
+
+    async def iter_managed_collections(
+        self, *, window: int = DEFAULT_PREFETCH_WINDOW
+    ) -> AsyncGenerator[CookidooCollection]:
+        """Iterate over the managed collections of all pages.
+
+        The number of pages is read from the first page, the other pages are
+        loaded concurrently, at most ``window`` pages ahead of the consumer.
+        When the iterator is closed early, e.g. with ``contextlib.aclosing``,
+        the requests in flight are cancelled.
+
+        Parameters
+        ----------
+        window
+            The maximum number of pages loaded ahead of the consumer
+
+        Yields
+        ------
+        CookidooCollection
+            The managed collections, in the order of the pages
+
+        Raises
+        ------
+        CookidooConfigException
+            If the window is not positive.
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        async with aclosing(
+            self._iter_pages(self._load_managed_collections_page, window)
+        ) as collections:
+            async for collection in collections:
+                yield collection
+
+    async def _load_managed_collections_page(
+        self, page: int
+    ) -> tuple[list[CookidooCollection], int]:
+        """Load a page of managed collections and the number of pages."""
+
+        def parse(result: object | None) -> tuple[list[CookidooCollection], int]:
+            response = self._ensure_mapping(result, "loading managed collections")
+            return self._parse_result(
                 "loading managed collections",
-                params={"page": str(page)},
-                headers={"ACCEPT": MANAGED_COLLECTIONS_PATH_ACCEPT},
-            ),
-            "loading managed collections",
-        )
-        return self._parse_result(
+                lambda: (
+                    [
+                        cookidoo_collection_from_json(cast(ManagedCollectionJSON, item))
+                        for item in cast(Sequence[object], response["managedlists"])
+                    ],
+                    cast(PaginationJSON, response["page"])["totalPages"],
+                ),
+            )
+
+        url = self._url(MANAGED_COLLECTIONS_PATH)
+        return await self._request_polled(
+            url,
             "loading managed collections",
-            lambda: [
-                cookidoo_collection_from_json(cast(ManagedCollectionJSON, item))
-                for item in cast(Sequence[object], result["managedlists"])
-            ],
+            parse,
+            params={"page": str(page)},
+            headers={"ACCEPT": MANAGED_COLLECTIONS_PATH_ACCEPT},
         )
 
+    async def _iter_pages(
+        self,
+        load: Callable[[int], Awaitable[tuple[list[_T], int]]],
+        window: int,
+    ) -> AsyncGenerator[_T]:
+        """Iterate over the items of all pages, prefetching the pages."""
+        if window < 1:
+            raise CookidooConfigException("Prefetch window must be positive.")
+        first = await load(0)
+
+        async def load_first() -> tuple[list[_T], int]:
+            return first
+
+        # The first page is passed through the prefetch, so the next pages are
+        # loaded while its items are consumed
+        calls: Iterable[Callable[[], Awaitable[tuple[list[_T], int]]]] = chain(
+            (load_first,), (partial(load, page) for page in range(1, first[1]))
+        )
+        async with aclosing(prefetch(calls, window)) as results:
+            async for items, _ in results:
+                for item in items:
+                    yield item
+
     async def add_managed_collection(
         self,
         managed_collection_id: str,
@@ -1559,9 +2705,7 @@ class Cookidoo:
 
         """
         json_data = {"collectionId": managed_collection_id}
-        url = self.api_endpoint / ADD_MANAGED_COLLECTION_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(ADD_MANAGED_COLLECTION_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "post",
@@ -1572,12 +2716,16 @@ class Cookidoo:
             ),
             "add managed collection",
         )
-        return self._parse_result(
+        collection = self._parse_result(
             "loading added managed collection",
             lambda: cookidoo_collection_from_json(
                 cast(ManagedCollectionJSON, result["content"])
             ),
         )
+        await self._invalidate_recipe_details(
+            [recipe.id for chapter in collection.chapters for recipe in chapter.recipes]
+        )
+        return collection
 
     async def remove_managed_collection(
         self,
@@ -1600,9 +2748,7 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / REMOVE_MANAGED_COLLECTION_PATH.format(
-            **self._cfg.localization.__dict__, id=managed_collection_id
-        )
+        url = self._url(REMOVE_MANAGED_COLLECTION_PATH, id=managed_collection_id)
         await self._request_json(
             "delete",
             url,
@@ -1610,6 +2756,7 @@ class Cookidoo:
             headers={"ACCEPT": MANAGED_COLLECTIONS_PATH_ACCEPT},
             parse_response=False,
         )
+        await self._invalidate_recipe_details(collection_id=managed_collection_id)
 
     async def count_custom_collections(self) -> tuple[int, int]:
         """Get custom collections.
@@ -1630,9 +2777,7 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / CUSTOM_COLLECTIONS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(CUSTOM_COLLECTIONS_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "get",
@@ -1674,25 +2819,72 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / CUSTOM_COLLECTIONS_PATH.format(
-            **self._cfg.localization.__dict__
-        )
-        result = self._ensure_mapping(
-            await self._request_json(
-                "get",
-                url,
+        collections, _ = await self._load_custom_collections_page(page)
+        return collections
+
+    async def iter_custom_collections(
+        self, *, window: int = DEFAULT_PREFETCH_WINDOW
+    ) -> AsyncGenerator[CookidooCollection]:
+        """Iterate over the custom collections of all pages.
+
+        The number of pages is read from the first page, the other pages are
+        loaded concurrently, at most ``window`` pages ahead of the consumer.
+        When the iterator is closed early, e.g. with ``contextlib.aclosing``,
+        the requests in flight are cancelled.
+
+        Parameters
+        ----------
+        window
+            The maximum number of pages loaded ahead of the consumer
+
+        Yields
+        ------
+        CookidooCollection
+            The custom collections, in the order of the pages
+
+        Raises
+        ------
+        CookidooConfigException
+            If the window is not positive.
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        async with aclosing(
+            self._iter_pages(self._load_custom_collections_page, window)
+        ) as collections:
+            async for collection in collections:
+                yield collection
+
+    async def _load_custom_collections_page(
+        self, page: int
+    ) -> tuple[list[CookidooCollection], int]:
+        """Load a page of custom collections and the number of pages."""
+
+        def parse(result: object | None) -> tuple[list[CookidooCollection], int]:
+            response = self._ensure_mapping(result, "loading custom collections")
+            return self._parse_result(
                 "loading custom collections",
-                params={"page": str(page)},
-                headers={"ACCEPT": CUSTOM_COLLECTIONS_PATH_ACCEPT},
-            ),
-            "loading custom collections",
-        )
-        return self._parse_result(
+                lambda: (
+                    [
+                        cookidoo_collection_from_json(cast(CustomCollectionJSON, item))
+                        for item in cast(Sequence[object], response["customlists"])
+                    ],
+                    cast(PaginationJSON, response["page"])["totalPages"],
+                ),
+            )
+
+        url = self._url(CUSTOM_COLLECTIONS_PATH)
+        return await self._request_polled(
+            url,
             "loading custom collections",
-            lambda: [
-                cookidoo_collection_from_json(cast(CustomCollectionJSON, item))
-                for item in cast(Sequence[object], result["customlists"])
-            ],
+            parse,
+            params={"page": str(page)},
+            headers={"ACCEPT": CUSTOM_COLLECTIONS_PATH_ACCEPT},
         )
 
     async def add_custom_collection(
@@ -1722,9 +2914,7 @@ class Cookidoo:
 
         """
         json_data = {"title": custom_collection_name}
-        url = self.api_endpoint / ADD_CUSTOM_COLLECTION_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(ADD_CUSTOM_COLLECTION_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "post",
@@ -1763,9 +2953,7 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / REMOVE_CUSTOM_COLLECTION_PATH.format(
-            **self._cfg.localization.__dict__, id=custom_collection_id
-        )
+        url = self._url(REMOVE_CUSTOM_COLLECTION_PATH, id=custom_collection_id)
         await self._request_json(
             "delete",
             url,
@@ -1773,6 +2961,7 @@ class Cookidoo:
             headers={"ACCEPT": CUSTOM_COLLECTIONS_PATH_ACCEPT},
             parse_response=False,
         )
+        await self._invalidate_recipe_details(collection_id=custom_collection_id)
 
     async def add_recipes_to_custom_collection(
         self,
@@ -1804,15 +2993,14 @@ class Cookidoo:
 
         """
         json_data = {"recipeIds": recipe_ids}
-        url = self.api_endpoint / ADD_RECIPES_TO_CUSTOM_COLLECTION_PATH.format(
-            **self._cfg.localization.__dict__, id=custom_collection_id
-        )
+        url = self._url(ADD_RECIPES_TO_CUSTOM_COLLECTION_PATH, id=custom_collection_id)
         result = self._ensure_mapping(
             await self._request_json(
                 "put", url, "add recipes to custom collection", json=json_data
             ),
             "add recipes to custom collection",
         )
+        await self._invalidate_recipe_details(recipe_ids)
         return self._parse_result(
             "loading added recipes",
             lambda: cookidoo_collection_from_json(
@@ -1849,8 +3037,8 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH.format(
-            **self._cfg.localization.__dict__,
+        url = self._url(
+            REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH,
             id=custom_collection_id,
             recipe=recipe_id,
         )
@@ -1860,6 +3048,7 @@ class Cookidoo:
             ),
             "remove recipe from custom collection",
         )
+        await self._invalidate_recipe_details([recipe_id])
         return self._parse_result(
             "loading removed recipe",
             lambda: cookidoo_collection_from_json(
@@ -1893,22 +3082,199 @@ class Cookidoo:
 
         """
 
-        url = self.api_endpoint / RECIPES_IN_CALENDAR_WEEK_PATH.format(
-            **self._cfg.localization.__dict__, day=day.isoformat()
-        )
-        result = self._ensure_mapping(
-            await self._request_json("get", url, "loading recipes in calendar week"),
+        url = self._url(RECIPES_IN_CALENDAR_WEEK_PATH, day=day.isoformat())
+        return await self._request_polled(
+            url,
             "loading recipes in calendar week",
+            lambda result: self._parse_result(
+                "loading recipes in calendar week",
+                lambda: [
+                    cookidoo_calendar_day_from_json(
+                        cast(CalendarDayJSON, calendar_day), self._cfg.localization
+                    )
+                    for calendar_day in cast(
+                        Sequence[object],
+                        self._ensure_mapping(
+                            result, "loading recipes in calendar week"
+                        )["myDays"],
+                    )
+                ],
+            ),
         )
-        return self._parse_result(
-            "loading recipes in calendar week",
-            lambda: [
-                cookidoo_calendar_day_from_json(
-                    cast(CalendarDayJSON, calendar_day), self._cfg.localization
+
+    async def get_calendar_range(
+        self,
+        start: date,
+        end: date,
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[CookidooCalendarDay]:
+        """Get the calendar days of a range of days.
+
+        The calendar weeks covering the range are loaded with at most
+        ``concurrency`` requests in flight.
+
+        Parameters
+        ----------
+        start
+            The first day of the range
+        end
+            The last day of the range, included
+        concurrency
+            The maximum number of calendar weeks loaded at once
+
+        Returns
+        -------
+        list[CookidooCalendarDay]
+            A calendar day for every day of the range in order, empty for the
+            days without recipes
+
+        Raises
+        ------
+        CookidooConfigException
+            If the concurrency is not positive.
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        return list((await self._get_calendar_days(days, concurrency)).values())
+
+    async def _get_calendar_days(
+        self, days: Iterable[date], concurrency: int
+    ) -> dict[date, CookidooCalendarDay]:
+        """Get the calendar days of the given days, loading their weeks at once."""
+        if concurrency < 1:
+            raise CookidooConfigException("Concurrency must be positive.")
+        days = list(days)
+        # The calendar weeks start on Monday
+        weeks = dict.fromkeys(day - timedelta(days=day.weekday()) for day in days)
+        calendar_days: dict[str, CookidooCalendarDay] = {}
+        async for week in completed(
+            (partial(self.get_recipes_in_calendar_week, week) for week in weeks),
+            concurrency,
+        ):
+            for calendar_day in week:
+                calendar_days.setdefault(calendar_day.id, calendar_day)
+        return {
+            day: calendar_days.get(day.isoformat()) or self._empty_calendar_day(day)
+            for day in days
+        }
+
+    async def apply_calendar_plan(
+        self,
+        plan: Mapping[date, CookidooCalendarPlanDay],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[CookidooCalendarDay]:
+        """Apply a plan to the calendar.
+
+        The planned days are compared with the calendar, days not in the plan
+        are left as they are. The recipes not in the plan anymore are removed
+        first, then the missing recipes are added with a request per day and
+        source of the recipes. The requests are sent with at most
+        ``concurrency`` in flight.
+
+        Parameters
+        ----------
+        plan
+            The recipes and custom recipes to plan, by day
+        concurrency
+            The maximum number of requests in flight
+
+        Returns
+        -------
+        list[CookidooCalendarDay]
+            The planned calendar days, in order of the days
+
+        Raises
+        ------
+        CookidooConfigException
+            If the concurrency is not positive.
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        current = await self._get_calendar_days(sorted(plan), concurrency)
+        removals: list[Callable[[], Awaitable[CookidooCalendarDay]]] = []
+        additions: list[Callable[[], Awaitable[tuple[date, CookidooCalendarDay]]]] = []
+        for day, calendar_day in current.items():
+            custom_recipe_ids = set(calendar_day.customer_recipe_ids)
+            recipe_ids = {
+                recipe.id
+                for recipe in calendar_day.recipes
+                if recipe.id not in custom_recipe_ids
+            }
+            planned = plan[day]
+            removed_recipe_ids = recipe_ids - set(planned.recipe_ids)
+            removed_custom_recipe_ids = custom_recipe_ids - set(
+                planned.custom_recipe_ids
+            )
+            removed = removed_recipe_ids | removed_custom_recipe_ids
+            removals.extend(
+                partial(self.remove_recipe_from_calendar, day, recipe_id)
+                for recipe_id in sorted(removed_recipe_ids)
+            )
+            removals.extend(
+                partial(self.remove_custom_recipe_from_calendar, day, recipe_id)
+                for recipe_id in sorted(removed_custom_recipe_ids)
+            )
+            # Without additions the removal responses, which may arrive in
+            # any order, are not needed to know the planned day
+            current[day] = replace(
+                calendar_day,
+                recipes=[
+                    recipe
+                    for recipe in calendar_day.recipes
+                    if recipe.id not in removed
+                ],
+                customer_recipe_ids=[
+                    recipe_id
+                    for recipe_id in calendar_day.customer_recipe_ids
+                    if recipe_id not in removed
+                ],
+            )
+            added = [
+                recipe_id
+                for recipe_id in dict.fromkeys(planned.recipe_ids)
+                if recipe_id not in recipe_ids
+            ]
+            added_custom = [
+                recipe_id
+                for recipe_id in dict.fromkeys(planned.custom_recipe_ids)
+                if recipe_id not in custom_recipe_ids
+            ]
+            if added or added_custom:
+                additions.append(
+                    partial(self._add_to_calendar_day, day, added, added_custom)
                 )
-                for calendar_day in cast(Sequence[object], result["myDays"])
-            ],
-        )
+
+        async for _ in completed(removals, concurrency):
+            pass
+        async for day, calendar_day in completed(additions, concurrency):
+            current[day] = calendar_day
+        return list(current.values())
+
+    async def _add_to_calendar_day(
+        self, day: date, recipe_ids: list[str], custom_recipe_ids: list[str]
+    ) -> tuple[date, CookidooCalendarDay]:
+        """Add recipes and custom recipes to a calendar day, in this order.
+
+        The response of the last request has all the recipes of the day.
+        """
+        if not custom_recipe_ids:
+            return day, await self.add_recipes_to_calendar(day, recipe_ids)
+        if recipe_ids:
+            await self.add_recipes_to_calendar(day, recipe_ids)
+        return day, await self.add_custom_recipes_to_calendar(day, custom_recipe_ids)
 
     async def add_recipes_to_calendar(
         self,
@@ -1940,9 +3306,7 @@ class Cookidoo:
 
         """
         json_data = {"recipeIds": recipe_ids, "dayKey": day.isoformat()}
-        url = self.api_endpoint / ADD_RECIPES_TO_CALENDER_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(ADD_RECIPES_TO_CALENDER_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "put", url, "add recipes to calendar", json=json_data
@@ -1986,8 +3350,8 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / REMOVE_RECIPE_FROM_CALENDER_PATH.format(
-            **self._cfg.localization.__dict__,
+        url = self._url(
+            REMOVE_RECIPE_FROM_CALENDER_PATH,
             day=day.isoformat(),
             recipe=recipe_id,
         )
@@ -2042,9 +3406,7 @@ class Cookidoo:
             "dayKey": day.isoformat(),
             "recipeSource": "CUSTOMER",
         }
-        url = self.api_endpoint / ADD_RECIPES_TO_CALENDER_PATH.format(
-            **self._cfg.localization.__dict__
-        )
+        url = self._url(ADD_RECIPES_TO_CALENDER_PATH)
         result = self._ensure_mapping(
             await self._request_json(
                 "put", url, "add custom recipes to calendar", json=json_data
@@ -2088,8 +3450,8 @@ class Cookidoo:
             If the parsing of the request response fails.
 
         """
-        url = self.api_endpoint / REMOVE_RECIPE_FROM_CALENDER_PATH.format(
-            **self._cfg.localization.__dict__,
+        url = self._url(
+            REMOVE_RECIPE_FROM_CALENDER_PATH,
             day=day.isoformat(),
             recipe=recipe_id,
         )
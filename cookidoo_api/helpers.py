@@ -1,6 +1,7 @@
 """Cookidoo API helpers."""
 
 from collections.abc import Sequence
+from functools import lru_cache
 import json
 import logging
 import os
@@ -28,6 +29,7 @@ from cookidoo_api.raw_types import (
     RecipeJSON,
     SearchRecipeHitJSON,
     SearchResultJSON,
+    ShoppingListJSON,
     SubscriptionJSON,
 )
 from cookidoo_api.types import (
@@ -48,6 +50,7 @@ from cookidoo_api.types import (
     CookidooRecipeNutrition,
     CookidooSearchRecipeHit,
     CookidooSearchResult,
+    CookidooShoppingList,
     CookidooShoppingRecipe,
     CookidooShoppingRecipeDetails,
     CookidooSubscription,
@@ -209,9 +212,16 @@ def _construct_recipe_url(
     if not localization:
         return ""
 
-    parsed_url = urlparse(localization.url)
-    domain = parsed_url.netloc
-    return f"https://{domain}/{path_prefix}/{localization.language}/{recipe_id}"
+    return (
+        _recipe_url_prefix(localization.url, localization.language, path_prefix)
+        + recipe_id
+    )
+
+
+@lru_cache(maxsize=64)
+def _recipe_url_prefix(url: str, language: str, path_prefix: str) -> str:
+    """Get the recipe URL prefix of a localization, cached per localization."""
+    return f"https://{urlparse(url).netloc}/{path_prefix}/{language}/"
 
 
 def cookidoo_recipe_from_json(
@@ -492,6 +502,54 @@ def cookidoo_additional_item_from_json(
     )
 
 
+def cookidoo_shopping_list_recipes_from_json(
+    shopping_list: ShoppingListJSON,
+    localization: CookidooLocalizationConfig | None = None,
+) -> list[CookidooShoppingRecipe]:
+    """Convert the recipes of a shopping list received from the API to cookidoo shopping recipes."""
+    return [
+        cookidoo_recipe_from_json(recipe, localization)
+        for recipe in [*shopping_list["recipes"], *shopping_list["customerRecipes"]]
+    ]
+
+
+def cookidoo_shopping_list_ingredient_items_from_json(
+    shopping_list: ShoppingListJSON,
+) -> list[CookidooIngredientItem]:
+    """Convert the ingredients of a shopping list received from the API to cookidoo items."""
+    return [
+        cookidoo_ingredient_item_from_json(ingredient)
+        for recipe in [*shopping_list["recipes"], *shopping_list["customerRecipes"]]
+        for ingredient in recipe["recipeIngredientGroups"]
+    ]
+
+
+def cookidoo_shopping_list_additional_items_from_json(
+    shopping_list: ShoppingListJSON,
+) -> list[CookidooAdditionalItem]:
+    """Convert the additional items of a shopping list received from the API to cookidoo items."""
+    return [
+        cookidoo_additional_item_from_json(additional_item)
+        for additional_item in shopping_list["additionalItems"]
+    ]
+
+
+def cookidoo_shopping_list_from_json(
+    shopping_list: ShoppingListJSON,
+    localization: CookidooLocalizationConfig | None = None,
+) -> CookidooShoppingList:
+    """Convert a shopping list received from the API to a cookidoo shopping list."""
+    return CookidooShoppingList(
+        recipes=cookidoo_shopping_list_recipes_from_json(shopping_list, localization),
+        ingredient_items=cookidoo_shopping_list_ingredient_items_from_json(
+            shopping_list
+        ),
+        additional_items=cookidoo_shopping_list_additional_items_from_json(
+            shopping_list
+        ),
+    )
+
+
 def cookidoo_calendar_day_from_json(
     calendar_day: CalendarDayJSON,
     localization: CookidooLocalizationConfig | None = None,
@@ -0,0 +1,197 @@
+"""Cookidoo API metrics."""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from cookidoo_api.const import DEFAULT_HISTOGRAM_BUCKETS
+
+
+@dataclass(frozen=True)
+class CookidooRequestMetrics:
+    """Cookidoo request metrics type.
+
+    Attributes
+    ----------
+    operation
+        The operation of the request, e.g. ``loading recipe details``
+    method
+        The HTTP method of the request
+    status
+        The status of the response
+    bytes_received
+        The size of the response body [in bytes]
+    wait
+        The time waiting for the rate limiter and a concurrency slot
+        [in seconds]
+    connect
+        The time from sending the request until the response headers arrived,
+        including waiting for a connection [in seconds]
+    transfer
+        The time reading the response body [in seconds]
+    decode
+        The time checking and decoding the response body [in seconds]
+
+    """
+
+    operation: str
+    method: str
+    status: int
+    bytes_received: int
+    wait: float
+    connect: float
+    transfer: float
+    decode: float
+
+
+class CookidooMetricsSink:
+    """Receiver of the metrics of a ``Cookidoo`` client.
+
+    All methods do nothing, subclasses override the ones they are interested
+    in. Without a sink, the client does not measure anything.
+    """
+
+    def record_request(self, metrics: CookidooRequestMetrics) -> None:
+        """Record a response, including responses which are retried."""
+
+    def record_conversion(self, operation: str, duration: float) -> None:
+        """Record the conversion of a response into public types [in seconds]."""
+
+    def record_retry(self, operation: str) -> None:
+        """Record a retry of a throttled, failing or timed out request."""
+
+    def record_cache(self, cache: str, method: str, hit: bool) -> None:
+        """Record a lookup in the ``result`` or ``recipe`` cache."""
+
+    def record_login(self, success: bool) -> None:
+        """Record a login, including the logins of ``auto_login``."""
+
+
+@dataclass
+class CookidooHistogram:
+    """Cookidoo histogram type.
+
+    Attributes
+    ----------
+    buckets
+        The upper bounds of the buckets, an implicit last bucket holds all
+        larger values
+    counts
+        The number of values per bucket
+    count
+        The number of values
+    total
+        The sum of the values
+
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Create the bucket counts."""
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of its bucket.
+
+        Parameters
+        ----------
+        q
+            The quantile between 0 and 1, e.g. 0.99
+
+        Returns
+        -------
+        float
+            The upper bound of the bucket containing the quantile, ``inf`` if
+            it is beyond the last bucket and ``nan`` without values
+
+        """
+        if not self.count:
+            return float("nan")
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class CookidooHistogramSink(CookidooMetricsSink):
+    """In-memory metrics sink keeping a histogram per operation and phase.
+
+    The phases are ``wait``, ``connect``, ``transfer``, ``decode`` and
+    ``convert``. Besides the histograms, the responses per status, the bytes
+    received and the retries are counted per operation, as well as the cache
+    lookups and the logins.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS) -> None:
+        """Init function for the histogram sink.
+
+        Parameters
+        ----------
+        buckets
+            The upper bounds of the histogram buckets [in seconds]
+
+        """
+        self._buckets = buckets
+        self.histograms: dict[tuple[str, str], CookidooHistogram] = {}
+        self.responses: dict[tuple[str, int], int] = {}
+        self.bytes_received: dict[str, int] = {}
+        self.retries: dict[str, int] = {}
+        self.cache_lookups: dict[tuple[str, str, bool], int] = {}
+        self.logins: dict[bool, int] = {}
+
+    def histogram(self, operation: str, phase: str) -> CookidooHistogram:
+        """Get the histogram of an operation and phase, empty if not recorded."""
+        return self.histograms.get((operation, phase)) or CookidooHistogram(
+            self._buckets
+        )
+
+    def _observe(self, operation: str, phase: str, value: float) -> None:
+        """Add a value to the histogram of an operation and phase."""
+        if (histogram := self.histograms.get((operation, phase))) is None:
+            histogram = self.histograms[(operation, phase)] = CookidooHistogram(
+                self._buckets
+            )
+        histogram.observe(value)
+
+    def record_request(self, metrics: CookidooRequestMetrics) -> None:
+        """Record a response, including responses which are retried."""
+        operation = metrics.operation
+        key = (operation, metrics.status)
+        self.responses[key] = self.responses.get(key, 0) + 1
+        self.bytes_received[operation] = (
+            self.bytes_received.get(operation, 0) + metrics.bytes_received
+        )
+        self._observe(operation, "wait", metrics.wait)
+        self._observe(operation, "connect", metrics.connect)
+        self._observe(operation, "transfer", metrics.transfer)
+        self._observe(operation, "decode", metrics.decode)
+
+    def record_conversion(self, operation: str, duration: float) -> None:
+        """Record the conversion of a response into public types [in seconds]."""
+        self._observe(operation, "convert", duration)
+
+    def record_retry(self, operation: str) -> None:
+        """Record a retry of a throttled, failing or timed out request."""
+        self.retries[operation] = self.retries.get(operation, 0) + 1
+
+    def record_cache(self, cache: str, method: str, hit: bool) -> None:
+        """Record a lookup in the ``result`` or ``recipe`` cache."""
+        key = (cache, method, hit)
+        self.cache_lookups[key] = self.cache_lookups.get(key, 0) + 1
+
+    def record_login(self, success: bool) -> None:
+        """Record a login, including the logins of ``auto_login``."""
+        self.logins[success] = self.logins.get(success, 0) + 1
@@ -0,0 +1,152 @@
+"""Cookidoo API write-behind ownership changes."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import TypeVar
+
+from cookidoo_api.concurrency import MicroBatcher
+from cookidoo_api.const import DEFAULT_MAX_BATCH_SIZE, DEFAULT_OWNERSHIP_WRITE_DELAY
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.types import CookidooAdditionalItem, CookidooIngredientItem
+
+_I = TypeVar("_I", CookidooIngredientItem, CookidooAdditionalItem)
+
+
+def _item_id(item: CookidooIngredientItem | CookidooAdditionalItem) -> str:
+    """Get the id the changes of an item are folded by."""
+    return item.id
+
+
+async def _send_changes(  # noqa: UP047
+    lock: asyncio.Lock,
+    edit: Callable[[list[_I]], Awaitable[list[_I]]],
+    items: list[_I],
+) -> list[tuple[_I, _I]]:
+    """Send the changes of a batch and pair them with the edited items."""
+    # Batches are sent one at a time, so the latest change of an item wins
+    async with lock:
+        edited = await edit(items)
+    # Items missing from the response resolve with the change sent
+    edited_by_id = {item.id: item for item in edited}
+    return [(item, edited_by_id.get(item.id, item)) for item in items]
+
+
+async def _single(results: Awaitable[list[_I]]) -> _I:  # noqa: UP047
+    """Get the result of a single change."""
+    return (await results)[0]
+
+
+class CookidooOwnershipWriter:
+    """Write-behind queue batching the ownership changes of shopping list items.
+
+    Changes are collected for ``delay`` seconds after the first queued change
+    and sent with a single request per endpoint, at most ``max_batch_size``
+    changes at once. Repeated changes of the same
+    item are folded into its latest state. Each change returns a future
+    resolving with the updated item, or with the exception of the failed
+    request.
+    """
+
+    def __init__(
+        self,
+        cookidoo: Cookidoo,
+        delay: float = DEFAULT_OWNERSHIP_WRITE_DELAY,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Init function for the ownership writer.
+
+        Parameters
+        ----------
+        cookidoo
+            The client sending the changes
+        delay
+            The time the changes are collected before they are sent
+            [in seconds]
+        max_batch_size
+            The maximum number of changes sent with a single request, the
+            batches of an endpoint are sent one after another
+
+        Raises
+        ------
+        CookidooConfigException
+            When the delay is negative or the max batch size is not positive.
+
+        """
+        if delay < 0:
+            raise CookidooConfigException("Ownership write delay must not be negative.")
+        if max_batch_size < 1:
+            raise CookidooConfigException("Max batch size must be positive.")
+        self._delay = delay
+        self._ingredient_items: MicroBatcher[
+            CookidooIngredientItem, CookidooIngredientItem
+        ] = MicroBatcher(
+            partial(
+                _send_changes, asyncio.Lock(), cookidoo.edit_ingredient_items_ownership
+            ),
+            delay,
+            max_batch_size,
+            fold=_item_id,
+        )
+        self._additional_items: MicroBatcher[
+            CookidooAdditionalItem, CookidooAdditionalItem
+        ] = MicroBatcher(
+            partial(
+                _send_changes, asyncio.Lock(), cookidoo.edit_additional_items_ownership
+            ),
+            delay,
+            max_batch_size,
+            fold=_item_id,
+        )
+
+    @property
+    def delay(self) -> float:
+        """The time the changes are collected before they are sent [in seconds]."""
+        return self._delay
+
+    def edit_ingredient_item_ownership(
+        self, item: CookidooIngredientItem
+    ) -> asyncio.Future[CookidooIngredientItem]:
+        """Queue the ownership change of an ingredient item.
+
+        Parameters
+        ----------
+        item
+            The ingredient item with its new ownership
+
+        Returns
+        -------
+        asyncio.Future[CookidooIngredientItem]
+            The future of the edited ingredient item
+
+        """
+        return asyncio.ensure_future(
+            _single(self._ingredient_items.submit_nowait([item]))
+        )
+
+    def edit_additional_item_ownership(
+        self, item: CookidooAdditionalItem
+    ) -> asyncio.Future[CookidooAdditionalItem]:
+        """Queue the ownership change of an additional item.
+
+        Parameters
+        ----------
+        item
+            The additional item with its new ownership
+
+        Returns
+        -------
+        asyncio.Future[CookidooAdditionalItem]
+            The future of the edited additional item
+
+        """
+        return asyncio.ensure_future(
+            _single(self._additional_items.submit_nowait([item]))
+        )
+
+    async def flush(self) -> None:
+        """Send the queued changes at once and wait for all changes to be sent."""
+        await asyncio.gather(
+            self._ingredient_items.flush(), self._additional_items.flush()
+        )
@@ -0,0 +1,235 @@
+"""Cookidoo API Prometheus exporter."""
+
+from collections.abc import Iterable, Iterator
+import math
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from cookidoo_api.const import (
+    DEFAULT_HISTOGRAM_BUCKETS,
+    DEFAULT_PROMETHEUS_PORT,
+    PROMETHEUS_CONTENT_TYPE,
+)
+from cookidoo_api.metrics import CookidooHistogram, CookidooHistogramSink
+
+if TYPE_CHECKING:
+    from cookidoo_api.cookidoo import Cookidoo
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: object) -> str:
+    """Format labels, e.g. ``{operation="search recipes"}``."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _header(name: str, type: str, help: str) -> Iterator[str]:
+    """Format the help and type lines of a metric."""
+    yield f"# HELP {name} {help}"
+    yield f"# TYPE {name} {type}"
+
+
+def _histogram(
+    name: str, histogram: CookidooHistogram, **labels: object
+) -> Iterator[str]:
+    """Format the cumulative buckets, sum and count of a histogram."""
+    cumulative = 0
+    for bound, count in zip(
+        (*histogram.buckets, math.inf), histogram.counts, strict=True
+    ):
+        cumulative += count
+        yield f"{name}_bucket{_labels(**labels, le=_number(bound))} {cumulative}"
+    yield f"{name}_sum{_labels(**labels)} {_number(histogram.total)}"
+    yield f"{name}_count{_labels(**labels)} {histogram.count}"
+
+
+class CookidooPrometheusExporter(CookidooHistogramSink):
+    """Metrics sink exporting the client traffic in the Prometheus text format.
+
+    Pass the exporter as ``metrics`` to one or more clients and ``track`` them
+    for the in-flight gauges. The metrics are rendered by ``render``, served
+    by the aiohttp handler ``handle`` or by a local server from ``start``.
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+        *,
+        namespace: str = "cookidoo",
+    ) -> None:
+        """Init function for the Prometheus exporter.
+
+        Parameters
+        ----------
+        buckets
+            The upper bounds of the histogram buckets [in seconds]
+        namespace
+            The prefix of the metric names
+
+        """
+        super().__init__(buckets)
+        self._namespace = namespace
+        self._clients: list[Cookidoo] = []
+        self._runner: web.AppRunner | None = None
+
+    def track(self, client: "Cookidoo") -> None:
+        """Include the queued and in-flight requests of a client in the gauges."""
+        if client not in self._clients:
+            self._clients.append(client)
+
+    def untrack(self, client: "Cookidoo") -> None:
+        """Stop including the requests of a client in the gauges."""
+        if client in self._clients:
+            self._clients.remove(client)
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            The metrics, one sample per line
+
+        """
+        return "\n".join(self._lines()) + "\n"
+
+    def _lines(self) -> Iterator[str]:
+        """Format all metrics."""
+        ns = self._namespace
+        yield from self._counter(
+            f"{ns}_responses_total",
+            "Responses per operation and status, including retried ones.",
+            (
+                (_labels(operation=operation, status=int(status)), count)
+                for (operation, status), count in sorted(self.responses.items())
+            ),
+        )
+        yield from self._counter(
+            f"{ns}_response_bytes_total",
+            "Bytes of the response bodies per operation.",
+            (
+                (_labels(operation=operation), count)
+                for operation, count in sorted(self.bytes_received.items())
+            ),
+        )
+        yield from self._counter(
+            f"{ns}_retries_total",
+            "Retries of throttled, failing or timed out requests per operation.",
+            (
+                (_labels(operation=operation), count)
+                for operation, count in sorted(self.retries.items())
+            ),
+        )
+        yield from self._counter(
+            f"{ns}_cache_lookups_total",
+            "Lookups in the result and recipe caches.",
+            (
+                (
+                    _labels(
+                        cache=cache, method=method, result="hit" if hit else "miss"
+                    ),
+                    count,
+                )
+                for (cache, method, hit), count in sorted(self.cache_lookups.items())
+            ),
+        )
+        yield from self._counter(
+            f"{ns}_logins_total",
+            "Logins per result, including the logins of auto login.",
+            (
+                (_labels(result="success" if success else "failure"), count)
+                for success, count in sorted(self.logins.items())
+            ),
+        )
+        yield from _header(
+            f"{ns}_requests_in_flight", "gauge", "API requests currently in flight."
+        )
+        in_flight = sum(client.in_flight_requests for client in self._clients)
+        yield f"{ns}_requests_in_flight {in_flight}"
+        yield from _header(
+            f"{ns}_requests_queued",
+            "gauge",
+            "API requests waiting for a free concurrency slot.",
+        )
+        queued = sum(client.queued_requests for client in self._clients)
+        yield f"{ns}_requests_queued {queued}"
+        yield from _header(
+            f"{ns}_phase_duration_seconds",
+            "histogram",
+            "Duration of the phases of the requests and conversions per operation.",
+        )
+        for (operation, phase), histogram in sorted(self.histograms.items()):
+            yield from _histogram(
+                f"{ns}_phase_duration_seconds",
+                histogram,
+                operation=operation,
+                phase=phase,
+            )
+
+    @staticmethod
+    def _counter(
+        name: str, help: str, samples: Iterable[tuple[str, int]]
+    ) -> Iterator[str]:
+        """Format a counter with its samples."""
+        yield from _header(name, "counter", help)
+        for labels, count in samples:
+            yield f"{name}{labels} {count}"
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Serve the metrics, an aiohttp handler for e.g. ``/metrics``."""
+        return web.Response(
+            body=self.render().encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+        )
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = DEFAULT_PROMETHEUS_PORT
+    ) -> None:
+        """Start a local server serving the metrics on ``/metrics``.
+
+        Parameters
+        ----------
+        host
+            The host to bind to, only the local host by default
+        port
+            The port to bind to, ``0`` picks a free port, see ``port``
+
+        """
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+        except BaseException:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+
+    @property
+    def port(self) -> int | None:
+        """Port of the local server, ``None`` if not started."""
+        if self._runner is None:
+            return None
+        for address in self._runner.addresses:
+            return int(address[1])
+        return None
+
+    async def stop(self) -> None:
+        """Stop the local server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
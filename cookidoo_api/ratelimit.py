@@ -0,0 +1,99 @@
+"""Cookidoo API rate limiting."""
+
+import asyncio
+import time
+
+from cookidoo_api.exceptions import CookidooConfigException
+
+
+class _TokenBucket:
+    """A token bucket for a single host."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Init function for the token bucket, starting with a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # Waiters acquire the lock in arrival order, so they are served fairly
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take a token, waiting for one if the bucket is empty."""
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+        return time.monotonic() - start
+
+
+class CookidooRateLimiter:
+    """Token bucket rate limiter keyed by host.
+
+    Share a single instance between all ``Cookidoo`` clients talking to the
+    same hosts to pace their combined traffic. Requests exceeding the rate
+    wait in arrival order instead of failing.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Init function for the rate limiter.
+
+        Parameters
+        ----------
+        rate
+            The sustained number of requests per second and host
+        burst
+            The number of requests per host which can be sent at once
+
+        Raises
+        ------
+        CookidooConfigException
+            When the rate or the burst is not positive.
+
+        """
+        if rate <= 0 or burst < 1:
+            raise CookidooConfigException(
+                "Rate limiter rate and burst must be positive."
+            )
+        self._rate = rate
+        self._burst = burst
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    @property
+    def rate(self) -> float:
+        """The sustained number of requests per second and host."""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """The number of requests per host which can be sent at once."""
+        return self._burst
+
+    async def acquire(self, host: str) -> float:
+        """Wait until a request to the host is allowed.
+
+        Parameters
+        ----------
+        host
+            The host the request is sent to
+
+        Returns
+        -------
+        float
+            The time waited for the request to be allowed [in seconds]
+
+        """
+        if (bucket := self._buckets.get(host)) is None:
+            bucket = self._buckets[host] = _TokenBucket(self._rate, self._burst)
+        return await bucket.acquire()
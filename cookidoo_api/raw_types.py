@@ -88,6 +88,14 @@ class RecipeJSON(TypedDict):
     descriptiveAssets: list[DescriptiveAssetJSON] | None
 
 
+class ShoppingListJSON(TypedDict):
+    """The json for the shopping list response."""
+
+    recipes: list[RecipeJSON]
+    customerRecipes: list[RecipeJSON]
+    additionalItems: list[AdditionalItemJSON]
+
+
 class RecipeDetailsAdditionalInformationJSON(TypedDict):
     """The json for a recipe details additional information in the API."""
 
@@ -0,0 +1,312 @@
+"""Cookidoo API persistent recipe cache."""
+
+import asyncio
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+import traceback
+
+from cookidoo_api.const import DEFAULT_RECIPE_CACHE_MAX_BYTES, DEFAULT_RECIPE_CACHE_TTL
+from cookidoo_api.exceptions import CookidooConfigException
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipe_details (
+    language TEXT NOT NULL,
+    id TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (language, id)
+);
+CREATE INDEX IF NOT EXISTS recipe_details_accessed_at
+    ON recipe_details (accessed_at);
+CREATE INDEX IF NOT EXISTS recipe_details_stored_at
+    ON recipe_details (stored_at);
+CREATE TABLE IF NOT EXISTS recipe_details_size (total INTEGER NOT NULL);
+INSERT INTO recipe_details_size
+    SELECT COALESCE(SUM(size), 0) FROM recipe_details
+    WHERE NOT EXISTS (SELECT 1 FROM recipe_details_size);
+CREATE TRIGGER IF NOT EXISTS recipe_details_inserted
+    AFTER INSERT ON recipe_details BEGIN
+        UPDATE recipe_details_size SET total = total + NEW.size;
+    END;
+CREATE TRIGGER IF NOT EXISTS recipe_details_updated
+    AFTER UPDATE OF size ON recipe_details BEGIN
+        UPDATE recipe_details_size SET total = total + NEW.size - OLD.size;
+    END;
+CREATE TRIGGER IF NOT EXISTS recipe_details_deleted
+    AFTER DELETE ON recipe_details BEGIN
+        UPDATE recipe_details_size SET total = total - OLD.size;
+    END;
+"""
+
+# Number of reads whose access time is kept in memory before it is written
+_ACCESS_BATCH = 64
+# Share of the maximum total size kept when evicting, so that eviction does
+# not run again on every following write
+_EVICT_TO = 0.9
+
+
+class CookidooRecipeCache:
+    """Persistent cache for recipe details, stored in a SQLite file.
+
+    The raw JSON of the recipe details is stored per language and recipe id,
+    so it is parsed again by the current version of the library when read.
+    The database uses write-ahead logging, several processes can share the
+    file and read it at the same time.
+
+    Recipe details include the collections of the logged in account, share a
+    cache file only between clients of the same account.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl: float = DEFAULT_RECIPE_CACHE_TTL,
+        max_bytes: int | None = DEFAULT_RECIPE_CACHE_MAX_BYTES,
+    ) -> None:
+        """Init function for the recipe cache.
+
+        Parameters
+        ----------
+        path
+            The path of the SQLite file, created if missing
+        ttl
+            The time to live of the recipe details [in seconds]
+        max_bytes
+            The maximum total size of the stored recipe details [in bytes],
+            the least recently used recipes are dropped first. ``None`` does
+            not limit the size.
+
+        Raises
+        ------
+        CookidooConfigException
+            When the SQLite file cannot be opened.
+
+        """
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        # Access times of read recipes, written with the next write
+        self._accessed: dict[tuple[str, str], float] = {}
+        # The connection is used from worker threads, one at a time
+        self._lock = threading.Lock()
+        try:
+            self._connection = sqlite3.connect(
+                path, timeout=5.0, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise CookidooConfigException(
+                f"Cannot open the recipe cache at {path}."
+            ) from e
+
+    @property
+    def hits(self) -> int:
+        """Number of recipe details read from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of recipe details missing or expired in the cache."""
+        return self._misses
+
+    async def get(self, language: str, id: str) -> bytes | None:
+        """Get the raw JSON of recipe details.
+
+        Parameters
+        ----------
+        language
+            The language of the recipe details
+        id
+            The id of the recipe
+
+        Returns
+        -------
+        bytes | None
+            The raw JSON, or ``None`` if missing, expired or unreadable
+
+        """
+        body = await asyncio.to_thread(self._get, language, id)
+        if body is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return body
+
+    async def put(self, language: str, id: str, body: bytes) -> None:
+        """Store the raw JSON of recipe details.
+
+        Parameters
+        ----------
+        language
+            The language of the recipe details
+        id
+            The id of the recipe
+        body
+            The raw JSON
+
+        """
+        await asyncio.to_thread(self._put, language, id, body)
+
+    async def invalidate_collection(self, language: str, collection_id: str) -> None:
+        """Drop stored recipe details listing a collection.
+
+        Parameters
+        ----------
+        language
+            The language of the recipe details
+        collection_id
+            The id of the collection
+
+        """
+        await asyncio.to_thread(self._invalidate_collection, language, collection_id)
+
+    async def invalidate(self, language: str, id: str | None = None) -> None:
+        """Drop stored recipe details.
+
+        Parameters
+        ----------
+        language
+            The language of the recipe details
+        id
+            The id of the recipe to drop, ``None`` drops all recipes of the
+            language
+
+        """
+        await asyncio.to_thread(self._invalidate, language, id)
+
+    def close(self) -> None:
+        """Write the pending access times and close the SQLite file."""
+        with self._lock:
+            try:
+                with self._connection:
+                    self._write_accessed()
+            except sqlite3.Error:
+                _LOGGER.debug(
+                    "Exception: Cannot write recipe cache:\n%s", traceback.format_exc()
+                )
+            self._connection.close()
+
+    def _get(self, language: str, id: str) -> bytes | None:
+        """Read the raw JSON of recipe details, marking it as recently used.
+
+        Reads do not write, the access times are written in batches.
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT body FROM recipe_details "
+                    "WHERE language = ? AND id = ? AND stored_at > ?",
+                    (language, id, now - self._ttl),
+                ).fetchone()
+                if row is not None:
+                    self._accessed[language, id] = now
+                    if len(self._accessed) >= _ACCESS_BATCH:
+                        with self._connection:
+                            self._write_accessed()
+        except sqlite3.Error:
+            _LOGGER.debug(
+                "Exception: Cannot read recipe cache:\n%s", traceback.format_exc()
+            )
+            return None
+        return None if row is None else bytes(row[0])
+
+    def _put(self, language: str, id: str, body: bytes) -> None:
+        """Write the raw JSON of recipe details and evict old recipes."""
+        now = time.time()
+        try:
+            with self._lock, self._connection:
+                self._write_accessed()
+                self._connection.execute(
+                    "INSERT INTO recipe_details "
+                    "(language, id, body, size, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (language, id) DO UPDATE SET "
+                    "body = excluded.body, size = excluded.size, "
+                    "stored_at = excluded.stored_at, "
+                    "accessed_at = excluded.accessed_at",
+                    (language, id, body, len(body), now, now),
+                )
+                self._connection.execute(
+                    "DELETE FROM recipe_details WHERE stored_at <= ?",
+                    (now - self._ttl,),
+                )
+                if self._max_bytes is not None:
+                    self._evict(self._max_bytes)
+        except sqlite3.Error:
+            _LOGGER.debug(
+                "Exception: Cannot write recipe cache:\n%s", traceback.format_exc()
+            )
+
+    def _write_accessed(self) -> None:
+        """Write the pending access times, in the current transaction."""
+        if self._accessed:
+            self._connection.executemany(
+                "UPDATE recipe_details SET accessed_at = MAX(accessed_at, ?) "
+                "WHERE language = ? AND id = ?",
+                [(now, *key) for key, now in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self, max_bytes: int) -> None:
+        """Drop the least recently used recipes once the total size is exceeded."""
+        (total,) = self._connection.execute(
+            "SELECT total FROM recipe_details_size"
+        ).fetchone()
+        if total <= max_bytes:
+            return
+        excess = total - max_bytes * _EVICT_TO
+        evicted: list[tuple[int]] = []
+        for rowid, size in self._connection.execute(
+            "SELECT rowid, size FROM recipe_details ORDER BY accessed_at, rowid"
+        ):
+            if excess <= 0:
+                break
+            evicted.append((rowid,))
+            excess -= size
+        self._connection.executemany(
+            "DELETE FROM recipe_details WHERE rowid = ?", evicted
+        )
+
+    def _invalidate_collection(self, language: str, collection_id: str) -> None:
+        """Delete recipe details of a language listing a collection."""
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "DELETE FROM recipe_details "
+                    "WHERE language = ? AND instr(body, ?) > 0",
+                    (language, f'"{collection_id}"'.encode()),
+                )
+        except sqlite3.Error:
+            _LOGGER.debug(
+                "Exception: Cannot write recipe cache:\n%s", traceback.format_exc()
+            )
+
+    def _invalidate(self, language: str, id: str | None) -> None:
+        """Delete recipe details of a language."""
+        try:
+            with self._lock, self._connection:
+                if id is None:
+                    self._connection.execute(
+                        "DELETE FROM recipe_details WHERE language = ?", (language,)
+                    )
+                else:
+                    self._connection.execute(
+                        "DELETE FROM recipe_details WHERE language = ? AND id = ?",
+                        (language, id),
+                    )
+        except sqlite3.Error:
+            _LOGGER.debug(
+                "Exception: Cannot write recipe cache:\n%s", traceback.format_exc()
+            )
@@ -0,0 +1,115 @@
+"""Cookidoo API retry policy."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+import random
+
+
+@dataclass(frozen=True)
+class CookidooRetryPolicy:
+    """Cookidoo retry policy type.
+
+    Attributes
+    ----------
+    max_attempts
+        The maximum number of attempts per request, including the first one
+    backoff_base
+        The base delay of the exponential backoff [in seconds]
+    backoff_cap
+        The maximum delay of the exponential backoff [in seconds]
+    max_retry_after
+        The longest ``Retry-After`` delay to wait for [in seconds], longer
+        delays are not retried
+    retry_statuses
+        The response statuses which are retried
+    retry_methods
+        The HTTP methods which are retried. Only ``GET`` is retried by
+        default, add e.g. ``POST`` to opt in to retrying mutations.
+    retry_on_timeout
+        Whether connection timeouts and connection errors are retried
+
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 10.0
+    max_retry_after: float = 60.0
+    retry_statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        }
+    )
+    retry_methods: frozenset[str] = field(default_factory=lambda: frozenset({"GET"}))
+    retry_on_timeout: bool = True
+
+    def allows(self, method: str) -> bool:
+        """Whether requests with the HTTP method may be retried at all."""
+        return self.max_attempts > 1 and method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Get the full jitter backoff delay after a failed attempt.
+
+        Parameters
+        ----------
+        attempt
+            The number of the failed attempt, starting at 1
+
+        Returns
+        -------
+        float
+            A random delay between zero and the capped exponential backoff
+
+        """
+        return random.uniform(  # noqa: S311
+            0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        )
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Get the delay before the next attempt.
+
+        Parameters
+        ----------
+        attempt
+            The number of the failed attempt, starting at 1
+        retry_after
+            The ``Retry-After`` header of the failed response, if any
+
+        Returns
+        -------
+        float | None
+            The delay [in seconds], or ``None`` when the request should not be
+            retried since the server asks to wait longer than allowed
+
+        """
+        if retry_after is not None and (
+            (seconds := parse_retry_after(retry_after)) is not None
+        ):
+            return seconds if seconds <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Returns
+    -------
+    float | None
+        The delay [in seconds], or ``None`` if the header cannot be parsed
+
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
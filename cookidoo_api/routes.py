@@ -0,0 +1,95 @@
+"""Cookidoo API routes."""
+
+from collections.abc import Mapping
+from dataclasses import replace
+from string import Formatter
+from types import MappingProxyType
+from typing import Final
+from urllib.parse import urlparse
+
+from yarl import URL
+
+from cookidoo_api import const
+from cookidoo_api.types import CookidooLocalizationConfig
+
+# All API paths, keyed by their template
+_PATHS: Final = tuple(
+    value for name, value in vars(const).items() if name.endswith("_PATH")
+)
+
+
+class _KeepFields(dict[str, str]):
+    """Format values keeping the fields without a value as they are."""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+def _has_fields(template: str) -> bool:
+    """Whether a template still contains fields to format."""
+    return any(field for _, field, _, _ in Formatter().parse(template))
+
+
+class CookidooRoutes:
+    """Route table of the API urls for a localization.
+
+    The table is built once per localization: the localization fields of all
+    paths are filled in up front and the urls of paths without further
+    fields are prebuilt.
+    """
+
+    localization: CookidooLocalizationConfig
+    api_endpoint: URL
+    _urls: Mapping[str, URL]
+    _templates: Mapping[str, str]
+
+    def __init__(self, localization: CookidooLocalizationConfig) -> None:
+        """Init function for the route table.
+
+        Parameters
+        ----------
+        localization
+            The localization to build the urls for
+
+        """
+        # A copy, so a localization changed in place is detected
+        self.localization = replace(localization)
+        parsed = urlparse(localization.url)
+        self.api_endpoint = URL(f"{parsed.scheme}://{parsed.netloc}")
+
+        values = _KeepFields(vars(localization))
+        templates = {path: path.format_map(values) for path in _PATHS}
+        self._urls = MappingProxyType(
+            {
+                path: self.api_endpoint / template
+                for path, template in templates.items()
+                if not _has_fields(template)
+            }
+        )
+        self._templates = MappingProxyType(
+            {
+                path: template
+                for path, template in templates.items()
+                if _has_fields(template)
+            }
+        )
+
+    def url(self, path: str, **fields: str) -> URL:
+        """Get the url of an API path.
+
+        Parameters
+        ----------
+        path
+            The path template, one of the ``*_PATH`` constants
+        fields
+            The values of the request specific fields of the path, e.g. ``id``
+
+        Returns
+        -------
+        URL
+            The url of the path
+
+        """
+        if not fields:
+            return self._urls[path]
+        return self.api_endpoint / self._templates[path].format(**fields)
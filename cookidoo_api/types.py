@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from enum import StrEnum
 
+from cookidoo_api.exceptions import CookidooException
+
 
 class ThermomixMachineType(StrEnum):
     """Thermomix machine types."""
@@ -156,6 +158,51 @@ class CookidooShoppingRecipe:
     url: str
 
 
+@dataclass
+class CookidooShoppingList:
+    """Cookidoo shopping list type.
+
+    Attributes
+    ----------
+    recipes
+        The recipes and custom recipes on the shopping list
+    ingredient_items
+        The ingredient items of all recipes on the shopping list
+    additional_items
+        The additional items on the shopping list
+
+    """
+
+    recipes: list[CookidooShoppingRecipe]
+    ingredient_items: list[CookidooIngredientItem]
+    additional_items: list[CookidooAdditionalItem]
+
+
+@dataclass
+class CookidooShoppingListPlan:
+    """Cookidoo shopping list plan type.
+
+    Attributes
+    ----------
+    recipe_ids
+        The ids of the recipes to have on the shopping list
+    custom_recipe_ids
+        The ids of the custom recipes to have on the shopping list
+    ingredient_items_ownership
+        The ownership of ingredient items by id, the ingredient items not
+        listed keep their ownership
+    additional_items
+        The ownership of the additional items to have on the shopping list,
+        by name
+
+    """
+
+    recipe_ids: list[str] = field(default_factory=list)
+    custom_recipe_ids: list[str] = field(default_factory=list)
+    ingredient_items_ownership: dict[str, bool] = field(default_factory=dict)
+    additional_items: dict[str, bool] = field(default_factory=dict)
+
+
 @dataclass
 class CookidooSearchRecipeHit:
     """A single recipe hit from Cookidoo search.
@@ -334,6 +381,24 @@ class CookidooShoppingRecipeDetails(CookidooShoppingRecipe):
     nutrition_groups: list[CookidooNutritionGroup]
 
 
+@dataclass
+class CookidooRecipeDetailsBatch:
+    """Cookidoo recipe details batch type.
+
+    Attributes
+    ----------
+    recipes
+        The loaded recipe details by id, in the order of the requested ids
+    failures
+        The exceptions by id of the recipes which could not be loaded, in the
+        order of the requested ids
+
+    """
+
+    recipes: dict[str, CookidooShoppingRecipeDetails]
+    failures: dict[str, CookidooException]
+
+
 @dataclass
 class CookidooChapterRecipe:
     """Cookidoo chapter recipe type.
@@ -488,3 +553,20 @@ class CookidooCalendarDay:
     title: str
     recipes: list[CookidooCalendarDayRecipe]
     customer_recipe_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CookidooCalendarPlanDay:
+    """Cookidoo calendar plan day type.
+
+    Attributes
+    ----------
+    recipe_ids
+        The ids of the recipes to plan for the day
+    custom_recipe_ids
+        The ids of the custom recipes to plan for the day
+
+    """
+
+    recipe_ids: list[str] = field(default_factory=list)
+    custom_recipe_ids: list[str] = field(default_factory=list)
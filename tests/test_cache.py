@@ -0,0 +1,196 @@
+"""Unit tests for cookidoo-api."""
+
+from http import HTTPStatus
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.cache import CookidooResultCache
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.types import CookidooConfig
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ADD_RECIPES_TO_CUSTOM_COLLECTION,
+    COOKIDOO_TEST_RESPONSE_GET_CUSTOM_RECIPE,
+    COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+    COOKIDOO_TEST_RESPONSE_SEARCH_RECIPES,
+)
+
+RECIPE_DETAILS_URL = "https://cookidoo.ch/recipes/recipe/de-CH/r907015"
+CUSTOM_RECIPE_URL = (
+    "https://cookidoo.ch/created-recipes/de-CH/01K2CVAB33Y42WEJMFK4M0XEXR"
+)
+SEARCH_URL = "https://cookidoo.ch/search/de"
+CUSTOM_COLLECTION_URL = "https://cookidoo.ch/organize/de-CH/api/custom-list/123"
+
+
+class TestCookidooResultCache:
+    """Tests for the result cache."""
+
+    def test_hits_and_misses(self) -> None:
+        """Test lookups are counted as hits and misses."""
+        cache = CookidooResultCache()
+
+        assert cache.get("get_recipe_details", "r1") is None
+        cache.put("get_recipe_details", "r1", "details")
+
+        assert cache.get("get_recipe_details", "r1") == "details"
+        assert cache.get("get_custom_recipe", "r1") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_ttl_per_method(self) -> None:
+        """Test results expire after the time to live of their method."""
+        cache = CookidooResultCache(ttl={"search_recipes": 10}, default_ttl=100)
+
+        with patch("cookidoo_api.cache.time.monotonic", return_value=0):
+            cache.put("search_recipes", "q", "result")
+            cache.put("get_recipe_details", "r1", "details")
+        with patch("cookidoo_api.cache.time.monotonic", return_value=50):
+            assert cache.get("search_recipes", "q") is None
+            assert cache.get("get_recipe_details", "r1") == "details"
+
+    def test_least_recently_used_is_dropped(self) -> None:
+        """Test the least recently used result is dropped when full."""
+        cache = CookidooResultCache(max_entries=2)
+        cache.put("get_recipe_details", "r1", "one")
+        cache.put("get_recipe_details", "r2", "two")
+        cache.get("get_recipe_details", "r1")
+
+        cache.put("get_recipe_details", "r3", "three")
+
+        assert len(cache) == 2
+        assert cache.get("get_recipe_details", "r2") is None
+        assert cache.get("get_recipe_details", "r1") == "one"
+
+    def test_invalidate(self) -> None:
+        """Test invalidating a single result or all results of a method."""
+        cache = CookidooResultCache()
+        for key in ("r1", "r2"):
+            cache.put("get_recipe_details", key, key)
+            cache.put("get_custom_recipe", key, key)
+
+        cache.invalidate("get_custom_recipe", "r1")
+        assert cache.get("get_custom_recipe", "r1") is None
+        assert cache.get("get_custom_recipe", "r2") == "r2"
+
+        cache.invalidate("get_recipe_details")
+        assert len(cache) == 1
+
+    def test_invalid_size(self) -> None:
+        """Test a cache without room for results is rejected."""
+        with pytest.raises(CookidooConfigException):
+            CookidooResultCache(max_entries=0)
+
+
+class TestCookidooResultCaching:
+    """Tests for the result caching of the Cookidoo client."""
+
+    @pytest.fixture(name="cache")
+    def mock_cache(self) -> CookidooResultCache:
+        """Create a result cache."""
+        return CookidooResultCache()
+
+    @pytest.fixture(name="cookidoo")
+    def mock_cookidoo(
+        self, session: ClientSession, cache: CookidooResultCache
+    ) -> Cookidoo:
+        """Create a Cookidoo client with a result cache."""
+        return Cookidoo(session, result_cache=cache)
+
+    async def test_recipe_details_are_cached(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooResultCache
+    ) -> None:
+        """Test recipe details are loaded once."""
+        mocked.get(
+            RECIPE_DETAILS_URL, payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+
+        first = await cookidoo.get_recipe_details("r907015")
+        second = await cookidoo.get_recipe_details("r907015")
+
+        assert second is first
+        assert len(mocked.requests) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_recipe_details_are_cached_per_language(
+        self, mocked: aioresponses, session: ClientSession, cache: CookidooResultCache
+    ) -> None:
+        """Test recipe details are loaded again when the language changes."""
+        cookidoo = Cookidoo(session, CookidooConfig(), result_cache=cache)
+        for language in ("de-CH", "fr-CH"):
+            mocked.get(
+                f"https://cookidoo.ch/recipes/recipe/{language}/r907015",
+                payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            )
+
+        first = await cookidoo.get_recipe_details("r907015")
+        cookidoo.localization.language = "fr-CH"
+        second = await cookidoo.get_recipe_details("r907015")
+
+        assert second is not first
+        assert len(mocked.requests) == 2
+
+    async def test_search_is_cached_per_query(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test searches are cached per query."""
+        for query in ("chicken", "pasta"):
+            mocked.get(
+                f"{SEARCH_URL}?query={query}",
+                payload=COOKIDOO_TEST_RESPONSE_SEARCH_RECIPES,
+            )
+
+        await cookidoo.search_recipes("chicken")
+        await cookidoo.search_recipes("pasta")
+        await cookidoo.search_recipes("chicken")
+
+        assert len(mocked.requests) == 2
+
+    async def test_collection_change_invalidates_recipe_details(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test changing a collection drops the cached recipe details."""
+        mocked.get(
+            RECIPE_DETAILS_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            repeat=True,
+        )
+        mocked.put(
+            CUSTOM_COLLECTION_URL,
+            payload=COOKIDOO_TEST_RESPONSE_ADD_RECIPES_TO_CUSTOM_COLLECTION,
+        )
+
+        first = await cookidoo.get_recipe_details("r907015")
+        await cookidoo.add_recipes_to_custom_collection("123", ["r907015"])
+
+        assert await cookidoo.get_recipe_details("r907015") is not first
+
+    async def test_removed_custom_recipe_is_invalidated(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooResultCache
+    ) -> None:
+        """Test removing a custom recipe drops its cached result."""
+        mocked.get(CUSTOM_RECIPE_URL, payload=COOKIDOO_TEST_RESPONSE_GET_CUSTOM_RECIPE)
+        mocked.delete(CUSTOM_RECIPE_URL, status=HTTPStatus.NO_CONTENT)
+
+        await cookidoo.get_custom_recipe("01K2CVAB33Y42WEJMFK4M0XEXR")
+        await cookidoo.remove_custom_recipe("01K2CVAB33Y42WEJMFK4M0XEXR")
+
+        assert len(cache) == 0
+
+    async def test_not_cached_by_default(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test results are not cached without a result cache."""
+        cookidoo = Cookidoo(session)
+        mocked.get(
+            RECIPE_DETAILS_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            repeat=True,
+        )
+
+        await cookidoo.get_recipe_details("r907015")
+        await cookidoo.get_recipe_details("r907015")
+
+        assert len(mocked.requests[next(iter(mocked.requests))]) == 2
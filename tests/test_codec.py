@@ -0,0 +1,108 @@
+"""Unit tests for cookidoo-api."""
+
+from http import HTTPStatus
+import sys
+
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.codec import (
+    CookidooJSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_json_codec,
+)
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException, CookidooParseException
+from tests.responses import COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS
+
+CODECS: list[type[CookidooJSONCodec]] = [CookidooJSONCodec, OrjsonCodec, MsgspecCodec]
+
+
+def _codec(codec: type[CookidooJSONCodec]) -> CookidooJSONCodec:
+    """Create a codec or skip the test if its library is not installed."""
+    try:
+        return codec()
+    except CookidooConfigException:
+        pytest.skip(f"{codec.name} is not installed")
+
+
+class TestCodecs:
+    """Tests for the JSON codecs."""
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_roundtrip(self, codec: type[CookidooJSONCodec]) -> None:
+        """Test encoding and decoding round trip to the same object."""
+        instance = _codec(codec)
+        data = {"itemsValue": ["Fleisch", "Käse"], "count": 2, "owned": None}
+
+        encoded = instance.dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert instance.loads(encoded) == data
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_invalid_json(self, codec: type[CookidooJSONCodec]) -> None:
+        """Test malformed input raises a ValueError for every codec."""
+        instance = _codec(codec)
+
+        with pytest.raises(ValueError):
+            instance.loads(b"not json")
+
+    def test_get_json_codec_by_name(self) -> None:
+        """Test getting the standard library codec by name."""
+        assert type(get_json_codec("json")) is CookidooJSONCodec
+
+    def test_get_json_codec_unknown(self) -> None:
+        """Test an unknown codec name is rejected."""
+        with pytest.raises(CookidooConfigException, match="Unknown JSON codec"):
+            get_json_codec("yaml")
+
+    def test_get_json_codec_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test falling back to the standard library without optional codecs."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        assert type(get_json_codec()) is CookidooJSONCodec
+        with pytest.raises(CookidooConfigException):
+            get_json_codec("orjson")
+
+
+class TestCookidooCodec:
+    """Tests for the codec usage of the Cookidoo client."""
+
+    @pytest.mark.parametrize("codec", CODECS)
+    async def test_request_and_response(
+        self, mocked: aioresponses, cookidoo: Cookidoo, codec: type[CookidooJSONCodec]
+    ) -> None:
+        """Test the codec encodes the request body and decodes the response."""
+        cookidoo._json_codec = _codec(codec)
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.add_additional_items(["Fleisch", "Fisch"])
+
+        assert [item.name for item in data] == ["Fleisch", "Fisch"]
+        request = next(iter(mocked.requests.values()))[0]
+        assert request.kwargs["headers"]["Content-Type"] == "application/json"
+        assert cookidoo._json_codec.loads(request.kwargs["data"]) == {
+            "itemsValue": ["Fleisch", "Fisch"]
+        }
+
+    @pytest.mark.parametrize("codec", CODECS)
+    async def test_parse_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo, codec: type[CookidooJSONCodec]
+    ) -> None:
+        """Test malformed responses raise a parse exception for every codec."""
+        cookidoo._json_codec = _codec(codec)
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            status=HTTPStatus.OK,
+            body="not json",
+        )
+
+        with pytest.raises(CookidooParseException):
+            await cookidoo.get_user_info()
@@ -0,0 +1,248 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import aclosing
+from functools import partial
+import gc
+
+import pytest
+
+from cookidoo_api.concurrency import MicroBatcher, completed, prefetch
+
+
+class _Calls:
+    """Calls sleeping for the given delays, tracking the calls in flight."""
+
+    def __init__(self, delays: list[float]) -> None:
+        self.delays = delays
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def __iter__(self) -> Iterator[Callable[[], Awaitable[int]]]:
+        return (self._call(i) for i in range(len(self.delays)))
+
+    def _call(self, i: int) -> Callable[[], Awaitable[int]]:
+        async def call() -> int:
+            self.started.append(i)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await asyncio.sleep(self.delays[i])
+            except asyncio.CancelledError:
+                self.cancelled.append(i)
+                raise
+            finally:
+                self.in_flight -= 1
+            if self.delays[i] < 0:
+                raise ValueError(i)
+            return i
+
+        return call
+
+
+class TestPrefetch:
+    """Tests for the ordered prefetch."""
+
+    async def test_in_order(self) -> None:
+        """Test results are yielded in the order of the calls."""
+        calls = _Calls([0.03, 0.01, 0.02, 0.0, 0.01])
+
+        assert [result async for result in prefetch(calls, 2)] == [0, 1, 2, 3, 4]
+        assert calls.peak == 2
+
+    async def test_window_ahead_of_consumer(self) -> None:
+        """Test no more than the window is fetched ahead of the consumer."""
+        calls = _Calls([0.0] * 10)
+
+        results = prefetch(calls, 3)
+        assert await anext(results) == 0
+        await asyncio.sleep(0.01)
+        assert calls.started == [0, 1, 2, 3]
+        await results.aclose()
+
+    async def test_early_stop(self) -> None:
+        """Test the calls in flight are cancelled when the consumer stops."""
+        calls = _Calls([0.0, 1.0, 1.0, 1.0])
+
+        async with aclosing(prefetch(calls, 3)) as results:
+            assert await anext(results) == 0
+            await asyncio.sleep(0.01)
+
+        assert calls.started == [0, 1, 2, 3]
+        assert sorted(calls.cancelled) == [1, 2, 3]
+        assert calls.in_flight == 0
+
+    async def test_failure(self) -> None:
+        """Test a failing call raises and cancels the calls in flight."""
+        calls = _Calls([-0.01, 1.0])
+
+        with pytest.raises(ValueError):
+            async for _ in prefetch(calls, 2):
+                pass
+        assert calls.cancelled == [1]
+
+
+class TestCompleted:
+    """Tests for the completion order iteration."""
+
+    async def test_completion_order(self) -> None:
+        """Test results are yielded as the calls complete."""
+        events = [asyncio.Event() for _ in range(4)]
+
+        async def call(i: int) -> int:
+            await events[i].wait()
+            return i
+
+        async with aclosing(
+            completed([partial(call, i) for i in range(4)], 4)
+        ) as results:
+            for i in (2, 1, 3, 0):
+                events[i].set()
+                assert await anext(results) == i
+
+    async def test_limit(self) -> None:
+        """Test at most ``limit`` calls are in flight."""
+        calls = _Calls([0.01] * 10)
+
+        assert sorted([result async for result in completed(calls, 3)]) == list(
+            range(10)
+        )
+        assert calls.peak == 3
+
+    async def test_early_stop(self) -> None:
+        """Test the calls in flight are cancelled when the consumer stops."""
+        calls = _Calls([0.0, 1.0, 1.0])
+
+        async with aclosing(completed(calls, 3)) as results:
+            assert await anext(results) == 0
+
+        assert sorted(calls.cancelled) == [1, 2]
+        assert calls.in_flight == 0
+
+    async def test_failures_are_retrieved(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test the failures finished together are all retrieved."""
+
+        async def fail() -> int:
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            async for _ in completed([fail, fail, fail], 3):
+                pass
+        gc.collect()
+
+        assert "never retrieved" not in caplog.text
+
+
+class _Send:
+    """A batched call returning the keys upper cased, tracking the batches."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self.error = error
+
+    async def __call__(self, keys: list[str]) -> list[tuple[str, str]]:
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return [(key, f"{key.upper()}{i}") for i, key in enumerate(keys)]
+
+
+class TestMicroBatcher:
+    """Tests for the micro batching."""
+
+    async def test_merge(self) -> None:
+        """Test calls within the window are merged and split back by key."""
+        send = _Send()
+        batcher = MicroBatcher(send, 0.01, 10)
+
+        results = list(
+            await asyncio.gather(
+                batcher.submit(["a", "b"]), batcher.submit(["c"]), batcher.submit([])
+            )
+        )
+
+        assert results == [["A0", "B1"], ["C2"], []]
+        assert send.batches == [["a", "b", "c"]]
+
+    async def test_max_size(self) -> None:
+        """Test a batch is sent once it reaches the maximum size."""
+        send = _Send()
+        batcher = MicroBatcher(send, 60, 2)
+
+        results = list(
+            await asyncio.gather(
+                batcher.submit(["a"]),
+                batcher.submit(["b"]),
+                batcher.submit(["c", "d", "e"]),
+            )
+        )
+
+        assert results == [["A0"], ["B1"], ["C0", "D1", "E2"]]
+        assert send.batches == [["a", "b"], ["c", "d", "e"]]
+
+    async def test_duplicate_keys(self) -> None:
+        """Test a key submitted twice takes the next result, or the last one."""
+        send = _Send()
+        batcher = MicroBatcher(send, 0.01, 10)
+
+        async def once(keys: list[str]) -> list[tuple[str, str]]:
+            await send(keys)
+            return [("a", "A")]
+
+        results = await asyncio.gather(batcher.submit(["a"]), batcher.submit(["a"]))
+        assert list(results) == [["A0"], ["A1"]]
+        batcher = MicroBatcher(once, 0.01, 10)
+        results = await asyncio.gather(batcher.submit(["a"]), batcher.submit(["a"]))
+        assert list(results) == [["A"], ["A"]]
+
+    async def test_failure(self) -> None:
+        """Test the calls of a failed batch raise its exception."""
+        batcher = MicroBatcher(_Send(ValueError()), 0.01, 10)
+
+        results = await asyncio.gather(
+            batcher.submit(["a"]), batcher.submit(["b"]), return_exceptions=True
+        )
+
+        assert [type(result) for result in results] == [ValueError, ValueError]
+
+    async def test_cancelled_call(self) -> None:
+        """Test a cancelled call does not cancel the batch of the other calls."""
+        send = _Send()
+        batcher = MicroBatcher(send, 0.01, 10)
+
+        cancelled = asyncio.ensure_future(batcher.submit(["a"]))
+        result = asyncio.ensure_future(batcher.submit(["b"]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await result == ["B1"]
+        assert send.batches == [["a", "b"]]
+
+    async def test_fold(self) -> None:
+        """Test keys folded to the same value are sent once with the latest."""
+        send = _Send()
+        batcher = MicroBatcher(send, 0.01, 10, fold=str.lower)
+
+        results = await asyncio.gather(
+            batcher.submit(["a"]), batcher.submit(["b"]), batcher.submit(["A"])
+        )
+
+        assert list(results) == [["A0"], ["B1"], ["A0"]]
+        assert send.batches == [["A", "b"]]
+
+    async def test_flush(self) -> None:
+        """Test flushing sends the batch without waiting for the window."""
+        send = _Send()
+        batcher = MicroBatcher(send, 60, 10)
+
+        future = batcher.submit_nowait(["a"])
+        await batcher.flush()
+
+        assert future.result() == ["A0"]
+        assert send.batches == [["a"]]
@@ -0,0 +1,242 @@
+"""Unit tests for cookidoo-api."""
+
+from datetime import date
+from http import HTTPStatus
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from multidict import CIMultiDict
+import pytest
+from yarl import URL
+
+from cookidoo_api.conditional import ConditionalCache
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.helpers import cookidoo_shopping_list_from_json
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK,
+    COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+)
+
+SHOPPING_LIST_URL = "https://cookidoo.ch/shopping/de-CH"
+CALENDAR_WEEK_URL = "https://cookidoo.ch/planning/de-CH/api/my-week/2025-03-04"
+
+
+def _sent_headers(mocked: aioresponses, url: str) -> list[dict[str, str]]:
+    """Get the headers of all requests sent to a url."""
+    return [
+        call.kwargs["headers"]
+        for (_, request_url), calls in mocked.requests.items()
+        if request_url == URL(url)
+        for call in calls
+    ]
+
+
+class TestConditionalCache:
+    """Tests for the conditional request cache."""
+
+    def test_validators_are_sent(self) -> None:
+        """Test the validators of the last response become request headers."""
+        cache = ConditionalCache()
+        key = ConditionalCache.key(URL(SHOPPING_LIST_URL), None, None)
+        assert cache.headers(key) == {}
+
+        cache.resolve(
+            key,
+            HTTPStatus.OK,
+            CIMultiDict(
+                {"ETag": '"v1"', "Last-Modified": "Tue, 04 Mar 2025 10:00:00 GMT"}
+            ),
+            b"{}",
+            dict,
+        )
+
+        assert cache.headers(key) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Tue, 04 Mar 2025 10:00:00 GMT",
+        }
+
+    def test_unchanged_body_is_not_decoded(self) -> None:
+        """Test a body hashing to the previous one reuses the decoded body."""
+        cache = ConditionalCache()
+        key = ConditionalCache.key(URL(SHOPPING_LIST_URL), None, None)
+        first = cache.resolve(key, HTTPStatus.OK, {}, b"{}", dict)
+
+        assert cache.resolve(key, HTTPStatus.OK, {}, b"{}", dict) is first
+        assert cache.resolve(key, HTTPStatus.OK, {}, b"[]", list) is not first
+
+    def test_converted_result_is_reused(self) -> None:
+        """Test the parsed result is reused while the body is unchanged."""
+        cache = ConditionalCache()
+        key = ConditionalCache.key(URL(SHOPPING_LIST_URL), None, None)
+        body = cache.resolve(key, HTTPStatus.OK, {}, b"{}", dict)
+
+        first = cache.convert(key, "loading", body, lambda _: object())
+
+        assert cache.convert(key, "loading", body, lambda _: object()) is first
+        assert cache.convert(key, "other", body, lambda _: object()) is not first
+        assert cache.convert(key, "loading", {}, lambda _: object()) is not first
+
+    def test_dropped_resource(self) -> None:
+        """Test a 304 is recognized for a resource no longer cached."""
+        cache = ConditionalCache()
+        key = ConditionalCache.key(URL(SHOPPING_LIST_URL), None, None)
+        assert cache.is_dropped(key, HTTPStatus.NOT_MODIFIED)
+        assert not cache.is_dropped(key, HTTPStatus.OK)
+
+        cache.resolve(key, HTTPStatus.OK, CIMultiDict(ETag='"v1"'), b"{}", dict)
+
+        assert not cache.is_dropped(key, HTTPStatus.NOT_MODIFIED)
+        assert ConditionalCache.without_validators(
+            {"Accept": "application/json", **cache.headers(key)}
+        ) == {"Accept": "application/json"}
+
+    def test_least_recently_used_is_dropped(self) -> None:
+        """Test the least recently used resource is dropped when full."""
+        cache = ConditionalCache(max_entries=2)
+        keys = [
+            ConditionalCache.key(URL(SHOPPING_LIST_URL), {"page": str(page)}, None)
+            for page in range(3)
+        ]
+        for key in keys:
+            cache.resolve(
+                key, HTTPStatus.OK, CIMultiDict(ETag=key[1][0][1]), b"{}", dict
+            )
+
+        assert len(cache) == 2
+        assert cache.headers(keys[0]) == {}
+        assert cache.headers(keys[2]) == {"If-None-Match": "2"}
+
+
+class TestCookidooConditionalRequests:
+    """Tests for the conditional requests of the Cookidoo client."""
+
+    @pytest.fixture(name="cookidoo")
+    def conditional_client(self, session: ClientSession) -> Cookidoo:
+        """Create a Cookidoo instance with conditional requests."""
+        return Cookidoo(session, conditional_requests=True)
+
+    async def test_not_modified_returns_previous_result(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a 304 response returns the previous result without parsing."""
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            headers={"ETag": '"v1"'},
+        )
+        mocked.get(SHOPPING_LIST_URL, status=HTTPStatus.NOT_MODIFIED)
+
+        first = await cookidoo.get_shopping_list()
+        with patch(
+            "cookidoo_api.cookidoo.cookidoo_shopping_list_from_json",
+            side_effect=cookidoo_shopping_list_from_json,
+        ) as convert:
+            second = await cookidoo.get_shopping_list()
+
+        assert second is first
+        convert.assert_not_called()
+        headers = _sent_headers(mocked, SHOPPING_LIST_URL)
+        assert "If-None-Match" not in headers[0]
+        assert headers[1]["If-None-Match"] == '"v1"'
+
+    async def test_not_modified_after_drop_is_loaded_again(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a 304 for a dropped resource sends the request without validators."""
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            headers={"ETag": '"v1"'},
+        )
+        cache = cookidoo._conditional_cache
+        assert cache is not None
+        # Other polled resources drop the cached body while the request is in flight
+        mocked.get(
+            SHOPPING_LIST_URL,
+            status=HTTPStatus.NOT_MODIFIED,
+            callback=lambda *_, **__: cache.clear(),
+        )
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            headers={"ETag": '"v1"'},
+        )
+
+        first = await cookidoo.get_shopping_list()
+        second = await cookidoo.get_shopping_list()
+
+        assert second == first
+        headers = _sent_headers(mocked, SHOPPING_LIST_URL)
+        assert headers[1]["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in headers[2]
+
+    async def test_unchanged_body_skips_conversion(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test an unchanged body without validators skips the conversion."""
+        for _ in range(2):
+            mocked.get(CALENDAR_WEEK_URL, payload=COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK)
+
+        first = await cookidoo.get_recipes_in_calendar_week(date(2025, 3, 4))
+        with patch("cookidoo_api.cookidoo.cookidoo_calendar_day_from_json") as convert:
+            second = await cookidoo.get_recipes_in_calendar_week(date(2025, 3, 4))
+
+        assert second is first
+        convert.assert_not_called()
+
+    async def test_changed_body_is_converted(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a changed body is converted again."""
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            headers={"ETag": '"v1"'},
+        )
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload={**COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES, "recipes": []},
+            headers={"ETag": '"v2"'},
+        )
+
+        first = await cookidoo.get_shopping_list_recipes()
+        second = await cookidoo.get_shopping_list_recipes()
+
+        assert first
+        assert second == []
+
+    async def test_getters_share_the_resource(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test each getter keeps its own result of a shared resource."""
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            headers={"ETag": '"v1"'},
+        )
+        mocked.get(SHOPPING_LIST_URL, status=HTTPStatus.NOT_MODIFIED, repeat=True)
+
+        recipes = await cookidoo.get_shopping_list_recipes()
+        items = await cookidoo.get_ingredient_items()
+
+        assert items
+        assert await cookidoo.get_shopping_list_recipes() is recipes
+        assert await cookidoo.get_ingredient_items() is items
+
+    async def test_disabled(self, mocked: aioresponses, session: ClientSession) -> None:
+        """Test no validators are sent by default."""
+        cookidoo = Cookidoo(session)
+        for _ in range(2):
+            mocked.get(
+                SHOPPING_LIST_URL,
+                payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+                headers={"ETag": '"v1"'},
+            )
+
+        first = await cookidoo.get_shopping_list()
+        second = await cookidoo.get_shopping_list()
+
+        assert second == first
+        assert second is not first
+        assert "If-None-Match" not in _sent_headers(mocked, SHOPPING_LIST_URL)[1]
@@ -1,26 +1,39 @@
 """Unit tests for cookidoo-api."""
 
-from datetime import datetime
+import asyncio
+from collections.abc import Callable
+from contextlib import aclosing
+from datetime import date, datetime
 from http import HTTPStatus
+import json
+import logging
+import re
+from typing import Any
+from unittest.mock import ANY, patch
 
 from aiohttp import ClientError, ClientSession
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from dotenv import load_dotenv
 import pytest
+from yarl import URL
 
 from cookidoo_api.cookidoo import Cookidoo
 from cookidoo_api.exceptions import (
     CookidooAuthException,
+    CookidooConfigException,
     CookidooException,
     CookidooParseException,
     CookidooRequestException,
 )
 from cookidoo_api.helpers import get_localization_options
+from cookidoo_api.retry import CookidooRetryPolicy
 from cookidoo_api.types import (
     CookidooAdditionalItem,
+    CookidooCalendarPlanDay,
     CookidooConfig,
     CookidooIngredientItem,
     CookidooSearchResult,
+    CookidooShoppingListPlan,
     ThermomixMachineType,
 )
 from tests.responses import (
@@ -59,6 +72,21 @@ from tests.responses import (
 load_dotenv()
 
 
+def _count_requests(mocked: aioresponses, url: str) -> int:
+    """Count the requests sent to a url."""
+    return sum(
+        len(calls)
+        for (_, request_url), calls in mocked.requests.items()
+        if request_url == URL(url)
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the backoff delays of retried requests."""
+    monkeypatch.setattr(CookidooRetryPolicy, "backoff", lambda self, attempt: 0.0)
+
+
 class TestGetterSetter:
     """Tests for getter and setter."""
 
@@ -319,6 +347,400 @@ class TestCookiePersistence:
         cookidoo.save_cookies(cookie_file)
 
 
+class TestRequestJson:
+    """Tests for the shared request pipeline."""
+
+    async def test_response_body_log_is_capped(
+        self,
+        mocked: aioresponses,
+        session: ClientSession,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test the logged response body is capped at the configured limit."""
+        cookidoo = Cookidoo(session, log_body_limit=16)
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+        )
+
+        with caplog.at_level(logging.DEBUG, logger="cookidoo_api.cookidoo"):
+            await cookidoo.get_user_info()
+
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.getMessage().startswith("Response from")
+        ]
+        assert len(messages) == 1
+        assert messages[0].endswith(" bytes)")
+        assert "userInfo" not in messages[0]
+
+    async def test_response_body_not_logged_without_debug(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test the response body is not formatted when debug logging is off."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+        )
+
+        with (
+            caplog.at_level(logging.INFO, logger="cookidoo_api.cookidoo"),
+            patch.object(Cookidoo, "_format_body_for_log", side_effect=AssertionError),
+        ):
+            user_info = await cookidoo.get_user_info()
+
+        assert user_info.username
+
+    async def test_empty_body(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test an empty successful body parses to None."""
+        mocked.get(
+            "https://cookidoo.ch/search/de",
+            status=HTTPStatus.OK,
+            body="",
+        )
+
+        data = await cookidoo.search_recipes()
+        assert data == CookidooSearchResult(recipes=[], total=0)
+
+
+class TestConcurrency:
+    """Tests for the concurrency limit."""
+
+    async def test_max_concurrency(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test requests beyond the limit are queued until a slot is free."""
+        cookidoo = Cookidoo(session, max_concurrency=2, coalesce_requests=False)
+        release = asyncio.Event()
+        peak = 0
+
+        async def _hold(url: object, **kwargs: object) -> CallbackResult:
+            nonlocal peak
+            peak = max(peak, cookidoo.in_flight_requests)
+            await release.wait()
+            return CallbackResult(payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        mocked.get("https://cookidoo.ch/community/profile", callback=_hold, repeat=True)
+
+        tasks = [asyncio.create_task(cookidoo.get_user_info()) for _ in range(5)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert cookidoo.in_flight_requests == 2
+        assert cookidoo.queued_requests == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert peak == 2
+        assert cookidoo.in_flight_requests == 0
+        assert cookidoo.queued_requests == 0
+
+    async def test_cancelled_while_queued(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test a request cancelled while queued releases its place."""
+        cookidoo = Cookidoo(session, max_concurrency=1, coalesce_requests=False)
+        release = asyncio.Event()
+
+        async def _hold(url: object, **kwargs: object) -> CallbackResult:
+            await release.wait()
+            return CallbackResult(payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        mocked.get("https://cookidoo.ch/community/profile", callback=_hold, repeat=True)
+
+        first = asyncio.create_task(cookidoo.get_user_info())
+        second = asyncio.create_task(cookidoo.get_user_info())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert cookidoo.queued_requests == 1
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert cookidoo.queued_requests == 0
+
+        release.set()
+        assert await first
+        assert cookidoo.in_flight_requests == 0
+
+    async def test_invalid_max_concurrency(self, session: ClientSession) -> None:
+        """Test the concurrency limit must be positive."""
+        with pytest.raises(CookidooConfigException):
+            Cookidoo(session, max_concurrency=0)
+
+
+class TestCoalescing:
+    """Tests for the coalescing of identical GET requests."""
+
+    @staticmethod
+    def _hold(release: asyncio.Event, payload: dict[str, Any]) -> Callable[..., Any]:
+        """Create a mock callback answering once the event is set."""
+
+        async def _callback(url: object, **kwargs: object) -> CallbackResult:
+            await release.wait()
+            return CallbackResult(payload=payload)
+
+        return _callback
+
+    async def test_identical_requests_share_one_request(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test identical concurrent GET requests are sent once."""
+        release = asyncio.Event()
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            callback=self._hold(release, COOKIDOO_TEST_RESPONSE_USER_INFO),
+            repeat=True,
+        )
+
+        tasks = [asyncio.create_task(cookidoo.get_user_info()) for _ in range(3)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results[0] == results[1] == results[2]
+        assert _count_requests(mocked, "https://cookidoo.ch/community/profile") == 1
+
+        # A later request is not served from the finished one
+        await cookidoo.get_user_info()
+        assert _count_requests(mocked, "https://cookidoo.ch/community/profile") == 2
+
+    async def test_different_params_are_not_shared(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test GET requests with different query params are sent separately."""
+        for page in range(2):
+            mocked.get(
+                f"https://cookidoo.ch/organize/de-CH/api/managed-list?page={page}",
+                payload=COOKIDOO_TEST_RESPONSE_GET_MANAGED_COLLECTIONS,
+                status=HTTPStatus.OK,
+            )
+
+        await asyncio.gather(
+            cookidoo.get_managed_collections(0), cookidoo.get_managed_collections(1)
+        )
+
+        assert len(mocked.requests) == 2
+
+    async def test_cancelled_waiter_does_not_cancel_shared_request(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test cancelling one waiter leaves the shared request running."""
+        release = asyncio.Event()
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            callback=self._hold(release, COOKIDOO_TEST_RESPONSE_USER_INFO),
+        )
+
+        first = asyncio.create_task(cookidoo.get_user_info())
+        second = asyncio.create_task(cookidoo.get_user_info())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        assert (await second).username
+
+    async def test_failure_is_shared(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test all waiters of a shared request receive its failure."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            status=HTTPStatus.UNAUTHORIZED,
+            payload={"error_description": ""},
+        )
+
+        results = await asyncio.gather(
+            cookidoo.get_user_info(), cookidoo.get_user_info(), return_exceptions=True
+        )
+
+        assert all(isinstance(result, CookidooAuthException) for result in results)
+
+    async def test_mutations_are_not_shared(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test identical concurrent mutations are all sent."""
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+
+        await asyncio.gather(
+            cookidoo.add_additional_items(["Fleisch"]),
+            cookidoo.add_additional_items(["Fleisch"]),
+        )
+
+        assert (
+            _count_requests(
+                mocked, "https://cookidoo.ch/shopping/de-CH/additional-items/add"
+            )
+            == 2
+        )
+
+
+class TestAutoLogin:
+    """Tests for logging in again after an authorization failure."""
+
+    @pytest.fixture(name="cookidoo")
+    def mock_cookidoo(self, session: ClientSession) -> Cookidoo:
+        """Create a Cookidoo client logging in again on 401."""
+        return Cookidoo(session, auto_login=True, coalesce_requests=False)
+
+    async def test_request_is_replayed(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a request failing with 401 is replayed after logging in."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile", status=HTTPStatus.UNAUTHORIZED
+        )
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+        )
+
+        with patch.object(Cookidoo, "login") as login:
+            assert await cookidoo.get_user_info()
+        login.assert_awaited_once()
+
+    async def test_concurrent_failures_share_one_login(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test requests failing together log in only once."""
+        for _ in range(5):
+            mocked.get(
+                "https://cookidoo.ch/community/profile",
+                status=HTTPStatus.UNAUTHORIZED,
+            )
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            repeat=True,
+        )
+
+        async def _login() -> None:
+            await asyncio.sleep(0.01)
+
+        with patch.object(Cookidoo, "login", side_effect=_login) as login:
+            results = await asyncio.gather(
+                *(cookidoo.get_user_info() for _ in range(5))
+            )
+
+        assert all(results)
+        login.assert_awaited_once()
+        assert _count_requests(mocked, "https://cookidoo.ch/community/profile") == 10
+
+    async def test_failed_login_is_not_retried(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a failed login is attempted once and raised."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            status=HTTPStatus.UNAUTHORIZED,
+            repeat=True,
+        )
+
+        # Without authentication cookies the credentials are invalid
+        with patch.object(
+            Cookidoo, "login", side_effect=cookidoo._verify_auth_cookies
+        ) as login:
+            results = await asyncio.gather(
+                *(cookidoo.get_user_info() for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, CookidooAuthException) for result in results)
+        login.assert_awaited_once()
+        assert _count_requests(mocked, "https://cookidoo.ch/community/profile") == 3
+
+    async def test_login_page_failure_is_retried_later(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a login failing to reach the login page does not stop logins."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile", status=HTTPStatus.UNAUTHORIZED
+        )
+        mocked.get(
+            "https://cookidoo.ch/community/profile", status=HTTPStatus.UNAUTHORIZED
+        )
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+        )
+
+        with patch.object(
+            Cookidoo,
+            "login",
+            side_effect=[CookidooAuthException("Login page unreachable"), None],
+        ):
+            with pytest.raises(CookidooAuthException):
+                await cookidoo.get_user_info()
+            assert await cookidoo.get_user_info()
+
+    async def test_invalid_credentials_stop_logins(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test no login is attempted after a login with invalid credentials."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile", status=HTTPStatus.UNAUTHORIZED
+        )
+        with pytest.raises(CookidooAuthException):
+            cookidoo._verify_auth_cookies()
+
+        with (
+            patch.object(Cookidoo, "login") as login,
+            pytest.raises(CookidooAuthException),
+        ):
+            await cookidoo.get_user_info()
+        login.assert_not_awaited()
+
+    async def test_replay_is_not_repeated(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a replayed request failing with 401 again is raised."""
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            status=HTTPStatus.UNAUTHORIZED,
+            repeat=True,
+        )
+
+        with (
+            patch.object(Cookidoo, "login") as login,
+            pytest.raises(CookidooAuthException),
+        ):
+            await cookidoo.get_user_info()
+        login.assert_awaited_once()
+        assert _count_requests(mocked, "https://cookidoo.ch/community/profile") == 2
+
+    async def test_disabled_by_default(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test no login is attempted without auto login."""
+        cookidoo = Cookidoo(session)
+        mocked.get(
+            "https://cookidoo.ch/community/profile", status=HTTPStatus.UNAUTHORIZED
+        )
+
+        with (
+            patch.object(Cookidoo, "login") as login,
+            pytest.raises(CookidooAuthException),
+        ):
+            await cookidoo.get_user_info()
+        login.assert_not_awaited()
+
+
 class TestGetUserInfo:
     """Tests for get_user_info method."""
 
@@ -627,6 +1049,114 @@ class TestGetRecipeDetails:
             await cookidoo.get_recipe_details("r907015")
 
 
+class TestGetRecipeDetailsMany:
+    """Tests for get_recipe_details_many and iter_recipe_details methods."""
+
+    async def test_get_recipe_details_many(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test duplicate ids are loaded once and kept in order."""
+        for id in ("r907015", "r59322"):
+            mocked.get(
+                f"https://cookidoo.ch/recipes/recipe/de-CH/{id}",
+                payload={**COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS, "id": id},
+            )
+
+        batch = await cookidoo.get_recipe_details_many(["r59322", "r907015", "r59322"])
+
+        assert list(batch.recipes) == ["r59322", "r907015"]
+        assert batch.recipes["r907015"].id == "r907015"
+        assert not batch.failures
+        assert (
+            _count_requests(mocked, "https://cookidoo.ch/recipes/recipe/de-CH/r59322")
+            == 1
+        )
+
+    async def test_failures(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test a recipe failing to load does not fail the others."""
+        mocked.get(
+            "https://cookidoo.ch/recipes/recipe/de-CH/r907015",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+        )
+        mocked.get(
+            "https://cookidoo.ch/recipes/recipe/de-CH/r59322",
+            status=HTTPStatus.OK,
+            body="not json",
+            content_type="application/json",
+        )
+
+        batch = await cookidoo.get_recipe_details_many(["r59322", "r907015"])
+
+        assert list(batch.recipes) == ["r907015"]
+        assert list(batch.failures) == ["r59322"]
+        assert isinstance(batch.failures["r59322"], CookidooParseException)
+
+    async def test_concurrency(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test at most ``concurrency`` recipes are loaded at once."""
+        cookidoo = Cookidoo(session)
+        loading = 0
+        peak = 0
+
+        async def _load(url: URL, **kwargs: object) -> CallbackResult:
+            nonlocal loading, peak
+            loading += 1
+            peak = max(peak, loading)
+            await asyncio.sleep(0.01)
+            loading -= 1
+            return CallbackResult(
+                payload={
+                    **COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+                    "id": url.name,
+                }
+            )
+
+        mocked.get(
+            re.compile(r"https://cookidoo\.ch/recipes/recipe/de-CH/.*"),
+            callback=_load,
+            repeat=True,
+        )
+
+        batch = await cookidoo.get_recipe_details_many(
+            [f"r{i}" for i in range(10)], concurrency=3
+        )
+
+        assert list(batch.recipes) == [f"r{i}" for i in range(10)]
+        assert peak == 3
+
+    async def test_iter_recipe_details(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test recipe details are yielded as they are loaded."""
+        release = asyncio.Event()
+
+        async def _hold(url: URL, **kwargs: object) -> CallbackResult:
+            await release.wait()
+            return CallbackResult(payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS)
+
+        mocked.get("https://cookidoo.ch/recipes/recipe/de-CH/r59322", callback=_hold)
+        mocked.get(
+            "https://cookidoo.ch/recipes/recipe/de-CH/r907015",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+        )
+
+        results = cookidoo.iter_recipe_details(["r59322", "r907015"])
+        id, details = await anext(results)
+        assert id == "r907015"
+        assert not isinstance(details, CookidooException)
+        assert details.name == "Kokos Pralinen"
+
+        release.set()
+        id, _ = await anext(results)
+        assert id == "r59322"
+
+    async def test_invalid_concurrency(self, cookidoo: Cookidoo) -> None:
+        """Test the concurrency must be positive."""
+        with pytest.raises(CookidooConfigException):
+            await cookidoo.get_recipe_details_many(["r907015"], concurrency=0)
+
+
 class TestSearchRecipes:
     """Tests for search_recipes method."""
 
@@ -890,6 +1420,127 @@ class TestSearchRecipes:
             await cookidoo.search_recipes("chicken")
 
 
+# The url of a search page as sent, with the page before the query
+PAGE_URL = "https://cookidoo.ch/search/de?page={}&query=chicken"
+
+
+class TestSearchRecipesIter:
+    """Tests for search_recipes_iter method."""
+
+    @staticmethod
+    def _mock_page(mocked: aioresponses, url: str, ids: list[str], total: int) -> None:
+        """Mock a page of search hits."""
+        mocked.get(
+            url,
+            payload={
+                "data": [{"id": id, "title": f"Recipe {id}"} for id in ids],
+                "total": total,
+            },
+        )
+
+    async def test_search_recipes_iter(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test hits of all pages are yielded in order without duplicates."""
+        url = "https://cookidoo.ch/search/de?query=chicken&tags=soup&page={}&pageSize=2"
+        self._mock_page(mocked, url.format(0), ["r1", "r2"], 5)
+        self._mock_page(mocked, url.format(1), ["r2", "r3"], 5)
+        self._mock_page(mocked, url.format(2), ["r4", "r5"], 5)
+
+        hits = [
+            hit.id
+            async for hit in cookidoo.search_recipes_iter(
+                "chicken", tags="soup", page_size=2
+            )
+        ]
+
+        assert hits == ["r1", "r2", "r3", "r4", "r5"]
+
+    async def test_page_size_of_first_page(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the number of pages follows the size of the first page."""
+        url = "https://cookidoo.ch/search/de?query=chicken&page={}"
+        self._mock_page(mocked, url.format(1), ["r1", "r2"], 6)
+        self._mock_page(mocked, url.format(2), ["r3", "r4"], 6)
+
+        hits = [hit.id async for hit in cookidoo.search_recipes_iter("chicken", page=1)]
+
+        assert hits == ["r1", "r2", "r3", "r4"]
+        assert _count_requests(mocked, PAGE_URL.format(3)) == 0
+
+    async def test_limit(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test no more than the limit is yielded."""
+        url = "https://cookidoo.ch/search/de?query=chicken&page={}"
+        for page in range(5):
+            self._mock_page(mocked, url.format(page), [f"r{page}a", f"r{page}b"], 10)
+
+        hits = [
+            hit.id
+            async for hit in cookidoo.search_recipes_iter("chicken", limit=3, window=1)
+        ]
+
+        assert hits == ["r0a", "r0b", "r1a"]
+        assert [
+            _count_requests(mocked, PAGE_URL.format(page)) for page in range(5)
+        ] == [
+            1,
+            1,
+            0,
+            0,
+            0,
+        ]
+
+    async def test_limit_caps_prefetch(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test no page beyond the limit is prefetched."""
+        url = "https://cookidoo.ch/search/de?query=chicken&page={}"
+        for page in range(4):
+            self._mock_page(
+                mocked, url.format(page), [f"r{page}-{i}" for i in range(20)], 80
+            )
+
+        async with aclosing(cookidoo.search_recipes_iter("chicken", limit=5)) as hits:
+            assert [hit.id async for hit in hits] == [f"r0-{i}" for i in range(5)]
+
+        assert [
+            _count_requests(mocked, PAGE_URL.format(page)) for page in range(4)
+        ] == [
+            1,
+            0,
+            0,
+            0,
+        ]
+
+    async def test_empty_page(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test the iteration stops at a page without hits."""
+        url = "https://cookidoo.ch/search/de?query=chicken&page={}"
+        self._mock_page(mocked, url.format(0), ["r1", "r2"], 6)
+        self._mock_page(mocked, url.format(1), [], 6)
+        self._mock_page(mocked, url.format(2), ["r3", "r4"], 6)
+
+        hits = [
+            hit.id async for hit in cookidoo.search_recipes_iter("chicken", window=1)
+        ]
+
+        assert hits == ["r1", "r2"]
+
+    async def test_no_hits(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test a search without hits loads a single page."""
+        self._mock_page(
+            mocked, "https://cookidoo.ch/search/de?query=chicken&page=0", [], 0
+        )
+
+        assert [hit async for hit in cookidoo.search_recipes_iter("chicken")] == []
+
+    async def test_invalid_window(self, cookidoo: Cookidoo) -> None:
+        """Test the prefetch window must be positive."""
+        with pytest.raises(CookidooConfigException):
+            async for _ in cookidoo.search_recipes_iter("chicken", window=0):
+                pass
+
+
 class TestGetCustomRecipe:
     """Tests for get_custom_recipe method."""
 
@@ -1202,15 +1853,129 @@ class TestRemoveCustomRecipe:
         exception: type[CookidooException],
     ) -> None:
         """Test parse exceptions."""
-        mocked.delete(
-            "https://cookidoo.ch/created-recipes/de-CH/01K2CTJ9Y1BABRG5MXK44CFZS4",
+        mocked.delete(
+            "https://cookidoo.ch/created-recipes/de-CH/01K2CTJ9Y1BABRG5MXK44CFZS4",
+            status=status,
+            body="not json",
+            content_type="application/json",
+        )
+
+        with pytest.raises(exception):
+            await cookidoo.remove_custom_recipe("01K2CTJ9Y1BABRG5MXK44CFZS4")
+
+
+class TestGetShoppingList:
+    """Tests for get_shopping_list method."""
+
+    async def test_get_shopping_list(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test for get_shopping_list."""
+
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS_FOR_CUSTOM_RECIPES
+            | {
+                "additionalItems": COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS[
+                    "additionalItems"
+                ]
+            },
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.get_shopping_list()
+        assert len(data.recipes) == 1
+        assert len(data.ingredient_items) == 10
+        assert len(data.additional_items) == 2
+        assert len(mocked.requests) == 1
+
+    async def test_getters_read_from_shopping_list(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the getters read their part from a loaded shopping list."""
+
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS_FOR_CUSTOM_RECIPES
+            | {
+                "additionalItems": COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS[
+                    "additionalItems"
+                ]
+            },
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.get_shopping_list()
+        assert await cookidoo.get_shopping_list_recipes(data) == data.recipes
+        assert await cookidoo.get_ingredient_items(data) == data.ingredient_items
+        assert await cookidoo.get_additional_items(data) == data.additional_items
+        assert len(mocked.requests) == 1
+
+    @pytest.mark.parametrize(
+        "exception",
+        [
+            TimeoutError,
+            ClientError,
+        ],
+    )
+    async def test_request_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo, exception: Exception
+    ) -> None:
+        """Test request exceptions."""
+
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            exception=exception,
+        )
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_shopping_list()
+
+    async def test_unauthorized(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test unauthorized exception."""
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            status=HTTPStatus.UNAUTHORIZED,
+            payload={"error_description": ""},
+        )
+        with pytest.raises(CookidooAuthException):
+            await cookidoo.get_shopping_list()
+
+    @pytest.mark.parametrize(
+        ("status", "exception"),
+        [
+            (HTTPStatus.OK, CookidooParseException),
+            (HTTPStatus.UNAUTHORIZED, CookidooAuthException),
+        ],
+    )
+    async def test_parse_exception(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        status: HTTPStatus,
+        exception: type[CookidooException],
+    ) -> None:
+        """Test parse exceptions."""
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
             status=status,
             body="not json",
             content_type="application/json",
         )
 
         with pytest.raises(exception):
-            await cookidoo.remove_custom_recipe("01K2CTJ9Y1BABRG5MXK44CFZS4")
+            await cookidoo.get_shopping_list()
+
+    async def test_missing_key(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test parse exception when a part of the shopping list is missing."""
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            payload={"recipes": [], "customerRecipes": []},
+            status=HTTPStatus.OK,
+        )
+
+        with pytest.raises(CookidooParseException):
+            await cookidoo.get_shopping_list()
 
 
 class TestGetShoppingListRecipes:
@@ -2468,6 +3233,102 @@ class TestGetManagedLists:
             await cookidoo.get_managed_collections()
 
 
+class TestIterManagedLists:
+    """Tests for iter_managed_collections method."""
+
+    @staticmethod
+    def _page(page: int, pages: int) -> dict[str, Any]:
+        """Build a page of managed collections with a collection per page."""
+        response: dict[str, Any] = COOKIDOO_TEST_RESPONSE_GET_MANAGED_COLLECTIONS
+        return {
+            **response,
+            "managedlists": [{**response["managedlists"][0], "id": f"col{page}"}],
+            "page": {"page": page, "totalPages": pages, "totalElements": pages},
+        }
+
+    async def test_iter_managed_lists(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the collections of all pages are yielded in order."""
+
+        async def _slow(url: URL, **kwargs: object) -> CallbackResult:
+            await asyncio.sleep(0.01)
+            return CallbackResult(payload=self._page(1, 4))
+
+        mocked.get(
+            "https://cookidoo.ch/organize/de-CH/api/managed-list?page=0",
+            payload=self._page(0, 4),
+        )
+        mocked.get(
+            "https://cookidoo.ch/organize/de-CH/api/managed-list?page=1",
+            callback=_slow,
+        )
+        for page in (2, 3):
+            mocked.get(
+                f"https://cookidoo.ch/organize/de-CH/api/managed-list?page={page}",
+                payload=self._page(page, 4),
+            )
+
+        data = [
+            collection.id
+            async for collection in cookidoo.iter_managed_collections(window=2)
+        ]
+
+        assert data == ["col0", "col1", "col2", "col3"]
+        assert (
+            _count_requests(
+                mocked, "https://cookidoo.ch/organize/de-CH/api/managed-list"
+            )
+            == 0
+        )
+
+    async def test_early_stop(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test no further pages are loaded once the consumer stops."""
+        for page in range(10):
+            mocked.get(
+                f"https://cookidoo.ch/organize/de-CH/api/managed-list?page={page}",
+                payload=self._page(page, 10),
+            )
+
+        async with aclosing(cookidoo.iter_managed_collections(window=2)) as data:
+            assert (await anext(data)).id == "col0"
+            assert (await anext(data)).id == "col1"
+
+        assert (
+            sum(
+                _count_requests(
+                    mocked,
+                    f"https://cookidoo.ch/organize/de-CH/api/managed-list?page={page}",
+                )
+                for page in range(10)
+            )
+            <= 4
+        )
+
+    async def test_parse_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a page failing to parse raises."""
+        mocked.get(
+            "https://cookidoo.ch/organize/de-CH/api/managed-list?page=0",
+            payload=self._page(0, 2),
+        )
+        mocked.get(
+            "https://cookidoo.ch/organize/de-CH/api/managed-list?page=1",
+            payload={"managedlists": []},
+        )
+
+        with pytest.raises(CookidooParseException):
+            async for _ in cookidoo.iter_managed_collections():
+                pass
+
+    async def test_invalid_window(self, cookidoo: Cookidoo) -> None:
+        """Test the prefetch window must be positive."""
+        with pytest.raises(CookidooConfigException):
+            async for _ in cookidoo.iter_managed_collections(window=0):
+                pass
+
+
 class TestAddManagedCollection:
     """Tests for add_managed_collection method."""
 
@@ -2763,6 +3624,89 @@ class TestGetCustomLists:
             await cookidoo.get_custom_collections()
 
 
+class TestIterCustomLists:
+    """Tests for iter_custom_collections method."""
+
+    @staticmethod
+    def _page(page: int, pages: int) -> dict[str, Any]:
+        """Build a page of custom collections with a collection per page."""
+        response: dict[str, Any] = COOKIDOO_TEST_RESPONSE_GET_CUSTOM_COLLECTIONS
+        return {
+            **response,
+            "customlists": [{**response["customlists"][0], "id": f"col{page}"}],
+            "page": {"page": page, "totalPages": pages, "totalElements": pages},
+        }
+
+    def _mock_pages(self, mocked: aioresponses, pages: int) -> None:
+        """Mock the pages of custom collections."""
+        for page in range(pages):
+            mocked.get(
+                f"https://cookidoo.ch/organize/de-CH/api/custom-list?page={page}",
+                payload=self._page(page, pages),
+            )
+
+    @staticmethod
+    def _count_pages(mocked: aioresponses, pages: int) -> int:
+        """Count the requests sent for pages of custom collections."""
+        return sum(
+            _count_requests(
+                mocked,
+                f"https://cookidoo.ch/organize/de-CH/api/custom-list?page={page}",
+            )
+            for page in range(pages)
+        )
+
+    async def test_iter_custom_lists(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the collections of all pages are yielded in order."""
+        self._mock_pages(mocked, 5)
+
+        data = [
+            collection.id
+            async for collection in cookidoo.iter_custom_collections(window=3)
+        ]
+
+        assert data == ["col0", "col1", "col2", "col3", "col4"]
+        assert self._count_pages(mocked, 5) == 5
+
+    async def test_single_page(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test a single page is loaded once."""
+        self._mock_pages(mocked, 1)
+
+        data = [
+            collection.id async for collection in cookidoo.iter_custom_collections()
+        ]
+
+        assert data == ["col0"]
+        assert self._count_pages(mocked, 1) == 1
+
+    async def test_backpressure(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test no more than the window is loaded ahead of the consumer."""
+        self._mock_pages(mocked, 10)
+
+        async with aclosing(cookidoo.iter_custom_collections(window=2)) as data:
+            assert (await anext(data)).id == "col0"
+            await asyncio.sleep(0.01)
+            assert self._count_pages(mocked, 10) == 3
+
+    async def test_early_stop(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test no further pages are loaded once the consumer stops."""
+        self._mock_pages(mocked, 10)
+
+        async with aclosing(cookidoo.iter_custom_collections(window=2)) as data:
+            assert (await anext(data)).id == "col0"
+        await asyncio.sleep(0.01)
+
+        assert self._count_pages(mocked, 10) <= 3
+
+    async def test_invalid_window(self, cookidoo: Cookidoo) -> None:
+        """Test the prefetch window must be positive."""
+        with pytest.raises(CookidooConfigException):
+            async for _ in cookidoo.iter_custom_collections(window=0):
+                pass
+
+
 class TestAddCustomCollection:
     """Tests for add_custom_collection method."""
 
@@ -3163,6 +4107,89 @@ class TestGetCalendarWeek:
             )
 
 
+class TestGetCalendarRange:
+    """Tests for get_calendar_range method."""
+
+    async def test_get_calendar_range(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the days of all weeks are merged in order and filled."""
+        mocked.get(
+            "https://cookidoo.ch/planning/de-CH/api/my-week/2025-02-24",
+            payload={"myDays": []},
+        )
+        mocked.get(
+            "https://cookidoo.ch/planning/de-CH/api/my-week/2025-03-03",
+            payload=COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK,
+        )
+        mocked.get(
+            "https://cookidoo.ch/planning/de-CH/api/my-week/2025-03-10",
+            payload={"myDays": []},
+        )
+
+        data = await cookidoo.get_calendar_range(
+            date(2025, 3, 1), date(2025, 3, 10), concurrency=2
+        )
+
+        assert [day.id for day in data] == [
+            f"2025-03-{day:02d}" for day in range(1, 11)
+        ]
+        assert data[3].recipes[0].id == "r214846"
+        assert data[4].recipes[0].id == "r338888"
+        assert all(not day.recipes for day in data[:3] + data[5:])
+
+    async def test_duplicate_days(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test days outside the range or repeated are dropped."""
+        mocked.get(
+            "https://cookidoo.ch/planning/de-CH/api/my-week/2025-03-03",
+            payload={
+                "myDays": COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK["myDays"]
+                + COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK["myDays"]
+            },
+        )
+
+        data = await cookidoo.get_calendar_range(date(2025, 3, 5), date(2025, 3, 5))
+
+        assert len(data) == 1
+        assert data[0].id == "2025-03-05"
+        assert data[0].recipes[0].id == "r338888"
+
+    async def test_concurrency(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test at most ``concurrency`` weeks are loaded at once."""
+        loading = 0
+        peak = 0
+
+        async def _load(url: URL, **kwargs: object) -> CallbackResult:
+            nonlocal loading, peak
+            loading += 1
+            peak = max(peak, loading)
+            await asyncio.sleep(0.01)
+            loading -= 1
+            return CallbackResult(payload={"myDays": []})
+
+        mocked.get(
+            re.compile(r"https://cookidoo\.ch/planning/de-CH/api/my-week/.*"),
+            callback=_load,
+            repeat=True,
+        )
+
+        data = await cookidoo.get_calendar_range(
+            date(2025, 1, 1), date(2025, 3, 31), concurrency=3
+        )
+
+        assert len(data) == 90
+        assert peak == 3
+
+    async def test_invalid_concurrency(self, cookidoo: Cookidoo) -> None:
+        """Test the concurrency must be positive."""
+        with pytest.raises(CookidooConfigException):
+            await cookidoo.get_calendar_range(
+                date(2025, 3, 1), date(2025, 3, 10), concurrency=0
+            )
+
+
 class TestAddRecipesToCalendar:
     """Tests for add_recipes_to_calendar method."""
 
@@ -3533,3 +4560,399 @@ class TestRemoveCustomRecipeFromCalendar:
                 datetime.fromisoformat("2025-08-11").date(),
                 "01K2CTJ9Y1BABRG5MXK44CFZS4",
             )
+
+
+class TestApplyCalendarPlan:
+    """Tests for apply_calendar_plan method."""
+
+    @staticmethod
+    def _day(
+        day: str, recipe_ids: list[str], custom_recipe_ids: list[str]
+    ) -> dict[str, Any]:
+        """Build a calendar day."""
+        return {
+            "id": day,
+            "title": day,
+            "dayKey": day,
+            "recipes": [
+                {"id": id, "title": id, "totalTime": 1800, "assets": None}
+                for id in recipe_ids
+            ],
+            "customerRecipeIds": custom_recipe_ids,
+        }
+
+    async def test_apply_calendar_plan(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the plan is applied with one addition request per day and source."""
+        mocked.get(
+            "https://cookidoo.ch/planning/de-CH/api/my-week/2025-03-03",
+            payload=COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK,
+        )
+        mocked.delete(
+            "https://cookidoo.ch/planning/de-CH/api/my-day/2025-03-05/recipes/r338888",
+            payload={"message": "Recipe removed!", "content": None},
+        )
+        mocked.put(
+            "https://cookidoo.ch/planning/de-CH/api/my-day",
+            payload={"content": self._day("2025-03-06", ["r1", "r2"], [])},
+        )
+        mocked.put(
+            "https://cookidoo.ch/planning/de-CH/api/my-day",
+            payload={"content": self._day("2025-03-06", ["r1", "r2"], ["c1"])},
+        )
+
+        data = await cookidoo.apply_calendar_plan(
+            {
+                date(2025, 3, 6): CookidooCalendarPlanDay(
+                    recipe_ids=["r1", "r2"], custom_recipe_ids=["c1"]
+                ),
+                date(2025, 3, 4): CookidooCalendarPlanDay(recipe_ids=["r214846"]),
+                date(2025, 3, 5): CookidooCalendarPlanDay(),
+            }
+        )
+
+        assert [day.id for day in data] == ["2025-03-04", "2025-03-05", "2025-03-06"]
+        assert [recipe.id for recipe in data[0].recipes] == ["r214846"]
+        assert data[1].recipes == []
+        assert [recipe.id for recipe in data[2].recipes] == ["r1", "r2"]
+        assert data[2].customer_recipe_ids == ["c1"]
+        assert [
+            json.loads(call.kwargs["data"])
+            for (method, _), calls in mocked.requests.items()
+            if method.upper() == "PUT"
+            for call in calls
+        ] == [
+            {"recipeIds": ["r1", "r2"], "dayKey": "2025-03-06"},
+            {
+                "recipeIds": ["c1"],
+                "dayKey": "2025-03-06",
+                "recipeSource": "CUSTOMER",
+            },
+        ]
+
+    async def test_remove_custom_recipes(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test custom recipes not in the plan are removed."""
+        mocked.get(
+            "https://cookidoo.ch/planning/de-CH/api/my-week/2025-08-11",
+            payload={"myDays": [self._day("2025-08-11", ["r1"], ["c1", "c2"])]},
+        )
+        for id in ("c1", "c2"):
+            mocked.delete(
+                f"https://cookidoo.ch/planning/de-CH/api/my-day/2025-08-11/recipes/{id}?recipeSource=CUSTOMER",
+                payload={"content": self._day("2025-08-11", ["r1"], [])},
+            )
+
+        data = await cookidoo.apply_calendar_plan(
+            {date(2025, 8, 11): CookidooCalendarPlanDay(recipe_ids=["r1"])}
+        )
+
+        assert [recipe.id for recipe in data[0].recipes] == ["r1"]
+        assert data[0].customer_recipe_ids == []
+        assert not any(method.upper() == "PUT" for method, _ in mocked.requests)
+
+    async def test_invalid_concurrency(self, cookidoo: Cookidoo) -> None:
+        """Test the concurrency must be positive."""
+        with pytest.raises(CookidooConfigException):
+            await cookidoo.apply_calendar_plan(
+                {date(2025, 3, 4): CookidooCalendarPlanDay()}, concurrency=0
+            )
+
+
+class TestSyncShoppingList:
+    """Tests for sync_shopping_list method."""
+
+    @staticmethod
+    def _recipe(id: str, items: dict[str, bool]) -> dict[str, Any]:
+        """Build a recipe on the shopping list."""
+        return {
+            "id": id,
+            "title": id,
+            "recipeIngredientGroups": [
+                {
+                    "id": item,
+                    "ingredientNotation": item,
+                    "isOwned": is_owned,
+                    "quantity": {"value": 1},
+                    "unitNotation": "g",
+                }
+                for item, is_owned in items.items()
+            ],
+            "descriptiveAssets": [],
+        }
+
+    @staticmethod
+    def _bodies(mocked: aioresponses, url: str) -> list[Any]:
+        """Get the bodies of the requests sent to a url."""
+        return [
+            json.loads(call.kwargs["data"])
+            for (_, request_url), calls in mocked.requests.items()
+            if request_url == URL(url)
+            for call in calls
+        ]
+
+    async def test_sync_shopping_list(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test each kind of change is sent as a single request."""
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            payload={
+                "recipes": [
+                    self._recipe("r1", {"i1": False, "i2": True}),
+                    self._recipe("r2", {"i3": False}),
+                ],
+                "customerRecipes": [self._recipe("c1", {"i4": False})],
+                "additionalItems": [
+                    {"id": "a1", "name": "Milch", "isOwned": False},
+                    {"id": "a2", "name": "Brot", "isOwned": True},
+                    {"id": "a3", "name": "Käse", "isOwned": False},
+                ],
+            },
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/recipes/remove",
+            payload={"message": "Recipes removed"},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/recipes/add",
+            payload={"data": [self._recipe("r3", {"i5": False})]},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/owned-ingredients/ownership/edit",
+            payload={"data": []},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/edit",
+            payload={"data": []},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/remove",
+            payload={"message": "Additional items removed"},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/ownership/edit",
+            payload={"data": []},
+        )
+
+        data = await cookidoo.sync_shopping_list(
+            CookidooShoppingListPlan(
+                recipe_ids=["r1", "r3"],
+                ingredient_items_ownership={"i1": True, "i2": True, "i3": True},
+                additional_items={"Milch": True, "Eier": False},
+            )
+        )
+
+        assert [recipe.id for recipe in data.recipes] == ["r1", "r3"]
+        assert [(item.id, item.is_owned) for item in data.ingredient_items] == [
+            ("i1", True),
+            ("i2", True),
+            ("i5", False),
+        ]
+        assert [
+            (item.id, item.name, item.is_owned) for item in data.additional_items
+        ] == [("a1", "Milch", True), ("a2", "Eier", False)]
+        assert self._bodies(
+            mocked, "https://cookidoo.ch/shopping/de-CH/recipes/remove"
+        ) == [{"recipeIDs": ["r2", "c1"]}]
+        assert self._bodies(
+            mocked, "https://cookidoo.ch/shopping/de-CH/recipes/add"
+        ) == [{"recipeIDs": ["r3"]}]
+        assert self._bodies(
+            mocked,
+            "https://cookidoo.ch/shopping/de-CH/owned-ingredients/ownership/edit",
+        ) == [{"ingredients": [{"id": "i1", "isOwned": True, "ownedTimestamp": ANY}]}]
+        assert self._bodies(
+            mocked, "https://cookidoo.ch/shopping/de-CH/additional-items/edit"
+        ) == [{"additionalItems": [{"id": "a2", "name": "Eier"}]}]
+        assert self._bodies(
+            mocked, "https://cookidoo.ch/shopping/de-CH/additional-items/remove"
+        ) == [{"additionalItemIDs": ["a3"]}]
+        assert self._bodies(
+            mocked,
+            "https://cookidoo.ch/shopping/de-CH/additional-items/ownership/edit",
+        ) == [
+            {
+                "additionalItems": [
+                    {"id": "a1", "isOwned": True, "ownedTimestamp": ANY},
+                    {"id": "a2", "isOwned": False, "ownedTimestamp": ANY},
+                ]
+            }
+        ]
+        assert _count_requests(mocked, "https://cookidoo.ch/shopping/de-CH") == 1
+
+    async def test_add_owned_additional_items(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test added additional items owned in the plan are marked as owned."""
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            payload={"recipes": [], "customerRecipes": [], "additionalItems": []},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/recipes/add",
+            payload={"data": [self._recipe("c1", {"i1": False})]},
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+        )
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/ownership/edit",
+            payload={"data": []},
+        )
+
+        data = await cookidoo.sync_shopping_list(
+            CookidooShoppingListPlan(
+                custom_recipe_ids=["c1"],
+                additional_items={"Fleisch": True, "Fisch": False},
+            )
+        )
+
+        assert [recipe.id for recipe in data.recipes] == ["c1"]
+        assert [(item.name, item.is_owned) for item in data.additional_items] == [
+            ("Fleisch", True),
+            ("Fisch", False),
+        ]
+        assert self._bodies(
+            mocked, "https://cookidoo.ch/shopping/de-CH/recipes/add"
+        ) == [{"recipeIDs": [{"id": "c1", "source": "CUSTOMER"}]}]
+        assert self._bodies(
+            mocked, "https://cookidoo.ch/shopping/de-CH/additional-items/add"
+        ) == [{"itemsValue": ["Fleisch", "Fisch"]}]
+        assert self._bodies(
+            mocked,
+            "https://cookidoo.ch/shopping/de-CH/additional-items/ownership/edit",
+        ) == [
+            {
+                "additionalItems": [
+                    {
+                        "id": "01JBQGDMRMR7RJW1C8AWDGD6YP",
+                        "isOwned": True,
+                        "ownedTimestamp": ANY,
+                    }
+                ]
+            }
+        ]
+
+    async def test_in_sync(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test nothing is sent when the shopping list matches the plan."""
+        mocked.get(
+            "https://cookidoo.ch/shopping/de-CH",
+            payload={
+                "recipes": [self._recipe("r1", {"i1": True})],
+                "customerRecipes": [],
+                "additionalItems": [{"id": "a1", "name": "Milch", "isOwned": False}],
+            },
+        )
+
+        data = await cookidoo.sync_shopping_list(
+            CookidooShoppingListPlan(
+                recipe_ids=["r1"],
+                ingredient_items_ownership={"i1": True},
+                additional_items={"Milch": False},
+            )
+        )
+
+        assert [recipe.id for recipe in data.recipes] == ["r1"]
+        assert len(mocked.requests) == 1
+
+
+class TestMicroBatching:
+    """Tests for the micro batching of additions to the shopping list."""
+
+    def test_invalid_config(self, session: ClientSession) -> None:
+        """Test the batch window and size must be valid."""
+        with pytest.raises(CookidooConfigException):
+            Cookidoo(session, batch_window=-1)
+        with pytest.raises(CookidooConfigException):
+            Cookidoo(session, batch_window=0.01, max_batch_size=0)
+
+    async def test_add_ingredient_items_for_recipes(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test calls are merged and the items split back by recipe id."""
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/recipes/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_INGREDIENTS_FOR_RECIPES,
+        )
+        cookidoo = Cookidoo(session, batch_window=0.01)
+
+        first, second = await asyncio.gather(
+            cookidoo.add_ingredient_items_for_recipes(["r59322"]),
+            cookidoo.add_ingredient_items_for_recipes(["r907016"]),
+        )
+
+        recipes: Any = COOKIDOO_TEST_RESPONSE_ADD_INGREDIENTS_FOR_RECIPES["data"]
+        assert [item.id for item in first] == [
+            item["id"] for item in recipes[0]["recipeIngredientGroups"]
+        ]
+        assert [item.id for item in second] == [
+            item["id"] for item in recipes[1]["recipeIngredientGroups"]
+        ]
+        assert [
+            json.loads(call.kwargs["data"])
+            for calls in mocked.requests.values()
+            for call in calls
+        ] == [{"recipeIDs": ["r59322", "r907016"]}]
+
+    async def test_add_additional_items(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test calls are merged and the items split back by position."""
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+        )
+        cookidoo = Cookidoo(session, batch_window=0.01)
+
+        first, second = await asyncio.gather(
+            cookidoo.add_additional_items(["Fleisch"]),
+            cookidoo.add_additional_items(["Fisch"]),
+        )
+
+        assert [item.name for item in first] == ["Fleisch"]
+        assert [item.name for item in second] == ["Fisch"]
+        assert [
+            json.loads(call.kwargs["data"])
+            for calls in mocked.requests.values()
+            for call in calls
+        ] == [{"itemsValue": ["Fleisch", "Fisch"]}]
+
+    async def test_add_additional_items_with_changed_names(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test items are split back when the server changes their names."""
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+        )
+        cookidoo = Cookidoo(session, batch_window=0.01)
+
+        first, second = await asyncio.gather(
+            cookidoo.add_additional_items([" Fleisch "]),
+            cookidoo.add_additional_items(["fisch"]),
+        )
+
+        assert [item.name for item in first] == ["Fleisch"]
+        assert [item.name for item in second] == ["Fisch"]
+
+    async def test_add_additional_items_missing(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test a response with a different number of items raises."""
+        mocked.post(
+            "https://cookidoo.ch/shopping/de-CH/additional-items/add",
+            payload={"data": COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS["data"][:1]},
+        )
+        cookidoo = Cookidoo(session, batch_window=0.01)
+
+        results = await asyncio.gather(
+            cookidoo.add_additional_items(["Fleisch"]),
+            cookidoo.add_additional_items(["Fisch"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, CookidooParseException) for result in results)
@@ -11,6 +11,7 @@ from cookidoo_api.helpers import (
     cookidoo_recipe_details_from_json,
     cookidoo_recipe_from_json,
     cookidoo_search_result_from_json,
+    cookidoo_shopping_list_from_json,
     get_country_options,
     get_language_options,
     get_localization_options,
@@ -24,11 +25,14 @@ from cookidoo_api.raw_types import (
     RecipeDetailsJSON,
     RecipeJSON,
     SearchResultJSON,
+    ShoppingListJSON,
 )
 from cookidoo_api.types import CookidooLocalizationConfig, ThermomixMachineType
 from tests.responses import (
     COOKIDOO_TEST_RESPONSE_CALENDAR_WEEK,
+    COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS,
     COOKIDOO_TEST_RESPONSE_GET_CUSTOM_RECIPE,
+    COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS_FOR_RECIPES,
     COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
     COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
     COOKIDOO_TEST_RESPONSE_LIST_CUSTOM_RECIPES,
@@ -97,6 +101,34 @@ class TestSearchRecipeNormalizeHelpers:
         assert normalize_tmv_param([ThermomixMachineType.TM5, "TM6"]) == "TM5,TM6"
 
 
+class TestShoppingList:
+    """Tests for the shopping list conversion."""
+
+    def test_cookidoo_shopping_list_from_json(self) -> None:
+        """Test cookidoo_shopping_list_from_json converts all parts at once."""
+        shopping_list_json = cast(
+            ShoppingListJSON,
+            COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS_FOR_RECIPES
+            | {
+                "additionalItems": COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS[
+                    "additionalItems"
+                ]
+            },
+        )
+        localization = CookidooLocalizationConfig(
+            country_code="ch", language="de-CH", url="https://cookidoo.ch"
+        )
+
+        result = cookidoo_shopping_list_from_json(shopping_list_json, localization)
+
+        assert [recipe.id for recipe in result.recipes] == ["r907016", "r59322"]
+        assert len(result.ingredient_items) == 14
+        assert [item.name for item in result.additional_items] == ["Fleisch", "Vogel"]
+        assert (
+            result.recipes[0].url == "https://cookidoo.ch/recipes/recipe/de-CH/r907016"
+        )
+
+
 class TestRecipeImagesAndUrls:
     """Tests for recipe image and URL extraction."""
 
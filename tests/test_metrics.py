@@ -0,0 +1,129 @@
+"""Unit tests for cookidoo-api."""
+
+from http import HTTPStatus
+import math
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooRequestException
+from cookidoo_api.metrics import (
+    CookidooHistogram,
+    CookidooHistogramSink,
+    CookidooMetricsSink,
+    CookidooRequestMetrics,
+)
+from cookidoo_api.retry import CookidooRetryPolicy
+from tests.responses import COOKIDOO_TEST_RESPONSE_USER_INFO
+
+USER_INFO_URL = "https://cookidoo.ch/community/profile"
+
+
+class TestCookidooHistogram:
+    """Tests for the histogram."""
+
+    def test_observe(self) -> None:
+        """Test values are counted in the bucket of their upper bound."""
+        histogram = CookidooHistogram((0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.total == pytest.approx(2.65)
+
+    def test_quantile(self) -> None:
+        """Test quantiles are estimated by the upper bound of their bucket."""
+        histogram = CookidooHistogram((0.1, 1.0))
+        assert math.isnan(histogram.quantile(0.5))
+
+        for value in [0.05] * 98 + [0.5, 5.0]:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == 1.0
+        assert histogram.quantile(1.0) == math.inf
+
+
+class TestCookidooMetrics:
+    """Tests for the metrics of the Cookidoo client."""
+
+    @pytest.fixture(name="sink")
+    def mock_sink(self) -> CookidooHistogramSink:
+        """Create an in-memory histogram sink."""
+        return CookidooHistogramSink()
+
+    @pytest.fixture(name="cookidoo")
+    def mock_cookidoo(
+        self, session: ClientSession, sink: CookidooHistogramSink
+    ) -> Cookidoo:
+        """Create a Cookidoo client reporting to the sink."""
+        return Cookidoo(session, metrics=sink)
+
+    async def test_request_and_conversion(
+        self, mocked: aioresponses, cookidoo: Cookidoo, sink: CookidooHistogramSink
+    ) -> None:
+        """Test the phases of a request and its conversion are recorded."""
+        mocked.get(USER_INFO_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+
+        operation = "loading user info"
+        assert sink.responses == {(operation, HTTPStatus.OK): 1}
+        assert sink.bytes_received[operation] > 0
+        for phase in ("wait", "connect", "transfer", "decode", "convert"):
+            assert sink.histogram(operation, phase).count == 1
+        assert sink.histogram(operation, "unknown").count == 0
+
+    async def test_retried_responses(
+        self, mocked: aioresponses, session: ClientSession, sink: CookidooHistogramSink
+    ) -> None:
+        """Test every response of a retried request is recorded."""
+        mocked.get(USER_INFO_URL, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        mocked.get(USER_INFO_URL, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        cookidoo = Cookidoo(
+            session,
+            retry_policy=CookidooRetryPolicy(max_attempts=2, backoff_base=0.0),
+            metrics=sink,
+        )
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+
+        assert sink.responses == {
+            ("loading user info", HTTPStatus.SERVICE_UNAVAILABLE): 2
+        }
+
+    async def test_custom_sink(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test a sink only overriding some methods receives the request."""
+        recorded: list[CookidooRequestMetrics] = []
+
+        class Sink(CookidooMetricsSink):
+            def record_request(self, metrics: CookidooRequestMetrics) -> None:
+                recorded.append(metrics)
+
+        mocked.get(USER_INFO_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await Cookidoo(session, metrics=Sink()).get_user_info()
+
+        assert [(m.operation, m.method, m.status) for m in recorded] == [
+            ("loading user info", "GET", HTTPStatus.OK)
+        ]
+
+    async def test_nothing_measured_without_sink(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test no timestamps are taken without a sink."""
+        mocked.get(USER_INFO_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+        cookidoo = Cookidoo(session)
+
+        with patch("cookidoo_api.cookidoo.time.perf_counter") as perf_counter:
+            await cookidoo.get_user_info()
+
+        perf_counter.assert_not_called()
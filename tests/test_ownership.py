@@ -0,0 +1,164 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+from http import HTTPStatus
+import json
+from typing import Any
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException, CookidooRequestException
+from cookidoo_api.ownership import CookidooOwnershipWriter
+from cookidoo_api.types import CookidooAdditionalItem, CookidooIngredientItem
+
+INGREDIENT_ITEMS_URL = (
+    "https://cookidoo.ch/shopping/de-CH/owned-ingredients/ownership/edit"
+)
+ADDITIONAL_ITEMS_URL = (
+    "https://cookidoo.ch/shopping/de-CH/additional-items/ownership/edit"
+)
+
+
+def _ingredient_item(id: str, is_owned: bool) -> CookidooIngredientItem:
+    """Build an ingredient item."""
+    return CookidooIngredientItem(
+        id=id, name=id, is_owned=is_owned, description="1 Würfel"
+    )
+
+
+def _bodies(mocked: aioresponses, url: str) -> list[Any]:
+    """Get the bodies of the requests sent to a url."""
+    return [
+        json.loads(call.kwargs["data"])
+        for (_, request_url), calls in mocked.requests.items()
+        if request_url == URL(url)
+        for call in calls
+    ]
+
+
+class TestOwnershipWriter:
+    """Tests for the ownership writer."""
+
+    @pytest.mark.parametrize(
+        ("delay", "max_batch_size"),
+        [
+            (-1, 50),
+            (0.5, 0),
+        ],
+    )
+    def test_invalid_config(
+        self, cookidoo: Cookidoo, delay: float, max_batch_size: int
+    ) -> None:
+        """Test the delay must not be negative and the batch size positive."""
+        with pytest.raises(CookidooConfigException):
+            CookidooOwnershipWriter(
+                cookidoo, delay=delay, max_batch_size=max_batch_size
+            )
+
+    async def test_batch(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test the changes are sent with a single request per endpoint."""
+        mocked.post(
+            INGREDIENT_ITEMS_URL,
+            payload={
+                "data": [
+                    {"id": "i1", "ingredientNotation": "i1", "isOwned": True},
+                    {"id": "i2", "ingredientNotation": "i2", "isOwned": False},
+                ]
+            },
+        )
+        mocked.post(
+            ADDITIONAL_ITEMS_URL,
+            payload={"data": [{"id": "a1", "name": "Milch", "isOwned": True}]},
+        )
+        writer = CookidooOwnershipWriter(cookidoo, delay=0.01)
+
+        results = await asyncio.gather(
+            writer.edit_ingredient_item_ownership(_ingredient_item("i1", True)),
+            writer.edit_ingredient_item_ownership(_ingredient_item("i2", False)),
+            writer.edit_additional_item_ownership(
+                CookidooAdditionalItem(id="a1", name="Milch", is_owned=True)
+            ),
+        )
+
+        assert [(item.id, item.is_owned) for item in results] == [
+            ("i1", True),
+            ("i2", False),
+            ("a1", True),
+        ]
+        assert [
+            [item["id"] for item in body["ingredients"]]
+            for body in _bodies(mocked, INGREDIENT_ITEMS_URL)
+        ] == [["i1", "i2"]]
+        assert [
+            [item["id"] for item in body["additionalItems"]]
+            for body in _bodies(mocked, ADDITIONAL_ITEMS_URL)
+        ] == [["a1"]]
+
+    async def test_fold_toggles(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test repeated changes of an item are folded into its latest state."""
+        mocked.post(
+            INGREDIENT_ITEMS_URL,
+            payload={
+                "data": [{"id": "i1", "ingredientNotation": "i1", "isOwned": False}]
+            },
+        )
+        writer = CookidooOwnershipWriter(cookidoo, delay=0.01)
+
+        results = await asyncio.gather(
+            writer.edit_ingredient_item_ownership(_ingredient_item("i1", True)),
+            writer.edit_ingredient_item_ownership(_ingredient_item("i1", False)),
+        )
+
+        assert [item.is_owned for item in results] == [False, False]
+        assert [
+            [(item["id"], item["isOwned"]) for item in body["ingredients"]]
+            for body in _bodies(mocked, INGREDIENT_ITEMS_URL)
+        ] == [[("i1", False)]]
+
+    async def test_max_batch_size(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the changes are split into batches sent one after another."""
+        mocked.post(INGREDIENT_ITEMS_URL, payload={"data": []}, repeat=True)
+        writer = CookidooOwnershipWriter(cookidoo, delay=60, max_batch_size=2)
+
+        futures = [
+            writer.edit_ingredient_item_ownership(_ingredient_item(id, True))
+            for id in ("i1", "i2", "i3")
+        ]
+        await writer.flush()
+
+        assert all(future.done() for future in futures)
+        assert [
+            [item["id"] for item in body["ingredients"]]
+            for body in _bodies(mocked, INGREDIENT_ITEMS_URL)
+        ] == [["i1", "i2"], ["i3"]]
+
+    async def test_flush(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test flushing sends the changes without waiting for the delay."""
+        mocked.post(INGREDIENT_ITEMS_URL, payload={"data": []})
+        writer = CookidooOwnershipWriter(cookidoo, delay=60)
+
+        future = writer.edit_ingredient_item_ownership(_ingredient_item("i1", True))
+        await writer.flush()
+
+        assert future.result() == _ingredient_item("i1", True)
+        assert len(_bodies(mocked, INGREDIENT_ITEMS_URL)) == 1
+
+    async def test_request_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the futures of a failed batch raise its exception."""
+        mocked.post(INGREDIENT_ITEMS_URL, status=HTTPStatus.INTERNAL_SERVER_ERROR)
+        writer = CookidooOwnershipWriter(cookidoo, delay=0.01)
+
+        results = await asyncio.gather(
+            writer.edit_ingredient_item_ownership(_ingredient_item("i1", True)),
+            writer.edit_ingredient_item_ownership(_ingredient_item("i2", True)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, CookidooRequestException) for result in results)
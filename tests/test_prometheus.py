@@ -0,0 +1,170 @@
+"""Unit tests for cookidoo-api."""
+
+from http import HTTPStatus
+import re
+
+from aiohttp import ClientSession
+from aiohttp.test_utils import make_mocked_request
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.cache import CookidooResultCache
+from cookidoo_api.const import PROMETHEUS_CONTENT_TYPE
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooAuthException
+from cookidoo_api.prometheus import CookidooPrometheusExporter
+from cookidoo_api.retry import CookidooRetryPolicy
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+    COOKIDOO_TEST_RESPONSE_USER_INFO,
+)
+
+USER_INFO_URL = "https://cookidoo.ch/community/profile"
+RECIPE_DETAILS_URL = "https://cookidoo.ch/recipes/recipe/de-CH/r907015"
+LOGIN_PAGE_URL = re.compile(r"https://cookidoo\.ch/profile/de-CH/login.*")
+
+
+@pytest.fixture(name="exporter")
+def mock_exporter() -> CookidooPrometheusExporter:
+    """Create a Prometheus exporter with two histogram buckets."""
+    return CookidooPrometheusExporter((0.1, 1.0))
+
+
+class TestCookidooPrometheusExporter:
+    """Tests for the Prometheus exporter."""
+
+    def test_render_histogram(self, exporter: CookidooPrometheusExporter) -> None:
+        """Test histograms are rendered with cumulative buckets."""
+        exporter.record_conversion("search recipes", 0.05)
+        exporter.record_conversion("search recipes", 0.5)
+        exporter.record_conversion("search recipes", 5.0)
+
+        lines = exporter.render().splitlines()
+
+        labels = 'operation="search recipes",phase="convert"'
+        assert f'cookidoo_phase_duration_seconds_bucket{{{labels},le="0.1"}} 1' in (
+            lines
+        )
+        assert f'cookidoo_phase_duration_seconds_bucket{{{labels},le="1.0"}} 2' in (
+            lines
+        )
+        assert f'cookidoo_phase_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in (
+            lines
+        )
+        assert f"cookidoo_phase_duration_seconds_sum{{{labels}}} 5.55" in lines
+        assert f"cookidoo_phase_duration_seconds_count{{{labels}}} 3" in lines
+        assert "# TYPE cookidoo_phase_duration_seconds histogram" in lines
+
+    def test_render_escapes_labels(self, exporter: CookidooPrometheusExporter) -> None:
+        """Test quotes, backslashes and newlines in label values are escaped."""
+        exporter.record_retry('say "hi"\\\n')
+
+        assert 'cookidoo_retries_total{operation="say \\"hi\\"\\\\\\n"} 1' in (
+            exporter.render().splitlines()
+        )
+
+    def test_namespace(self) -> None:
+        """Test the metric names use the namespace as prefix."""
+        exporter = CookidooPrometheusExporter(namespace="kitchen")
+        exporter.record_login(True)
+
+        assert 'kitchen_logins_total{result="success"} 1' in exporter.render()
+
+    async def test_client_traffic(
+        self,
+        mocked: aioresponses,
+        session: ClientSession,
+        exporter: CookidooPrometheusExporter,
+    ) -> None:
+        """Test responses, retries and cache lookups of a client are exported."""
+        mocked.get(USER_INFO_URL, status=HTTPStatus.TOO_MANY_REQUESTS)
+        mocked.get(USER_INFO_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+        mocked.get(
+            RECIPE_DETAILS_URL, payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+        cookidoo = Cookidoo(
+            session,
+            retry_policy=CookidooRetryPolicy(backoff_base=0.0),
+            result_cache=CookidooResultCache(),
+            metrics=exporter,
+        )
+
+        await cookidoo.get_user_info()
+        await cookidoo.get_recipe_details("r907015")
+        await cookidoo.get_recipe_details("r907015")
+
+        lines = exporter.render().splitlines()
+        assert (
+            'cookidoo_responses_total{operation="loading user info",status="429"} 1'
+            in lines
+        )
+        assert (
+            'cookidoo_responses_total{operation="loading user info",status="200"} 1'
+            in lines
+        )
+        assert 'cookidoo_retries_total{operation="loading user info"} 1' in lines
+        for result in ("hit", "miss"):
+            assert (
+                "cookidoo_cache_lookups_total"
+                f'{{cache="result",method="get_recipe_details",result="{result}"}} 1'
+            ) in lines
+
+    async def test_logins(
+        self,
+        mocked: aioresponses,
+        session: ClientSession,
+        exporter: CookidooPrometheusExporter,
+    ) -> None:
+        """Test failed logins are counted."""
+        mocked.get(LOGIN_PAGE_URL, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        cookidoo = Cookidoo(session, metrics=exporter)
+
+        with pytest.raises(CookidooAuthException):
+            await cookidoo.login()
+
+        assert 'cookidoo_logins_total{result="failure"} 1' in exporter.render()
+
+    def test_in_flight_gauges(
+        self, session: ClientSession, exporter: CookidooPrometheusExporter
+    ) -> None:
+        """Test the gauges sum the requests of the tracked clients."""
+        first = Cookidoo(session, metrics=exporter)
+        second = Cookidoo(session, metrics=exporter)
+        first._in_flight_requests = 2
+        second._in_flight_requests = 1
+        second._queued_requests = 4
+
+        exporter.track(first)
+        exporter.track(second)
+        exporter.track(second)
+        lines = exporter.render().splitlines()
+        assert "cookidoo_requests_in_flight 3" in lines
+        assert "cookidoo_requests_queued 4" in lines
+
+        exporter.untrack(second)
+        assert "cookidoo_requests_in_flight 2" in exporter.render().splitlines()
+
+    async def test_handle(self, exporter: CookidooPrometheusExporter) -> None:
+        """Test the aiohttp handler serves the rendered metrics."""
+        exporter.record_login(False)
+
+        response = await exporter.handle(make_mocked_request("GET", "/metrics"))
+
+        assert response.headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+        assert response.body == exporter.render().encode()
+
+    async def test_start_and_stop(self, exporter: CookidooPrometheusExporter) -> None:
+        """Test the local server serves the metrics until stopped."""
+        await exporter.start(port=0)
+        try:
+            port = exporter.port
+            assert port
+            async with (
+                ClientSession() as session,
+                session.get(f"http://127.0.0.1:{port}/metrics") as response,
+            ):
+                assert response.status == HTTPStatus.OK
+                assert "cookidoo_requests_in_flight 0" in await response.text()
+        finally:
+            await exporter.stop()
+        assert exporter.port is None
@@ -0,0 +1,109 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+from http import HTTPStatus
+import re
+import time
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.ratelimit import CookidooRateLimiter
+from tests.responses import (
+    COOKIDOO_TEST_LOGIN_PAGE_HTML,
+    COOKIDOO_TEST_RESPONSE_USER_INFO,
+)
+
+
+class TestRateLimiter:
+    """Tests for the rate limiter."""
+
+    def test_invalid_config(self) -> None:
+        """Test the rate and burst must be positive."""
+        with pytest.raises(CookidooConfigException):
+            CookidooRateLimiter(rate=0)
+        with pytest.raises(CookidooConfigException):
+            CookidooRateLimiter(rate=1, burst=0)
+
+    async def test_burst_then_rate(self) -> None:
+        """Test a burst passes at once and further requests are paced."""
+        limiter = CookidooRateLimiter(rate=50, burst=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            assert await limiter.acquire("cookidoo.ch") < 0.01
+        assert time.monotonic() - start < 0.01
+
+        assert await limiter.acquire("cookidoo.ch") >= 0.015
+
+    async def test_hosts_are_independent(self) -> None:
+        """Test each host has its own bucket."""
+        limiter = CookidooRateLimiter(rate=1, burst=1)
+
+        await limiter.acquire("cookidoo.ch")
+        assert await limiter.acquire("cookidoo.de") < 0.01
+
+    async def test_waiters_are_served_in_order(self) -> None:
+        """Test queued requests are allowed in arrival order."""
+        limiter = CookidooRateLimiter(rate=200, burst=1)
+        order: list[int] = []
+
+        async def _request(index: int) -> None:
+            await limiter.acquire("cookidoo.ch")
+            order.append(index)
+
+        await asyncio.gather(*(_request(index) for index in range(5)))
+
+        assert order == list(range(5))
+
+
+class TestCookidooRateLimiter:
+    """Tests for the rate limiting of the Cookidoo client."""
+
+    async def test_shared_between_clients(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test clients sharing a rate limiter are paced together."""
+        limiter = CookidooRateLimiter(rate=20, burst=1)
+        first = Cookidoo(session, rate_limiter=limiter)
+        second = Cookidoo(session, rate_limiter=limiter)
+        mocked.get(
+            "https://cookidoo.ch/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+
+        start = time.monotonic()
+        await asyncio.gather(first.get_user_info(), second.get_user_info())
+
+        assert time.monotonic() - start >= 0.04
+
+    async def test_login_is_paced(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test the login requests are paced per host."""
+        limiter = CookidooRateLimiter(rate=1000, burst=1)
+        cookidoo = Cookidoo(session, rate_limiter=limiter)
+        mocked.get(
+            re.compile(r"https://cookidoo\.ch/profile/de-CH/login.*"),
+            status=HTTPStatus.OK,
+            body=COOKIDOO_TEST_LOGIN_PAGE_HTML,
+        )
+        mocked.post(
+            "https://ciam.prod.cookidoo.vorwerk-digital.com/login-srv/login",
+            status=HTTPStatus.OK,
+        )
+        session.cookie_jar.update_cookies(
+            {"_oauth2_proxy": "test-proxy-value", "v-authenticated": "test-auth-value"}
+        )
+
+        await cookidoo.login()
+
+        assert set(limiter._buckets) == {
+            "cookidoo.ch",
+            "ciam.prod.cookidoo.vorwerk-digital.com",
+        }
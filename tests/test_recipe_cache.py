@@ -0,0 +1,223 @@
+"""Unit tests for cookidoo-api."""
+
+from collections.abc import AsyncGenerator
+import json
+from pathlib import Path
+import sqlite3
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.recipe_cache import CookidooRecipeCache
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ADD_RECIPES_TO_CUSTOM_COLLECTION,
+    COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+)
+
+RECIPE_DETAILS_URL = "https://cookidoo.ch/recipes/recipe/de-CH/r907015"
+CUSTOM_COLLECTION_URL = "https://cookidoo.ch/organize/de-CH/api/custom-list/123"
+
+
+@pytest.fixture(name="cache")
+async def mock_cache(tmp_path: Path) -> AsyncGenerator[CookidooRecipeCache]:
+    """Create a recipe cache in a temporary directory."""
+    cache = CookidooRecipeCache(tmp_path / "recipes.db")
+    yield cache
+    cache.close()
+
+
+class TestCookidooRecipeCache:
+    """Tests for the persistent recipe cache."""
+
+    async def test_put_and_get(self, cache: CookidooRecipeCache) -> None:
+        """Test stored recipe details are read per language and id."""
+        await cache.put("de-CH", "r1", b'{"id": "r1"}')
+
+        assert await cache.get("de-CH", "r1") == b'{"id": "r1"}'
+        assert await cache.get("en-GB", "r1") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_survives_reopening(self, tmp_path: Path) -> None:
+        """Test stored recipe details survive reopening the file."""
+        cache = CookidooRecipeCache(tmp_path / "recipes.db")
+        await cache.put("de-CH", "r1", b"{}")
+        cache.close()
+
+        cache = CookidooRecipeCache(tmp_path / "recipes.db")
+        assert await cache.get("de-CH", "r1") == b"{}"
+        cache.close()
+
+    async def test_wal_mode(self, tmp_path: Path, cache: CookidooRecipeCache) -> None:
+        """Test the database uses write-ahead logging."""
+        with sqlite3.connect(tmp_path / "recipes.db") as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    async def test_ttl(self, tmp_path: Path) -> None:
+        """Test expired recipe details are not read."""
+        cache = CookidooRecipeCache(tmp_path / "recipes.db", ttl=10)
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=1000):
+            await cache.put("de-CH", "r1", b"{}")
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=1005):
+            assert await cache.get("de-CH", "r1") == b"{}"
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=1011):
+            assert await cache.get("de-CH", "r1") is None
+        cache.close()
+
+    async def test_size_eviction(self, tmp_path: Path) -> None:
+        """Test the least recently used recipes are dropped beyond the size."""
+        cache = CookidooRecipeCache(tmp_path / "recipes.db", max_bytes=25)
+        for now, id in enumerate(("r1", "r2")):
+            with patch("cookidoo_api.recipe_cache.time.time", return_value=now):
+                await cache.put("de-CH", id, b"0123456789")
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=2):
+            await cache.get("de-CH", "r1")
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=3):
+            await cache.put("de-CH", "r3", b"0123456789")
+
+            assert await cache.get("de-CH", "r2") is None
+            assert await cache.get("de-CH", "r1") is not None
+            assert await cache.get("de-CH", "r3") is not None
+        cache.close()
+
+    async def test_invalidate(self, cache: CookidooRecipeCache) -> None:
+        """Test dropping single recipes or all recipes of a language."""
+        for language in ("de-CH", "en-GB"):
+            for id in ("r1", "r2"):
+                await cache.put(language, id, b"{}")
+
+        await cache.invalidate("de-CH", "r1")
+        assert await cache.get("de-CH", "r1") is None
+        assert await cache.get("de-CH", "r2") is not None
+
+        await cache.invalidate("de-CH")
+        assert await cache.get("de-CH", "r2") is None
+        assert await cache.get("en-GB", "r2") is not None
+
+    async def test_invalidate_collection(self, cache: CookidooRecipeCache) -> None:
+        """Test dropping the recipes listing a collection."""
+        await cache.put("de-CH", "r1", b'{"inCollections": [{"id": "col1"}]}')
+        await cache.put("de-CH", "r2", b'{"inCollections": [{"id": "col10"}]}')
+
+        await cache.invalidate_collection("de-CH", "col1")
+
+        assert await cache.get("de-CH", "r1") is None
+        assert await cache.get("de-CH", "r2") is not None
+
+    async def test_reads_do_not_write(
+        self, tmp_path: Path, cache: CookidooRecipeCache
+    ) -> None:
+        """Test the access times of reads are written with the next write."""
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=1):
+            await cache.put("de-CH", "r1", b"{}")
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=2):
+            await cache.get("de-CH", "r1")
+
+        query = "SELECT accessed_at FROM recipe_details WHERE id = 'r1'"
+        with sqlite3.connect(tmp_path / "recipes.db") as connection:
+            assert connection.execute(query).fetchone() == (1,)
+        with patch("cookidoo_api.recipe_cache.time.time", return_value=3):
+            await cache.put("de-CH", "r2", b"{}")
+        with sqlite3.connect(tmp_path / "recipes.db") as connection:
+            assert connection.execute(query).fetchone() == (2,)
+
+    async def test_total_size(self, tmp_path: Path, cache: CookidooRecipeCache) -> None:
+        """Test the total size is kept up to date by every write."""
+        await cache.put("de-CH", "r1", b"0123456789")
+        await cache.put("de-CH", "r2", b"01234")
+        await cache.put("de-CH", "r1", b"012")
+        await cache.invalidate("de-CH", "r2")
+
+        with sqlite3.connect(tmp_path / "recipes.db") as connection:
+            assert connection.execute(
+                "SELECT total FROM recipe_details_size"
+            ).fetchone() == (3,)
+
+    def test_cannot_open(self, tmp_path: Path) -> None:
+        """Test an unusable path is rejected."""
+        with pytest.raises(CookidooConfigException):
+            CookidooRecipeCache(tmp_path)
+
+
+class TestCookidooRecipeCaching:
+    """Tests for the persistent recipe caching of the Cookidoo client."""
+
+    @pytest.fixture(name="cookidoo")
+    def mock_cookidoo(
+        self, session: ClientSession, cache: CookidooRecipeCache
+    ) -> Cookidoo:
+        """Create a Cookidoo client with a recipe cache."""
+        return Cookidoo(session, recipe_cache=cache)
+
+    async def test_cold_start_without_network(
+        self, mocked: aioresponses, session: ClientSession, cache: CookidooRecipeCache
+    ) -> None:
+        """Test a new client reads stored recipe details without a request."""
+        mocked.get(
+            RECIPE_DETAILS_URL, payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+        first = await Cookidoo(session, recipe_cache=cache).get_recipe_details(
+            "r907015"
+        )
+
+        second = await Cookidoo(session, recipe_cache=cache).get_recipe_details(
+            "r907015"
+        )
+
+        assert second == first
+        assert len(mocked.requests[next(iter(mocked.requests))]) == 1
+
+    async def test_unparsable_entry_is_reloaded(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooRecipeCache
+    ) -> None:
+        """Test stored recipe details which cannot be parsed are loaded again."""
+        await cache.put("de-CH", "r907015", json.dumps({"recipe": {}}).encode())
+        mocked.get(
+            RECIPE_DETAILS_URL, payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+
+        details = await cookidoo.get_recipe_details("r907015")
+
+        assert details.id == "r907015"
+        assert json.loads(await cache.get("de-CH", "r907015") or b"") == (
+            COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+
+    async def test_collection_change_invalidates(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooRecipeCache
+    ) -> None:
+        """Test changing a collection drops the stored recipe details."""
+        mocked.get(
+            RECIPE_DETAILS_URL, payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+        mocked.put(
+            CUSTOM_COLLECTION_URL,
+            payload=COOKIDOO_TEST_RESPONSE_ADD_RECIPES_TO_CUSTOM_COLLECTION,
+        )
+
+        await cookidoo.get_recipe_details("r907015")
+        await cookidoo.add_recipes_to_custom_collection("123", ["r907015"])
+
+        assert await cache.get("de-CH", "r907015") is None
+
+    async def test_collection_change_keeps_other_recipes(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooRecipeCache
+    ) -> None:
+        """Test changing a collection keeps the recipes not affected by it."""
+        await cache.put("de-CH", "r1", b'{"inCollections": []}')
+        mocked.get(
+            RECIPE_DETAILS_URL, payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+        mocked.delete(
+            "https://cookidoo.ch/organize/de-CH/api/managed-list/col500561",
+            status=204,
+        )
+
+        await cookidoo.get_recipe_details("r907015")
+        await cookidoo.remove_managed_collection("col500561")
+
+        assert await cache.get("de-CH", "r907015") is None
+        assert await cache.get("de-CH", "r1") is not None
@@ -0,0 +1,174 @@
+"""Unit tests for cookidoo-api."""
+
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooRequestException
+from cookidoo_api.retry import CookidooRetryPolicy, parse_retry_after
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+    COOKIDOO_TEST_RESPONSE_USER_INFO,
+)
+
+USER_INFO_URL = "https://cookidoo.ch/community/profile"
+ADD_ADDITIONAL_ITEMS_URL = "https://cookidoo.ch/shopping/de-CH/additional-items/add"
+
+
+class TestRetryPolicy:
+    """Tests for the retry policy."""
+
+    def test_backoff_is_capped_full_jitter(self) -> None:
+        """Test the backoff stays between zero and the capped exponential."""
+        policy = CookidooRetryPolicy(backoff_base=1.0, backoff_cap=3.0)
+
+        with patch("cookidoo_api.retry.random.uniform", side_effect=max) as uniform:
+            assert policy.backoff(1) == 1.0
+            assert policy.backoff(2) == 2.0
+            assert policy.backoff(5) == 3.0
+        assert uniform.call_args.args == (0, 3.0)
+
+    def test_delay_prefers_retry_after(self) -> None:
+        """Test the Retry-After header takes precedence over the backoff."""
+        policy = CookidooRetryPolicy(max_retry_after=10.0)
+
+        assert policy.delay(1, "7") == 7.0
+        assert policy.delay(1, "11") is None
+        assert 0 <= (policy.delay(1, "soon") or 0) <= policy.backoff_base
+
+    def test_allows(self) -> None:
+        """Test only the configured methods are retried."""
+        assert CookidooRetryPolicy().allows("get")
+        assert not CookidooRetryPolicy().allows("post")
+        assert CookidooRetryPolicy(retry_methods=frozenset({"POST"})).allows("post")
+        assert not CookidooRetryPolicy(max_attempts=1).allows("get")
+
+    def test_parse_retry_after_http_date(self) -> None:
+        """Test parsing a Retry-After header given as an HTTP date."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay is not None
+        assert 28 <= delay <= 30
+        assert parse_retry_after("invalid") is None
+
+
+class TestCookidooRetry:
+    """Tests for the retries of the Cookidoo client."""
+
+    @pytest.fixture(name="sleep")
+    def mock_sleep(self) -> Generator[AsyncMock]:
+        """Mock the sleep between attempts."""
+        with patch("cookidoo_api.cookidoo.asyncio.sleep") as sleep:
+            yield sleep
+
+    @pytest.mark.parametrize(
+        "status",
+        [HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE],
+    )
+    async def test_get_is_retried(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        sleep: AsyncMock,
+        status: HTTPStatus,
+    ) -> None:
+        """Test throttled and failing GET requests are retried."""
+        mocked.get(USER_INFO_URL, status=status, headers={"Retry-After": "2"})
+        mocked.get(
+            USER_INFO_URL,
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+        )
+
+        user_info = await cookidoo.get_user_info()
+
+        assert user_info.username
+        sleep.assert_awaited_once_with(2.0)
+
+    async def test_timeout_is_retried(
+        self, mocked: aioresponses, cookidoo: Cookidoo, sleep: AsyncMock
+    ) -> None:
+        """Test timed out GET requests are retried."""
+        mocked.get(USER_INFO_URL, exception=TimeoutError())
+        mocked.get(
+            USER_INFO_URL,
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+        )
+
+        assert await cookidoo.get_user_info()
+        assert sleep.await_count == 1
+
+    async def test_attempts_exhausted(
+        self, mocked: aioresponses, cookidoo: Cookidoo, sleep: AsyncMock
+    ) -> None:
+        """Test the last failure is raised once all attempts are used."""
+        mocked.get(USER_INFO_URL, status=HTTPStatus.BAD_GATEWAY, repeat=True)
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+        assert sleep.await_count == 2
+
+    async def test_retry_after_too_long(
+        self, mocked: aioresponses, cookidoo: Cookidoo, sleep: AsyncMock
+    ) -> None:
+        """Test a Retry-After beyond the allowed maximum is not waited for."""
+        mocked.get(
+            USER_INFO_URL,
+            status=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": "3600"},
+        )
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+        sleep.assert_not_awaited()
+
+    async def test_mutation_not_retried_by_default(
+        self, mocked: aioresponses, cookidoo: Cookidoo, sleep: AsyncMock
+    ) -> None:
+        """Test mutations are not retried without opting in."""
+        mocked.post(ADD_ADDITIONAL_ITEMS_URL, status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.add_additional_items(["Fleisch"])
+        sleep.assert_not_awaited()
+
+    async def test_mutation_retried_when_opted_in(
+        self, mocked: aioresponses, session: ClientSession, sleep: AsyncMock
+    ) -> None:
+        """Test mutations are retried when the policy opts in."""
+        cookidoo = Cookidoo(
+            session,
+            retry_policy=CookidooRetryPolicy(retry_methods=frozenset({"GET", "POST"})),
+        )
+        mocked.post(ADD_ADDITIONAL_ITEMS_URL, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        mocked.post(
+            ADD_ADDITIONAL_ITEMS_URL,
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.add_additional_items(["Fleisch", "Fisch"])
+
+        assert len(data) == 2
+        assert sleep.await_count == 1
+
+    async def test_retries_disabled(
+        self, mocked: aioresponses, session: ClientSession, sleep: AsyncMock
+    ) -> None:
+        """Test no retries happen without a retry policy."""
+        cookidoo = Cookidoo(session, retry_policy=None)
+        mocked.get(USER_INFO_URL, status=HTTPStatus.TOO_MANY_REQUESTS)
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+        sleep.assert_not_awaited()
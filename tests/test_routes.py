@@ -0,0 +1,72 @@
+"""Unit tests for cookidoo-api."""
+
+from aiohttp import ClientSession
+from yarl import URL
+
+from cookidoo_api.const import (
+    MANAGED_COLLECTIONS_PATH,
+    RECIPE_PATH,
+    REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH,
+    SHOPPING_LIST_PATH,
+)
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.helpers import _construct_recipe_url
+from cookidoo_api.routes import CookidooRoutes
+from cookidoo_api.types import CookidooConfig, CookidooLocalizationConfig
+
+UK_LOCALIZATION = CookidooLocalizationConfig(
+    country_code="gb",
+    language="en-GB",
+    url="https://cookidoo.co.uk/foundation/en-GB",
+)
+
+
+class TestCookidooRoutes:
+    """Tests for the route table."""
+
+    def test_static_urls_are_prebuilt(self) -> None:
+        """Test urls without request fields are built once."""
+        routes = CookidooRoutes(CookidooLocalizationConfig())
+
+        assert routes.api_endpoint == URL("https://cookidoo.ch")
+        assert routes.url(SHOPPING_LIST_PATH) == URL(
+            "https://cookidoo.ch/shopping/de-CH"
+        )
+        assert routes.url(MANAGED_COLLECTIONS_PATH) is routes.url(
+            MANAGED_COLLECTIONS_PATH
+        )
+
+    def test_urls_with_fields(self) -> None:
+        """Test the request fields are filled into the localized paths."""
+        routes = CookidooRoutes(UK_LOCALIZATION)
+
+        assert routes.url(RECIPE_PATH, id="r907015") == URL(
+            "https://cookidoo.co.uk/recipes/recipe/en-GB/r907015"
+        )
+        assert routes.url(
+            REMOVE_RECIPE_FROM_CUSTOM_COLLECTION_PATH, id="123", recipe="r1"
+        ) == URL("https://cookidoo.co.uk/organize/en-GB/api/custom-list/123/recipes/r1")
+
+    def test_client_rebuilds_on_localization_change(
+        self, session: ClientSession
+    ) -> None:
+        """Test the client follows a changed localization."""
+        cfg = CookidooConfig()
+        cookidoo = Cookidoo(session, cfg)
+        assert cookidoo.api_endpoint == URL("https://cookidoo.ch")
+
+        cfg.localization = UK_LOCALIZATION
+
+        assert cookidoo.api_endpoint == URL("https://cookidoo.co.uk")
+
+    def test_recipe_url(self) -> None:
+        """Test recipe urls are built from the cached localization prefix."""
+        assert (
+            _construct_recipe_url(UK_LOCALIZATION, "r1")
+            == "https://cookidoo.co.uk/recipes/recipe/en-GB/r1"
+        )
+        assert (
+            _construct_recipe_url(UK_LOCALIZATION, "c1", "created-recipes")
+            == "https://cookidoo.co.uk/created-recipes/en-GB/c1"
+        )
+        assert _construct_recipe_url(None, "r1") == ""